@@ -0,0 +1,5 @@
+"""
+성능 벤치마크 (패키지에 포함되지 않음)
+
+실행: python -m benchmarks.run
+"""
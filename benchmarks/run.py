@@ -0,0 +1,703 @@
+"""
+벤치마크 실행
+
+가상 워크북으로 파싱(CourseDataParser.parse), 데이터 검사(validator.check_sheet),
+생성(ContentGenerator.generate), CLI 전체 경로(--all-sheets)의 시간과 최대 메모리를 재고,
+저장된 기준값(baseline.json)과 비교한다.
+파싱과 CLI는 기본(pandas) 엔진과 native 엔진(xlsx 직접 읽기)을 각각 측정한다.
+
+사용 예시:
+  python -m benchmarks.run                       # 기준값과 비교 (느려지면 종료 코드 1)
+  python -m benchmarks.run --scenario large      # 특정 시나리오만
+  python -m benchmarks.run --scenario startup    # CLI 시작 시간만
+  python -m benchmarks.run --scenario server     # 시트별 CLI 실행 vs 생성 서버 작업
+  python -m benchmarks.run --scenario manifest   # 워크북별 CLI 실행 vs 작업 매니페스트 하나
+  python -m benchmarks.run --scenario links      # 링크 검사 (로컬 스텁 HTTP 서버)
+  python -m benchmarks.run --scenario json       # data.json/subjects.json 인코딩 (fast vs stdlib, 바이트 비교)
+  python -m benchmarks.run --scenario writer     # 쓰기 스레드 수별 생성 시간 (--writer-threads 1/2/4/8)
+  python -m benchmarks.run --scenario writer --writer-dir /mnt/nfs/bench  # 네트워크 파일 시스템에서 측정
+  python -m benchmarks.run --save-baseline       # 현재 결과를 기준값으로 저장
+
+생성 이력은 레포지토리 history/history.db 대신 임시 작업 폴더의 데이터베이스에 남긴다
+(CONTENT_GENERATOR_HISTORY_DB, CLI 하위 프로세스도 같은 환경 변수를 물려받음).
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from content_generator.generator import ContentGenerator
+from content_generator.history import HISTORY_DB_ENV
+from content_generator.models import Course, Lesson
+from content_generator.parser import CourseDataParser
+from content_generator.template_registry import get_registry
+from content_generator.validator import check_sheet
+
+from .synthetic import write_workbook
+
+
+BENCHMARK_DIR = Path(__file__).parent
+REPO_ROOT = BENCHMARK_DIR.parent
+BASELINE_FILE = BENCHMARK_DIR / 'baseline.json'
+
+# 시나리오: 워크북 구성 (시트 수, 시트당 차시 수, 시트당 챕터 수, 다운로드 링크 배치)
+SCENARIOS = {
+    'small': {"sheets": 3, "lessons": 30, "chapters": 3, "download": 'first'},
+    'many_sheets': {"sheets": 40, "lessons": 20, "chapters": 4, "download": 'first'},
+    'large': {"sheets": 2, "lessons": 3000, "chapters": 30, "download": 'all'},
+    'no_download': {"sheets": 3, "lessons": 500, "chapters": 1, "download": 'none'},
+}
+
+# 측정 항목
+STAGES = ('parse', 'parse_native', 'validate', 'generate', 'generate_zip', 'cli', 'cli_native')
+
+# CLI 시작 시간 측정 (엑셀을 읽지 않고 끝나는 경로)
+STARTUP_SCENARIO = 'startup'
+STARTUP_COMMANDS = {
+    'help': ['--help'],
+    'no_input': ['-i', 'missing-input.xlsx'],
+}
+
+# 과정마다 CLI를 새로 실행할 때와 생성 서버(--serve)에 작업을 보낼 때 비교
+SERVER_SCENARIO = 'server'
+SERVER_WORKBOOK = {"sheets": 10, "lessons": 20, "chapters": 4, "download": 'first'}
+
+# 워크북마다 CLI를 새로 실행할 때와 작업 매니페스트 하나로 처리할 때 비교
+MANIFEST_SCENARIO = 'manifest'
+MANIFEST_WORKBOOKS = 12
+MANIFEST_WORKBOOK = {"sheets": 3, "lessons": 20, "chapters": 4, "download": 'first'}
+
+# 링크 검사(--check-links): 로컬 스텁 HTTP 서버에 URL마다 요청 하나씩 보내는 경우와 비교
+LINKS_SCENARIO = 'links'
+LINKS_WORKBOOK = {"sheets": 5, "lessons": 40, "chapters": 4, "download": 'all'}
+LINKS_LATENCY = 0.002  # 스텁 서버 응답 지연 (초)
+LINKS_BROKEN_SUFFIX = '_07.mp4'  # 스텁 서버가 404로 응답하는 URL
+
+# JSON 인코딩: 인코더별 data.json/subjects.json 렌더링 (출력이 바이트 단위로 같은지도 확인)
+JSON_SCENARIO = 'json'
+JSON_LESSONS = 3000
+# 이스케이프가 필요한 문자열 (따옴표, 역슬래시, 제어 문자, 이모지, 줄 구분자 U+2028, 빈 문자열)
+JSON_TRICKY_TEXTS = ('따옴표 "인용" \\ 역슬래시', '줄\n바꿈\t탭 \x01\x1f', '이모지 🎓 </script>', '\u2028 구분자', '')
+
+# 쓰기 스레드 수(--writer-threads)별로 같은 과정을 빈 출력 폴더에 생성
+WRITER_SCENARIO = 'writer'
+WRITER_WORKBOOK = {"sheets": 1, "lessons": 2000, "chapters": 20, "download": 'all'}
+WRITER_THREADS = (1, 2, 4, 8)
+
+# 엑셀을 읽기 전에는 가져오지 않아야 하는 모듈
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl')
+
+# 이보다 작은 시간 차이는 측정 잡음으로 보고 회귀로 치지 않음 (초)
+MIN_TIME_DELTA = 0.05
+
+
+def _quiet(function: Callable):
+    """콘솔 출력 없이 실행"""
+    with redirect_stdout(io.StringIO()):
+        return function()
+
+
+def _measure(function: Callable, repeat: int, setup: Optional[Callable] = None) -> Dict:
+    """
+    실행 시간(반복 중 최솟값)과 최대 메모리(tracemalloc, 별도 1회 실행) 측정
+
+    Args:
+        function: 측정할 함수
+        repeat: 시간 측정 반복 횟수
+        setup: 매 실행 전에 부르는 준비 함수 (측정 제외)
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        _quiet(function)
+        timings.append(time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        _quiet(function)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": min(timings), "peak_memory_bytes": peak}
+
+
+# CLI를 실행하고 끝날 때 자신의 최대 RSS(VmHWM)를 파일에 기록하는 래퍼
+# (Linux에서는 exec 이전 부모 프로세스의 RSS가 wait4 ru_maxrss에 섞이므로 자식 안에서 잰다)
+CLI_WRAPPER = """
+import os, runpy, sys
+def record_peak():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    with open(os.environ['BENCHMARK_PEAK_FILE'], 'w') as out:
+                        out.write(str(int(line.split()[1]) * 1024))
+    except OSError:
+        pass
+sys.argv = ['content_generator'] + sys.argv[1:]
+try:
+    runpy.run_module('content_generator', run_name='__main__', alter_sys=True)
+finally:
+    record_peak()
+"""
+
+
+def _run_cli(arguments: List[str], check: bool = True) -> Dict:
+    """
+    CLI를 하위 프로세스로 실행해 시간과 최대 RSS 측정
+
+    Args:
+        arguments: CLI 인자
+        check: 종료 코드가 0이 아니면 실패로 처리
+
+    Raises:
+        RuntimeError: CLI가 실패한 경우
+    """
+    with tempfile.NamedTemporaryFile(prefix='benchmark-peak-', delete=False) as f:
+        peak_file = Path(f.name)
+    environment = dict(os.environ, BENCHMARK_PEAK_FILE=str(peak_file))
+    command = [sys.executable, '-c', CLI_WRAPPER] + arguments
+
+    try:
+        start = time.perf_counter()
+        process = subprocess.run(command, cwd=REPO_ROOT, env=environment,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        elapsed = time.perf_counter() - start
+        peak_text = peak_file.read_text().strip()
+    finally:
+        peak_file.unlink()
+
+    if check and process.returncode != 0:
+        errors = process.stderr.decode('utf-8', 'replace')
+        raise RuntimeError(f"CLI 실패 (종료 코드 {process.returncode}): {errors.strip()}")
+
+    # /proc이 없는 환경(macOS 등)에서는 메모리 미측정
+    peak = int(peak_text) if peak_text else None
+    return {"seconds": elapsed, "peak_memory_bytes": peak}
+
+
+def run_scenario(name: str, repeat: int, work_dir: Path) -> Dict:
+    """
+    시나리오 하나 측정
+
+    Returns:
+        {단계: {"seconds": ..., "peak_memory_bytes": ...}}
+    """
+    config = SCENARIOS[name]
+    workbook_file = work_dir / f'{name}.xlsx'
+    sheet_names = write_workbook(workbook_file, **config)
+
+    # 1. 파싱: 시트마다 CourseDataParser.parse
+    parsed = []
+
+    def parse_all():
+        parsed[:] = [CourseDataParser(str(workbook_file), sheet).parse() for sheet in sheet_names]
+
+    def parse_all_native():
+        for sheet in sheet_names:
+            CourseDataParser(str(workbook_file), sheet, engine='native').parse()
+
+    results = {
+        "parse": _measure(parse_all, repeat),
+        "parse_native": _measure(parse_all_native, repeat),
+    }
+
+    # 1-1. 데이터 검사: 읽어 둔 컬럼 값의 모든 행 검사 (파싱 시간에 포함되는 부분)
+    sheet_columns = [CourseDataParser(str(workbook_file), sheet, engine='native').read_columns()
+                     for sheet in sheet_names]
+
+    def validate_all():
+        for columns in sheet_columns:
+            check_sheet(columns)
+
+    results["validate"] = _measure(validate_all, repeat)
+    del sheet_columns
+
+    # 2. 생성: 매번 빈 출력 폴더에 모든 과정 생성
+    output_dirs = []
+
+    def fresh_output():
+        output_dirs.append(Path(tempfile.mkdtemp(dir=work_dir, prefix=f'{name}-generate-')))
+
+    def generate_all():
+        for course_data in parsed:
+            ContentGenerator(course_data, str(output_dirs[-1])).generate()
+
+    results["generate"] = _measure(generate_all, repeat, setup=fresh_output)
+
+    # 2-1. 생성 (zip 출력: 과정당 압축 파일 하나)
+    def generate_all_zip():
+        for course_data in parsed:
+            ContentGenerator(course_data, str(output_dirs[-1]), output_format='zip').generate()
+
+    results["generate_zip"] = _measure(generate_all_zip, repeat, setup=fresh_output)
+
+    # 3. CLI 전체 경로 (--all-sheets, 엔진별)
+    for stage, engine in (('cli', 'pandas'), ('cli_native', 'native')):
+        timings = []
+        for _ in range(repeat):
+            output_dir = tempfile.mkdtemp(dir=work_dir, prefix=f'{name}-{stage}-')
+            timings.append(_run_cli(['-i', str(workbook_file), '--all-sheets', '-o', output_dir,
+                                     '--no-cache', '--engine', engine]))
+        results[stage] = {
+            "seconds": min(timing["seconds"] for timing in timings),
+            "peak_memory_bytes": max(timing["peak_memory_bytes"] or 0 for timing in timings) or None,
+        }
+
+    return results
+
+
+def run_startup(repeat: int) -> Dict:
+    """
+    CLI 시작 시간 측정 (--help, 입력 파일 없음 오류)
+
+    Returns:
+        {명령: {"seconds": ..., "peak_memory_bytes": ...}}
+    """
+    results = {}
+    for name, arguments in STARTUP_COMMANDS.items():
+        timings = [_run_cli(arguments, check=False) for _ in range(repeat)]
+        results[name] = {
+            "seconds": min(timing["seconds"] for timing in timings),
+            "peak_memory_bytes": max(timing["peak_memory_bytes"] or 0 for timing in timings) or None,
+        }
+    return results
+
+
+def run_server(repeat: int, work_dir: Path) -> Dict:
+    """
+    시트마다 CLI를 실행하는 경우와 로컬 생성 서버에 시트별 작업을 보내는 경우 비교
+
+    Returns:
+        {"cli_per_sheet": ..., "server_per_sheet": ...}
+    """
+    from content_generator.server import GenerationServer
+
+    workbook_file = work_dir / 'server.xlsx'
+    sheet_names = write_workbook(workbook_file, **SERVER_WORKBOOK)
+
+    def cli_per_sheet():
+        output_dir = tempfile.mkdtemp(dir=work_dir, prefix='server-cli-')
+        for sheet in sheet_names:
+            _run_cli(['-i', str(workbook_file), '-s', sheet, '-o', output_dir, '--no-cache'])
+
+    server = GenerationServer(workers=1, defaults={"no_cache": True})
+    log = io.StringIO()
+    with redirect_stdout(log):
+        thread = threading.Thread(target=server.serve, args=('127.0.0.1:0',), daemon=True)
+        thread.start()
+        while server.url is None:
+            time.sleep(0.01)
+
+        def server_per_sheet():
+            output_dir = tempfile.mkdtemp(dir=work_dir, prefix='server-jobs-')
+            for sheet in sheet_names:
+                body = json.dumps({"input": str(workbook_file), "sheet": sheet, "output": output_dir})
+                request = urllib.request.Request(f"{server.url}/jobs", data=body.encode('utf-8'),
+                                                 headers={'Content-Type': 'application/json'})
+                with urllib.request.urlopen(request) as response:
+                    result = json.loads(response.read())
+                if result['fail_count']:
+                    raise RuntimeError(f"서버 작업 실패: {result['courses']}")
+
+        try:
+            results = {
+                "cli_per_sheet": _measure_time(cli_per_sheet, repeat),
+                "server_per_sheet": _measure_time(server_per_sheet, repeat),
+            }
+        finally:
+            server.shutdown()
+            thread.join()
+
+    return results
+
+
+def run_manifest(repeat: int, work_dir: Path) -> Dict:
+    """
+    워크북마다 CLI(--all-sheets)를 실행하는 경우와 작업 매니페스트 하나로 처리하는 경우 비교
+
+    Returns:
+        {"cli_per_workbook": ..., "cli_manifest": ..., "cli_manifest_jobs4": ...}
+    """
+    workbook_files = []
+    for index in range(MANIFEST_WORKBOOKS):
+        workbook_file = work_dir / f'manifest{index:02d}.xlsx'
+        write_workbook(workbook_file, course_prefix=f'25mf{index:02d}c', **MANIFEST_WORKBOOK)
+        workbook_files.append(workbook_file)
+
+    manifest_file = work_dir / 'jobs.json'
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump({"jobs": [{"input": str(workbook_file)} for workbook_file in workbook_files]}, f)
+
+    def cli_per_workbook():
+        output_dir = tempfile.mkdtemp(dir=work_dir, prefix='manifest-each-')
+        for workbook_file in workbook_files:
+            _run_cli(['-i', str(workbook_file), '--all-sheets', '-o', output_dir, '--no-cache'])
+
+    results = {"cli_per_workbook": _measure_time(cli_per_workbook, repeat)}
+    for stage, jobs in (('cli_manifest', 1), ('cli_manifest_jobs4', 4)):
+        timings = []
+        for _ in range(repeat):
+            output_dir = tempfile.mkdtemp(dir=work_dir, prefix=f'{stage}-')
+            timings.append(_run_cli(['-i', str(manifest_file), '-o', output_dir, '--no-cache',
+                                     '--jobs', str(jobs)]))
+        results[stage] = {
+            "seconds": min(timing["seconds"] for timing in timings),
+            "peak_memory_bytes": max(timing["peak_memory_bytes"] or 0 for timing in timings) or None,
+        }
+    return results
+
+
+class _StubLinkHandler(BaseHTTPRequestHandler):
+    """링크 검사용 스텁 서버 (keep-alive, LINKS_BROKEN_SUFFIX로 끝나는 경로는 404)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        time.sleep(LINKS_LATENCY)
+        self.send_response(404 if self.path.endswith(LINKS_BROKEN_SUFFIX) else 200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_links(repeat: int, work_dir: Path) -> Dict:
+    """
+    링크 검사: URL마다 새 연결로 순서대로 HEAD 요청(urllib)하는 경우와 LinkChecker(keep-alive, 동시 요청),
+    캐시가 채워진 재실행 비교 (깨진 링크를 모두 찾는지도 확인)
+
+    Returns:
+        {"urllib_serial": ..., "check": ..., "check_cached": ...}
+    """
+    from content_generator.link_checker import LinkCache, LinkChecker
+
+    workbook_file = work_dir / 'links.xlsx'
+    sheet_names = write_workbook(workbook_file, **LINKS_WORKBOOK)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubLinkHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stub_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # 가상 워크북의 CDN 주소를 스텁 서버 주소로 바꾼 고유 URL
+    urls = {}
+    for sheet in sheet_names:
+        course_data = _quiet(CourseDataParser(str(workbook_file), sheet, engine='native').parse)
+        for lesson in course_data.lessons:
+            for url in (lesson.video_url, lesson.download_url):
+                urls[url.replace('https://cdn-it.livestudy.com', stub_url)] = None
+    urls = list(urls)
+    expected_broken = sum(1 for url in urls if url.endswith(LINKS_BROKEN_SUFFIX))
+
+    def urllib_serial():
+        for url in urls:
+            try:
+                with urllib.request.urlopen(urllib.request.Request(url, method='HEAD')):
+                    pass
+            except urllib.error.HTTPError:
+                pass
+
+    def check(cache: Optional[LinkCache]):
+        results = LinkChecker(cache=cache).check(urls)
+        broken = sum(1 for result in results.values() if not result['ok'])
+        if broken != expected_broken:
+            raise RuntimeError(f"깨진 링크 {expected_broken}개 중 {broken}개만 찾음")
+
+    cache_file = work_dir / 'link_cache.json'
+    try:
+        results = {
+            "urllib_serial": _measure_time(urllib_serial, repeat),
+            "check": _measure_time(lambda: check(None), repeat),
+        }
+        check(LinkCache(cache_file=cache_file))
+        results["check_cached"] = _measure_time(lambda: check(LinkCache(cache_file=cache_file)), repeat)
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+    return results
+
+
+def _json_course(subject) -> Course:
+    """JSON 인코딩 측정용 가상 과정 (차시 순서/다운로드 링크가 비거나 이스케이프가 필요한 값 포함)"""
+    lessons = [
+        Lesson(
+            number,
+            number % 20 or None,
+            f"{JSON_TRICKY_TEXTS[number % len(JSON_TRICKY_TEXTS)]} 차시 {number}",
+            f"https://cdn-it.livestudy.com/mov/2025/25ctjson/25ctjson_{number:02d}.mp4" if number % 50 else None,
+            f"https://cdn-it.livestudy.com/down/25ctjson_{number:02d}.zip" if number % 20 == 1 else None,
+        )
+        for number in range(1, JSON_LESSONS + 1)
+    ]
+    return Course('25ctjson', subject, lessons, [])
+
+
+def run_json(repeat: int, work_dir: Path) -> Dict:
+    """
+    JSON 인코딩: stdlib(json.dumps)와 fast(미리 직렬화한 조각) 인코더로 모든 템플릿의
+    data.json/subjects.json을 만들어 바이트 단위로 비교하고 시간 측정
+
+    Returns:
+        {"stdlib": ..., "fast": ...}
+
+    Raises:
+        RuntimeError: 인코더 출력이 다른 경우
+    """
+    courses = [_json_course(subject) for subject in ('JSON "인코딩" 과정\t✓', None, 2025)]
+    generators = {
+        encoder: [
+            ContentGenerator(course, str(work_dir / 'json'), template=template, json_encoder=encoder,
+                             history_log=False)
+            for course in courses
+            for template in get_registry().names()
+        ]
+        for encoder in ('stdlib', 'fast')
+    }
+
+    def render(encoder: str) -> List[bytes]:
+        outputs = []
+        for generator in generators[encoder]:
+            outputs.append(generator._render_subjects_json())
+            outputs.extend(generator._render_data_json(lesson) for lesson in generator.course_data.lessons)
+        return outputs
+
+    expected, actual = render('stdlib'), render('fast')
+    different = sum(1 for left, right in zip(expected, actual) if left != right)
+    if different or len(expected) != len(actual):
+        raise RuntimeError(f"fast 인코더 출력이 json.dumps와 다름: {different}/{len(expected)}개 파일")
+
+    return {encoder: _measure_time(lambda: render(encoder), repeat) for encoder in ('stdlib', 'fast')}
+
+
+def run_writer(repeat: int, work_dir: Path, output_root: Optional[Path] = None) -> Dict:
+    """
+    쓰기 스레드 수별 생성 시간 (TreeWriter 스레드 풀 크기 비교)
+
+    로컬 디스크에서는 스레드를 늘려도 거의 빨라지지 않으므로,
+    실제 출력 위치(NFS 등)에 맞는 값을 고르려면 output_root를 그 파일 시스템으로 지정한다.
+
+    Args:
+        output_root: 출력 폴더를 만들 위치 (None이면 작업 폴더)
+
+    Returns:
+        {"threads_1": ..., "threads_2": ..., ...}
+    """
+    workbook_file = work_dir / 'writer.xlsx'
+    sheet_names = write_workbook(workbook_file, **WRITER_WORKBOOK)
+    course_data = _quiet(CourseDataParser(str(workbook_file), sheet_names[0], engine='native').parse)
+    output_root = output_root or work_dir
+    output_root.mkdir(parents=True, exist_ok=True)
+
+    results = {}
+    for threads in WRITER_THREADS:
+        def generate():
+            with tempfile.TemporaryDirectory(dir=output_root, prefix=f'writer-{threads}-') as output_dir:
+                _quiet(ContentGenerator(course_data, output_dir, writer_threads=threads, history_log=False).generate)
+
+        results[f"threads_{threads}"] = _measure_time(generate, repeat)
+    return results
+
+
+def _measure_time(function: Callable, repeat: int) -> Dict:
+    """시간만 측정 (하위 프로세스/서버 작업은 tracemalloc으로 잴 수 없음)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {"seconds": min(timings), "peak_memory_bytes": None}
+
+
+def loaded_heavy_modules() -> List[str]:
+    """CLI 모듈을 가져오기만 했을 때 함께 로드되는 무거운 모듈 목록 (비어 있어야 정상)"""
+    code = (
+        "import sys, content_generator.__main__; "
+        f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    return output.split(',') if output else []
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    기준값 대비 느려지거나 메모리가 늘어난 항목
+
+    Args:
+        results: 이번 측정 결과
+        baseline: 기준값 (같은 형식)
+        tolerance: 허용 비율 (0.3이면 30%까지 허용)
+
+    Returns:
+        회귀 항목 설명 목록
+    """
+    regressions = []
+    for scenario, stages in results.items():
+        for stage, metrics in stages.items():
+            base = baseline.get(scenario, {}).get(stage)
+            if not base:
+                continue
+            for metric in ('seconds', 'peak_memory_bytes'):
+                current, previous = metrics.get(metric), base.get(metric)
+                if not (current and previous) or current <= previous * (1 + tolerance):
+                    continue
+                if metric == 'seconds' and current - previous < MIN_TIME_DELTA:
+                    continue
+                regressions.append(
+                    f"{scenario}/{stage} {metric}: {_format(metric, previous)} → "
+                    f"{_format(metric, current)} ({current / previous:.2f}배)"
+                )
+    return regressions
+
+
+def _format(metric: str, value) -> str:
+    """측정값 표시 형식"""
+    if value is None:
+        return '-'
+    if metric == 'seconds':
+        return f"{value * 1000:.1f}ms"
+    return f"{value / 1024 / 1024:.1f}MB"
+
+
+def _print_results(results: Dict, baseline: Dict):
+    """결과 표 출력 (기준값이 있으면 비율 함께 표시)"""
+    # 한글은 두 칸 폭이라 헤더 너비를 따로 맞춤
+    print(f"{'시나리오':<10}{'단계':<16}{'시간':>10}{'메모리':>9}{'기준 대비':>14}")
+    for scenario, stages in results.items():
+        for stage, metrics in stages.items():
+            base = baseline.get(scenario, {}).get(stage, {})
+            ratios = []
+            for metric in ('seconds', 'peak_memory_bytes'):
+                if metrics.get(metric) and base.get(metric):
+                    ratios.append(f"{metrics[metric] / base[metric]:.2f}")
+            print(
+                f"{scenario:<14}{stage:<18}"
+                f"{_format('seconds', metrics['seconds']):>12}"
+                f"{_format('peak_memory_bytes', metrics['peak_memory_bytes']):>12}"
+                f"{' / '.join(ratios) or '-':>18}"
+            )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='content_generator 벤치마크')
+    parser.add_argument(
+        '--scenario',
+        action='append',
+        choices=list(SCENARIOS) + [STARTUP_SCENARIO, SERVER_SCENARIO, MANIFEST_SCENARIO, LINKS_SCENARIO,
+                                   JSON_SCENARIO, WRITER_SCENARIO],
+        help='실행할 시나리오 (여러 번 지정 가능, 기본: 전체)'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='시간 측정 반복 횟수 (최솟값 사용, 기본: 3)')
+    parser.add_argument('--baseline', default=str(BASELINE_FILE), help='기준값 파일 (기본: benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준값으로 저장')
+    parser.add_argument('--writer-dir', help='writer 시나리오 출력 위치 (기본: 임시 작업 폴더, 예: NFS 마운트 경로)')
+    parser.add_argument('--tolerance', type=float, default=0.3, help='허용 비율 (기본: 0.3 = 30%%)')
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error('--repeat 는 1 이상이어야 합니다')
+
+    baseline_file = Path(args.baseline)
+    baseline = {}
+    if baseline_file.exists():
+        with open(baseline_file, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+
+    scenarios = args.scenario or list(SCENARIOS) + [STARTUP_SCENARIO, SERVER_SCENARIO, MANIFEST_SCENARIO, LINKS_SCENARIO,
+                                                    JSON_SCENARIO, WRITER_SCENARIO]
+    results = {}
+    heavy_modules = []
+    previous_history_db = os.environ.get(HISTORY_DB_ENV)
+    with tempfile.TemporaryDirectory(prefix='content-generator-bench-') as work_dir:
+        # 측정용 생성 이력은 작업 폴더에 기록 (실제 history/history.db에 남지 않도록)
+        os.environ[HISTORY_DB_ENV] = str(Path(work_dir) / 'history.db')
+        try:
+            for name in scenarios:
+                if name == STARTUP_SCENARIO:
+                    print(f"⏱️  {name}: {', '.join(STARTUP_COMMANDS)}")
+                    results[name] = run_startup(args.repeat)
+                    heavy_modules = loaded_heavy_modules()
+                    continue
+                if name == SERVER_SCENARIO:
+                    print(f"⏱️  {name}: {SERVER_WORKBOOK}")
+                    results[name] = run_server(args.repeat, Path(work_dir))
+                    continue
+                if name == MANIFEST_SCENARIO:
+                    print(f"⏱️  {name}: 워크북 {MANIFEST_WORKBOOKS}개 × {MANIFEST_WORKBOOK}")
+                    results[name] = run_manifest(args.repeat, Path(work_dir))
+                    continue
+                if name == LINKS_SCENARIO:
+                    print(f"⏱️  {name}: {LINKS_WORKBOOK}, 스텁 서버 지연 {LINKS_LATENCY * 1000:g}ms")
+                    results[name] = run_links(args.repeat, Path(work_dir))
+                    continue
+                if name == JSON_SCENARIO:
+                    print(f"⏱️  {name}: 과정 3개 × 차시 {JSON_LESSONS}개 × 템플릿 {len(get_registry().names())}개")
+                    results[name] = run_json(args.repeat, Path(work_dir))
+                    continue
+                if name == WRITER_SCENARIO:
+                    print(f"⏱️  {name}: {WRITER_WORKBOOK}, 쓰기 스레드 {'/'.join(map(str, WRITER_THREADS))}개")
+                    output_root = Path(args.writer_dir) if args.writer_dir else None
+                    results[name] = run_writer(args.repeat, Path(work_dir), output_root)
+                    continue
+                print(f"⏱️  {name}: {SCENARIOS[name]}")
+                results[name] = run_scenario(name, args.repeat, Path(work_dir))
+        finally:
+            if previous_history_db is None:
+                os.environ.pop(HISTORY_DB_ENV, None)
+            else:
+                os.environ[HISTORY_DB_ENV] = previous_history_db
+
+    print()
+    _print_results(results, baseline)
+
+    if args.save_baseline:
+        merged = dict(baseline, **results)
+        with open(baseline_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": merged,
+            }, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"\n💾 기준값 저장: {baseline_file}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if heavy_modules:
+        regressions.append(f"CLI 모듈을 가져올 때 {', '.join(heavy_modules)} 까지 로드됨 (시작 시간 증가)")
+    if regressions:
+        print(f"\n❌ 기준값보다 {args.tolerance:.0%} 넘게 나빠진 항목:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        sys.exit(1)
+
+    print("\n✅ 기준값 대비 회귀 없음" if baseline else "\n💡 기준값이 없습니다. --save-baseline 으로 저장하세요.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+벤치마크용 가상 워크북 생성
+
+실제 과정 시트와 같은 컬럼 구성으로 시트 수, 차시 수, 챕터 구성, 다운로드 컬럼을 바꿔 가며 만든다.
+"""
+
+from pathlib import Path
+from typing import List
+
+import openpyxl
+
+
+COLUMNS = [
+    '과정명', '차시', '챕터구분', '챕터명', '강의 수', '차시번호', '차시명',
+    '학습자페이지 노출 차시명', '강의영상(mp4) 링크', '다운로드(zip) 링크',
+]
+
+# 다운로드 링크 배치 (none: 컬럼 없음, first: 챕터 첫 차시만, all: 모든 차시)
+DOWNLOAD_LAYOUTS = ('none', 'first', 'all')
+
+
+def course_rows(course_code: str, lessons: int, chapters: int, download: str = 'first') -> List[list]:
+    """
+    과정 시트 한 개의 행 목록 (헤더 제외)
+
+    Args:
+        course_code: 과정 코드 (예: 25ctbench01)
+        lessons: 차시 수
+        chapters: 챕터 수 (차시를 고르게 나눔)
+        download: 다운로드 링크 배치 (DOWNLOAD_LAYOUTS)
+
+    Returns:
+        COLUMNS 순서의 행 목록 (download가 none이면 마지막 컬럼 제외)
+    """
+    if download not in DOWNLOAD_LAYOUTS:
+        raise ValueError(f"지원하지 않는 다운로드 배치: {download}")
+
+    chapters = max(1, min(chapters, lessons))
+    per_chapter, extra = divmod(lessons, chapters)
+
+    rows = []
+    lesson_number = 1
+    for chapter in range(1, chapters + 1):
+        count = per_chapter + (1 if chapter <= extra else 0)
+        for order in range(1, count + 1):
+            is_first = order == 1
+            title = f"{course_code} {chapter}장 {order}차시 강의"
+            row = [
+                f"{course_code} 과정" if lesson_number == 1 else None,
+                order,
+                chapter if is_first else None,
+                f"Part.{chapter} 챕터 {chapter}" if is_first else None,
+                count if is_first else None,
+                lesson_number,
+                title,
+                title,
+                f"//cdn-it.livestudy.com/mov/2025/{course_code}/{course_code}_{lesson_number:02d}.mp4",
+            ]
+            if download == 'first':
+                row.append(
+                    f"cdn-it.livestudy.com/mov/2025/{course_code}/down/{course_code}_{chapter:02d}.zip"
+                    if is_first else None
+                )
+            elif download == 'all':
+                row.append(
+                    f"https://cdn-it.livestudy.com/mov/2025/{course_code}/down/{course_code}_{lesson_number:02d}.zip"
+                )
+            rows.append(row)
+            lesson_number += 1
+
+    return rows
+
+
+def write_workbook(path: Path, sheets: int, lessons: int, chapters: int, download: str = 'first',
+                   course_prefix: str = '25ctbench', ttl_sheet: bool = True) -> List[str]:
+    """
+    가상 워크북 저장
+
+    Args:
+        path: 저장할 .xlsx 경로
+        sheets: 과정 시트 수
+        lessons: 시트당 차시 수
+        chapters: 시트당 챕터 수
+        download: 다운로드 링크 배치 (DOWNLOAD_LAYOUTS)
+        course_prefix: 과정 코드 앞부분 (뒤에 시트 번호가 붙음)
+        ttl_sheet: --all-sheets에서 제외되는 'TTL' 시트 추가 여부
+
+    Returns:
+        과정 시트 이름 목록
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+
+    if ttl_sheet:
+        ttl = workbook.create_sheet('TTL')
+        ttl.append(['구분', '내용'])
+        ttl.append(['벤치마크', '가상 워크북'])
+
+    columns = COLUMNS if download != 'none' else COLUMNS[:-1]
+    sheet_names = []
+    for number in range(1, sheets + 1):
+        course_code = f"{course_prefix}{number:02d}"
+        worksheet = workbook.create_sheet(course_code)
+        worksheet.append(columns)
+        for row in course_rows(course_code, lessons, chapters, download):
+            worksheet.append(row)
+        sheet_names.append(course_code)
+
+    workbook.save(path)
+    return sheet_names
+
@@ -5,85 +5,793 @@ CLI 진입점
 import argparse
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
 
-from .parser import parse_course_file, get_sheet_names
-from .generator import ContentGenerator
+from .parser import parse_course_file, CourseDataParser, WorkbookSession, ENGINES
+from .batch_log import BatchLogWriter, success_result
+from .history import HistoryStore, history_db_path
+from .manifest import is_manifest_input, load_jobs, parse_job, find_duplicate_courses, generate_course
+from .console import run_captured
+from .cache import CourseCache
+from .validator import ValidationReport, validate_file
+from .watcher import FileWatcher, sheet_fingerprints, DEFAULT_DEBOUNCE
+from .generator import ContentGenerator, INDEX_MODES, OUTPUT_FORMATS
+from .template_registry import get_registry, AUTO_TEMPLATE
 from . import config
+from . import profiler
 
 
-def _create_batch_log(input_file: str, output_dir: str, template: str, batch_results: list):
-    """배치 작업 로그 생성 (레포지토리 폴더)"""
-    # 레포지토리 루트 경로 찾기 (__file__의 상위)
-    repo_root = Path(__file__).parent.parent
-    history_dir = repo_root / 'history'
-    history_dir.mkdir(parents=True, exist_ok=True)
-
-    # 현재 날짜+시간으로 파일명 생성 (YYMMDD_HHMM.json)
-    now = datetime.now()
-    filename = now.strftime('%y%m%d_%H%M.json')  # 예: 251119_1007.json
-    history_file = history_dir / filename
-
-    # 배치 로그 데이터 (간략한 정보만)
-    courses = []
-    success_count = 0
-    fail_count = 0
-
-    for result in batch_results:
-        if result['status'] == 'success':
-            success_count += 1
-            generator = result['generator']
-
-            courses.append({
-                "sheet_name": result['sheet_name'],
-                "course_code": result['course_code'],
-                "subject": generator.course_data['subject'],
-                "status": "success",
-                "total_lessons": generator.course_data['total_lessons'],
-                "chapters": len(generator.course_data['chapters']),
-                "output_dir": str(generator.course_dir),
-                "lessons": [
-                    {
-                        "number": lesson['number'],
-                        "title": lesson['title'],
-                        "video_url": lesson['video_url'],
-                        "download_url": lesson['download_url'] or generator._get_guide_for_lesson(lesson['index'])
-                    }
-                    for lesson in generator.course_data['lessons']
-                ]
-            })
-        else:
-            fail_count += 1
-            courses.append({
-                "sheet_name": result['sheet_name'],
-                "status": "failed",
-                "error": result.get('error', 'Unknown error')
-            })
-
-    log_data = {
-        "generated_at": now.isoformat(),
-        "batch_type": "all_sheets",
-        "input_file": input_file,
-        "output_dir": output_dir,
-        "template": template,
-        "total_courses": len(batch_results),
-        "success_count": success_count,
-        "fail_count": fail_count,
-        "courses": courses
-    }
+def _course_cache(args) -> Optional[CourseCache]:
+    """파싱 결과 캐시 (--no-cache면 None)"""
+    if args.no_cache:
+        return None
+    return CourseCache(version=CourseDataParser.LOGIC_VERSION)
+
+
+def _process_sheet(args, sheet: str, workbook: Optional[WorkbookSession] = None,
+                   columns: Optional[Dict] = None) -> dict:
+    """
+    시트 하나 파싱 + 생성
+
+    Args:
+        columns: 생성 전 검사에서 읽어 둔 컬럼 값 (있으면 시트를 다시 읽지 않음)
+
+    Returns:
+        배치 결과 (dry-run 성공 시 status가 planned)
+    """
+    print("=" * 60)
+    print(f"📄 시트 처리 중: {sheet}")
+    print("=" * 60)
+
+    active_profiler = profiler.active()
+    if active_profiler is not None:
+        active_profiler.begin_sheet(sheet)
+
+    try:
+        # 파싱
+        with profiler.phase('parse'):
+            course_data = parse_course_file(args.input, sheet, workbook=workbook, columns=columns,
+                                            engine=args.engine, cache=_course_cache(args))
+
+        if args.verbose:
+            print(f"   - 과정 코드: {course_data.course_code}")
+            print(f"   - 과정명: {course_data.subject}")
+            print(f"   - 총 차시: {course_data.total_lessons}")
+            print(f"   - 챕터 수: {len(course_data.chapters)}")
+        print("✅ 파싱 완료")
+        print()
+
+        # 생성
+        generator = ContentGenerator(
+            course_data=course_data,
+            output_dir=args.output,
+            template=args.template,
+            input_file=args.input,  # 실제 파일 경로 전달
+            index_mode=args.index_mode,
+            writer_threads=args.writer_threads,
+            verbose=args.verbose,
+            output_format=args.output_format,
+            history_log=False  # 배치/감시 모드는 배치 단위로 기록
+        )
+
+        with profiler.phase('generate'):
+            generator.generate(dry_run=args.dry_run)
+
+        if args.dry_run:
+            return success_result(sheet, generator, status="planned")
+
+        print(f"✅ {course_data.course_code} 생성 완료")
+        print()
+
+        return success_result(sheet, generator)
+
+    except Exception as e:
+        print(f"❌ {sheet} 시트 처리 실패: {e}")
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        print()
+
+        # 실패한 경우도 기록
+        return {
+            "sheet_name": sheet,
+            "course_code": None,
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        if active_profiler is not None:
+            active_profiler.end_sheet()
+
+
+def _process_sheet_job(args, sheet: str, columns: Optional[Dict]) -> Tuple[str, dict, Optional[dict]]:
+    """
+    워커 프로세스용 시트 처리 (콘솔 출력을 모아서 반환)
+
+    Returns:
+        (시트 콘솔 출력, 배치 결과, 시트 프로파일 - --profile이 아니면 None)
+    """
+    sheet_profiler = profiler.start() if args.profile else None
+
+    try:
+        output, result = run_captured(_process_sheet, args, sheet, None, columns)
+    finally:
+        if sheet_profiler is not None:
+            profiler.stop()
+
+    sheet_profile = sheet_profiler.sheets[-1] if sheet_profiler is not None else None
+    return output, result, sheet_profile
+
+
+def _link_set(args):
+    """--check-links면 검사할 링크 모음 (아니면 None)"""
+    if not args.check_links:
+        return None
+    from .link_checker import LinkSet
+    return LinkSet()
 
-    # 파일 저장
-    with open(history_file, 'w', encoding='utf-8') as f:
-        json.dump(log_data, f, ensure_ascii=False, indent=2)
 
-    history_file.chmod(0o644)
+def _check_links(args, links) -> int:
+    """
+    --check-links: 모은 링크 검사
+
+    Returns:
+        깨진 링크 수 (--check-links가 아니면 0)
+    """
+    if links is None:
+        return 0
+    from .link_checker import run_link_check
+
+    print()
+    with profiler.phase('check_links'):
+        return run_link_check(links, concurrency=args.link_concurrency, timeout=args.link_timeout,
+                              cache_ttl=args.link_cache_ttl)
+
+
+def _process_all_sheets(args, workbook: WorkbookSession) -> int:
+    """
+    모든 시트 일괄 처리 ('TTL' 제외)
+
+    Returns:
+        깨진 링크 수 (--check-links)
+    """
+    # 'TTL' 제외
+    target_sheets = [name for name in workbook.sheet_names if name != 'TTL']
+
+    if not target_sheets:
+        print("❌ 처리할 시트가 없습니다. (TTL 제외)")
+        sys.exit(1)
+
+    print(f"📋 처리할 시트 목록 ({len(target_sheets)}개):")
+    for sheet in target_sheets:
+        print(f"   - {sheet}")
     print()
-    print(f"📝 배치 작업 이력 저장: {history_file}")
+
+    # 생성 전 검사: 하나라도 오류가 있으면 아무것도 쓰지 않고 종료
+    report, sheet_columns = _check_sheets(args, workbook, target_sheets)
+    if report.error_count:
+        _print_check_failure(report)
+        sys.exit(1)
+
+    links = _link_set(args)
+    if args.dry_run:
+        _run_sheets(args, workbook, target_sheets, sheet_columns,
+                    on_result=links.add_result if links is not None else None)
+        return _check_links(args, links)
+
+    # 배치 작업 이력: 시트가 끝날 때마다 기록하고 메모리에는 최소 결과만 유지
+    with HistoryStore() as store:
+        batch_log = BatchLogWriter(store, args.input, args.output, args.template)
+        on_result = batch_log.add
+        if links is not None:
+            on_result = lambda result: batch_log.add(links.add_result(result))  # noqa: E731
+        _run_sheets(args, workbook, target_sheets, sheet_columns, on_result=on_result)
+
+        active_profiler = profiler.active()
+        profile = active_profiler.summary() if active_profiler is not None else None
+        with profiler.phase('batch_log'):
+            batch_log.close(profile)
+
+    print()
+    print(f"📝 배치 작업 이력 저장: {store.db_path} (실행 #{batch_log.run_id})")
+
+    return _check_links(args, links)
+
+
+def _check_sheets(args, workbook: WorkbookSession, target_sheets: List[str],
+                  checked_sheets: Optional[Dict[str, Tuple]] = None) -> Tuple[ValidationReport, Dict]:
+    """
+    생성 전 검사: 대상 시트를 한 번씩 읽어 모든 행을 검사하고 같은 과정 코드를 만드는 시트를 찾음
+
+    캐시된 시트는 파싱할 때 이미 검사를 통과했으므로 캐시 항목의 요약(과정 코드, 차시 수)만 읽는다.
+
+    Args:
+        target_sheets: 검사할 시트
+        checked_sheets: 다시 읽지 않는 시트 {시트: (과정 코드, 행 수)} (감시 모드에서 바뀌지 않은 시트)
+
+    Returns:
+        (검사 보고서, {시트: 읽은 컬럼 값} - 캐시된 시트 제외, 파싱에 그대로 사용)
+    """
+    course_cache = _course_cache(args)
+    report = ValidationReport()
+    cached = {}
+    if course_cache is not None:
+        for sheet in target_sheets:
+            summary = course_cache.load_summary(args.input, sheet)
+            if summary is not None:
+                cached[sheet] = summary
+
+    # 캐시에 없는 대상 시트만 한 번에 읽어 두기
+    with profiler.phase('workbook.load'):
+        workbook.load_sheets([sheet for sheet in target_sheets if sheet not in cached])
+
+    sheet_columns = {}
+    with profiler.phase('validate'):
+        for sheet in target_sheets:
+            if sheet in cached:
+                report.add_checked_sheet(args.input, sheet, cached[sheet]['course_code'],
+                                         cached[sheet]['total_lessons'])
+                continue
+            try:
+                columns = CourseDataParser(args.input, sheet, workbook=workbook, engine=args.engine).read_columns()
+            except Exception as e:
+                report.add_sheet(args.input, sheet, error=str(e))
+                continue
+            report.add_sheet(args.input, sheet, columns)
+            sheet_columns[sheet] = columns
+
+        for sheet, (course_code, rows) in (checked_sheets or {}).items():
+            if sheet not in target_sheets:
+                report.add_checked_sheet(args.input, sheet, course_code, rows)
+        report.finish()
+
+    return report, sheet_columns
+
+
+def _print_check_failure(report: ValidationReport):
+    """생성 전 검사 실패 보고 (아무것도 생성하지 않음)"""
+    print("🔍 생성 전 데이터 검사")
+    print()
+    report.print_summary()
+    print()
+    print(f"❌ 데이터 오류 {report.error_count}건: 아무것도 생성하지 않았습니다")
+
+
+def _run_sheets(args, workbook: WorkbookSession, target_sheets: List[str], sheet_columns: Dict,
+                on_result: Optional[Callable[[dict], dict]] = None) -> list:
+    """
+    시트 목록 파싱 + 생성 (--jobs면 병렬) 후 전체 결과 출력
+
+    Args:
+        sheet_columns: 생성 전 검사에서 읽어 둔 시트별 컬럼 값 (_check_sheets, 캐시된 시트는 없음)
+        on_result: 시트가 끝날 때마다 (시트 순서) 배치 결과를 받아 남길 결과를 돌려주는 함수
+                   (배치 로그 기록 후 최소 결과만 남기는 용도)
+
+    Returns:
+        배치 결과 리스트 (시트 순서, dry-run 성공 시트는 status가 planned)
+    """
+    # 각 시트마다 처리 (결과 순서는 항상 시트 순서)
+    batch_results = []
+
+    def add_result(result: Optional[dict]):
+        if result is not None:
+            batch_results.append(on_result(result) if on_result is not None else result)
+
+    if args.jobs > 1:
+        # 병렬 처리: 읽어 둔 컬럼 값을 워커로 넘기고, 출력은 시트 순서대로 묶어서 출력
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(target_sheets))) as executor:
+            futures = [
+                executor.submit(_process_sheet_job, args, sheet, sheet_columns.pop(sheet, None))
+                for sheet in target_sheets
+            ]
+            for index, future in enumerate(futures):
+                futures[index] = None  # 기록한 시트 결과는 future에도 남기지 않음
+                output, result, sheet_profile = future.result()
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                add_result(result)
+                if sheet_profile is not None:
+                    profiler.active().add_sheet(sheet_profile)
+    else:
+        for sheet in target_sheets:
+            add_result(_process_sheet(args, sheet, workbook=workbook, columns=sheet_columns.pop(sheet, None)))
+
+    success_count = sum(1 for result in batch_results if result['status'] == 'success')
+    fail_count = sum(1 for result in batch_results if result['status'] == 'failed')
+
+    # 최종 결과
+    print("=" * 60)
+    print(f"📊 전체 처리 결과")
+    print(f"   - 성공: {success_count}개")
+    print(f"   - 실패: {fail_count}개")
+    print(f"   - 총: {len(target_sheets)}개")
+    print("=" * 60)
+
+    return batch_results
+
+
+def _map_ordered(executor: Optional[ProcessPoolExecutor], function, tasks: list):
+    """
+    작업 목록을 순서대로 실행해 결과를 하나씩 반환 (executor가 있으면 워커 풀에서 병렬 실행)
+
+    워커 콘솔 출력은 작업 순서대로 묶어서 출력한다. 끝난 작업의 인자/결과는 붙잡지 않도록
+    tasks는 비우면서 진행한다.
+    """
+    if executor is None:
+        while tasks:
+            yield function(*tasks.pop(0))
+        return
+
+    futures = [executor.submit(run_captured, function, *task) for task in tasks]
+    tasks.clear()
+    for index, future in enumerate(futures):
+        futures[index] = None
+        output, result = future.result()
+        sys.stdout.write(output)
+        sys.stdout.flush()
+        yield result
+
+
+def _process_manifest(args) -> int:
+    """
+    작업 매니페스트/폴더/글롭 입력의 모든 워크북 처리 (워커 풀 하나 공유, 이력은 실행 하나)
+
+    Returns:
+        깨진 링크 수 (--check-links)
+    """
+    jobs = load_jobs(args.input, args.template, args.output)
+
+    print(f"📋 작업 목록 ({len(jobs)}개 워크북):")
+    for job in jobs:
+        sheets = '모든 시트' if job['sheets'] is None else ', '.join(str(sheet) for sheet in job['sheets'])
+        print(f"   - {job['input']} ({sheets}) → {job['output']} [{job['template']}]")
+    print()
+
+    executor = None
+    if args.jobs > 1:
+        if args.engine == 'pandas':
+            import pandas  # noqa: F401 - 워커마다 다시 가져오지 않도록 fork 전에 로드
+        executor = ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs)))
+    try:
+        # 1. 파싱: 워크북 단위
+        with profiler.phase('manifest.parse'):
+            parse_tasks = [(job, args.engine, not args.no_cache) for job in jobs]
+            parsed = list(zip(jobs, _map_ordered(executor, parse_job, parse_tasks)))
+        print()
+
+        # 2. 과정 코드 중복 검사 (아무것도 쓰기 전에 중단)
+        duplicates = find_duplicate_courses(parsed)
+        if duplicates:
+            print("❌ 같은 과정 코드를 만드는 시트가 있어 생성하지 않습니다:")
+            for code, sources in duplicates.items():
+                print(f"   - {code}: {', '.join(sources)}")
+            sys.exit(1)
+
+        # 3. 생성 전 검사: 파싱(데이터 검사 포함)에 실패한 시트가 하나라도 있으면 아무것도 쓰지 않고 종료
+        report = _check_parsed(parsed)
+        if report.error_count:
+            _print_check_failure(report)
+            sys.exit(1)
+
+        # 4. 생성: 시트 단위
+        options = {
+            "index_mode": args.index_mode,
+            "output_format": args.output_format,
+            "writer_threads": args.writer_threads,
+            "verbose": args.verbose,
+            "dry_run": args.dry_run,
+        }
+        tasks = [
+            (job, entry['sheet_name'], entry.pop('course_data'), options)
+            for job, entries in parsed for entry in entries
+        ]
+        total_count = len(tasks)
+        del parsed
+
+        store = batch_log = None
+        if not args.dry_run:
+            store = HistoryStore()
+            batch_log = BatchLogWriter(store, args.input, args.output, args.template, batch_type="manifest",
+                                       details={"jobs": jobs})
+
+        links = _link_set(args)
+        success_count = fail_count = 0
+        with profiler.phase('manifest.generate'):
+            for result in _map_ordered(executor, generate_course, tasks):
+                if links is not None:
+                    links.add_result(result)
+                if result['status'] == 'planned':
+                    continue  # dry-run
+                if result['status'] == 'success':
+                    success_count += 1
+                else:
+                    fail_count += 1
+                if batch_log is not None:
+                    batch_log.add(result)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    print("=" * 60)
+    print(f"📊 전체 처리 결과 ({len(jobs)}개 워크북)")
+    print(f"   - 성공: {success_count}개")
+    print(f"   - 실패: {fail_count}개")
+    print(f"   - 총: {total_count}개")
+    print("=" * 60)
+
+    if batch_log is not None:
+        active_profiler = profiler.active()
+        batch_log.close(active_profiler.summary() if active_profiler is not None else None)
+        store.close()
+        print()
+        print(f"📝 배치 작업 이력 저장: {store.db_path} (실행 #{batch_log.run_id})")
+
+    return _check_links(args, links)
+
+
+def _check_parsed(parsed: List[Tuple[Dict, List[Dict]]]) -> ValidationReport:
+    """
+    작업 매니페스트 생성 전 검사: 파싱한 모든 작업의 시트 결과를 검사 보고서로 모음
+
+    파싱할 때 시트마다 데이터 검사를 실행하므로 다시 읽지 않고 파싱 실패(검사 오류 포함)를 오류로 보고한다.
+
+    Args:
+        parsed: [(작업, parse_job 결과)]
+    """
+    report = ValidationReport()
+    for job, entries in parsed:
+        for entry in entries:
+            if 'course_data' in entry:
+                course_data = entry['course_data']
+                report.add_checked_sheet(job['input'], entry['sheet_name'], course_data.course_code,
+                                         course_data.total_lessons)
+            else:
+                report.add_sheet(job['input'], entry['sheet_name'], error=entry['error'])
+    report.finish()
+    return report
+
+
+def _validate(args, manifest_input: bool):
+    """
+    --validate: 대상 시트의 모든 행을 검사해 보고 (아무것도 생성하지 않음, 오류가 있으면 종료 코드 1)
+
+    대상: 작업 매니페스트는 작업별 시트, -s 면 그 시트, 아니면 'TTL' 제외 모든 시트
+    """
+    if manifest_input:
+        try:
+            jobs = load_jobs(args.input, args.template, args.output)
+        except ValueError as e:
+            print(f"❌ 오류: {e}")
+            sys.exit(1)
+        targets = [(job['input'], job['sheets']) for job in jobs]
+    elif args.sheet is not None and not args.all_sheets:
+        targets = [(args.input, [int(args.sheet) if args.sheet.isdigit() else args.sheet])]
+    else:
+        targets = [(args.input, None)]
+
+    report = ValidationReport()
+    for input_file, sheets in targets:
+        validate_file(report, input_file, sheets, engine=args.engine)
+    report.finish()
+
+    if args.validate == 'json':
+        print(report.to_json())
+    else:
+        print(f"🔍 데이터 검사: {args.input}")
+        print()
+        report.print_summary()
+
+    if report.error_count:
+        sys.exit(1)
+
+
+def _watch_targets(args, fingerprints: Dict) -> List:
+    """
+    감시 대상 시트 (--all-sheets: TTL 제외 전체, -s: 지정 시트, 기본: 첫 번째 시트)
+
+    Raises:
+        ValueError: 지정한 시트가 없는 경우
+    """
+    sheet_names = list(fingerprints)
+    if sheet_names == [None]:
+        return [None]  # CSV 등 시트가 없는 형식
+    if args.all_sheets:
+        return [name for name in sheet_names if name != 'TTL']
+    if args.sheet is None:
+        return sheet_names[:1]
+    if args.sheet.isdigit() and int(args.sheet) < len(sheet_names):
+        return [sheet_names[int(args.sheet)]]
+    if args.sheet in sheet_names:
+        return [args.sheet]
+
+    available_sheets = ', '.join([f"'{name}'" for name in sheet_names])
+    raise ValueError(f"시트를 찾을 수 없습니다: {args.sheet}\n사용 가능한 시트: {available_sheets}")
+
+
+def _log_watch_cycle(args, started_at: datetime, cycle: int, changed: List, removed: List,
+                     batch_results: list):
+    """감시 모드 한 주기 결과를 생성 이력에 기록 (주기마다 실행 하나)"""
+    details = {
+        "cycle": cycle,
+        "started_at": started_at.isoformat(),
+        "changed_sheets": changed,
+        "removed_sheets": removed,
+    }
+    with HistoryStore() as store:
+        batch_log = BatchLogWriter(store, args.input, args.output, args.template,
+                                   batch_type="watch", details=details)
+        for result in batch_results:
+            batch_log.add(result)
+        batch_log.close()
+    print(f"📝 감시 이력 추가: {store.db_path} (주기 {cycle}, 실행 #{batch_log.run_id})")
+
+
+def _regenerate_sheets(args, changed: List, targets: List, checked_sheets: Dict[str, Tuple]) -> Optional[list]:
+    """
+    감시 모드: 바뀐 시트 검사 후 다시 생성
+
+    바뀐 시트는 생성 전에 모두 검사하고, 바뀌지 않은 시트(이전 주기에 검사 통과)의 과정 코드와도 비교한다.
+
+    Args:
+        changed: 바뀐 시트 (CSV는 [None])
+        targets: 감시 대상 시트 전체
+        checked_sheets: 검사를 통과한 시트 {시트: (과정 코드, 행 수)} (이번 주기 결과로 갱신됨)
+
+    Returns:
+        배치 결과 리스트 (데이터 오류가 있어 아무것도 생성하지 않았으면 None)
+    """
+    if changed == [None]:
+        return [_process_sheet(args, None)]  # CSV: 시트 하나 (파싱 중 검사)
+
+    with WorkbookSession(args.input, engine=args.engine) as workbook:
+        unchanged = {sheet: checked_sheets[sheet] for sheet in targets
+                     if sheet not in changed and sheet in checked_sheets}
+        report, sheet_columns = _check_sheets(args, workbook, changed, unchanged)
+        if report.error_count:
+            _print_check_failure(report)
+            return None
+
+        for sheet in list(checked_sheets):
+            if sheet not in targets:
+                del checked_sheets[sheet]
+        for entry in report.sheets:
+            if entry['sheet'] in changed:
+                checked_sheets[entry['sheet']] = (entry['course_code'], entry['rows'])
+
+        return _run_sheets(args, workbook, changed, sheet_columns)
+
+
+def _watch(args):
+    """입력 파일 감시: 저장될 때마다 내용이 바뀐 시트만 다시 생성 (Ctrl+C로 종료)"""
+    watcher = FileWatcher(args.input, debounce=args.debounce)
+
+    started_at = datetime.now()
+
+    fingerprints: Dict = {}
+    checked_sheets: Dict[str, Tuple] = {}  # 검사를 통과한 시트 {시트: (과정 코드, 행 수)}
+    cycle = 0
+
+    try:
+        while True:
+            try:
+                current = sheet_fingerprints(args.input)
+                targets = _watch_targets(args, current)
+            except (OSError, ValueError) as e:
+                # 저장 중이던 파일 등: 다음 변경을 기다렸다가 다시 시도
+                print(f"⚠️  입력 파일을 읽을 수 없습니다: {e}")
+                targets = None
+
+            if targets is not None:
+                changed = [sheet for sheet in targets if fingerprints.get(sheet) != current[sheet]]
+                removed = [sheet for sheet in fingerprints if sheet not in current]
+                first_cycle = not fingerprints and cycle == 0
+                fingerprints = {sheet: current[sheet] for sheet in targets}
+
+                if changed:
+                    cycle += 1
+                    if first_cycle:
+                        print(f"🔄 감시 시작: 시트 {len(changed)}개 생성 (주기 {cycle})")
+                    else:
+                        print(f"🔄 변경된 시트 {len(changed)}개 다시 생성 (주기 {cycle})")
+                    batch_results = _regenerate_sheets(args, changed, targets, checked_sheets)
+                    if batch_results is None:
+                        # 데이터 오류: 아무것도 쓰지 않고 다음 저장 때 다시 검사
+                        for sheet in changed:
+                            fingerprints.pop(sheet, None)
+                    else:
+                        # 실패한 시트는 다음 저장 때 다시 시도
+                        for result in batch_results:
+                            if result['status'] == 'failed':
+                                fingerprints.pop(result['sheet_name'], None)
+
+                        if not args.dry_run:
+                            _log_watch_cycle(args, started_at, cycle, changed, removed, batch_results)
+
+                        # --check-links: 다시 생성한 시트의 링크만 (이미 확인한 링크는 캐시)
+                        links = _link_set(args)
+                        if links is not None:
+                            for result in batch_results:
+                                links.add_result(result)
+                            _check_links(args, links)
+                else:
+                    print("✅ 내용이 바뀐 시트가 없습니다")
+
+            print()
+            print(f"👀 변경 감시 중: {args.input} (Ctrl+C로 종료)")
+            watcher.wait_for_change()
+            print()
+            print(f"📥 변경 감지: {datetime.now().strftime('%H:%M:%S')}")
+
+    except KeyboardInterrupt:
+        print()
+        print(f"👋 감시 종료 (총 {cycle}회 생성)")
+
+
+def _serve(args):
+    """생성 서버 실행 (Ctrl+C로 종료)"""
+    from .server import GenerationServer
+
+    server = GenerationServer(
+        workers=args.jobs,
+        defaults={
+            "output": args.output,
+            "template": args.template,
+            "index_mode": args.index_mode,
+            "output_format": args.output_format,
+            "engine": args.engine,
+            "no_cache": args.no_cache,
+        }
+    )
+    try:
+        server.serve(args.serve)
+    except ValueError as e:
+        print(f"❌ 오류: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print()
+        print("👋 서버 종료")
+
+
+# history 하위 명령 (첫 인자가 명령이 아니면 list)
+HISTORY_COMMANDS = ('list', 'prune', 'import', 'stats')
+
+
+def _parse_since(value: str) -> datetime:
+    """--since 값 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM)"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식이 아닙니다: {value} (예: 2025-11-19)")
+
+
+def _print_history(entries: List[Dict]):
+    """과정 이력 목록 출력 (최근 순)"""
+    if not entries:
+        print("📭 조건에 맞는 생성 이력이 없습니다.")
+        return
+
+    print(f"📜 생성 이력 ({len(entries)}건, 최근 순):")
+    for entry in entries:
+        generated_at = entry['generated_at'][:16].replace('T', ' ')
+        if entry['status'] == 'success':
+            print(f"   ✅ {generated_at}  {entry['course_code']}  {entry['total_lessons']}차시  "
+                  f"{entry['template']}  [{entry['batch_type']} #{entry['run_id']}]")
+            print(f"      {entry['input_file']} → {entry['output_dir']}")
+        else:
+            print(f"   ❌ {generated_at}  {entry['sheet_name']} 실패: {entry['error']}  "
+                  f"[{entry['batch_type']} #{entry['run_id']}]")
+            print(f"      {entry['input_file']}")
+
+
+def _history_main(argv: List[str]):
+    """생성 이력 조회/정리/가져오기 (python -m content_generator history ...)"""
+    parser = argparse.ArgumentParser(
+        prog='python -m content_generator history',
+        description=f'생성 이력 조회/정리 ({history_db_path()})',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+사용 예시:
+  # 25ctvibec를 마지막으로 언제, 어떤 파일로 생성했는지
+  python -m content_generator history 25ctvibec --limit 1
+
+  # 최근 생성 이력 20건 / 25ct로 시작하는 과정 / 특정 입력 파일 / 특정 날짜 이후
+  python -m content_generator history
+  python -m content_generator history "25ct*"
+  python -m content_generator history --input 25ctvibec.xlsx --since 2025-11-01
+
+  # 90일 지난 이력 삭제, 최근 실행 100개만 남기기
+  python -m content_generator history prune --older-than 90
+  python -m content_generator history prune --keep 100
+
+  # 이전 버전의 history/*.json 이력 가져오기 (가져온 파일 삭제)
+  python -m content_generator history import --remove
+        '''
+    )
+    subparsers = parser.add_subparsers(dest='command')
+
+    list_parser = subparsers.add_parser('list', help='과정 이력 조회 (기본 명령)')
+    list_parser.add_argument('course_code', nargs='?', help='과정 코드 (끝에 *를 붙이면 접두사 검색, 예: "25ct*")')
+    list_parser.add_argument('-i', '--input', help='입력 파일 (경로 또는 파일 이름)')
+    list_parser.add_argument('--since', type=_parse_since, help='이 날짜 이후만 (예: 2025-11-19)')
+    list_parser.add_argument('--status', choices=['success', 'failed'], help='성공/실패만')
+    list_parser.add_argument('-n', '--limit', type=int, default=20, help='최대 개수 (기본: 20, 0: 전체)')
+    list_parser.add_argument('--json', action='store_true', help='JSON으로 출력 (차시 목록 포함)')
+
+    prune_parser = subparsers.add_parser('prune', help='오래된 이력 삭제')
+    prune_parser.add_argument('--older-than', type=int, metavar='DAYS', help='이 일수보다 오래된 실행 삭제')
+    prune_parser.add_argument('--keep', type=int, metavar='N', help='최근 실행 N개만 남기기')
+
+    import_parser = subparsers.add_parser('import', help='이전 버전의 JSON 이력 파일 가져오기')
+    import_parser.add_argument('files', nargs='*',
+                               help='가져올 파일 (기본: history/ 폴더의 *.json)')
+    import_parser.add_argument('--remove', action='store_true', help='가져온 파일 삭제')
+
+    subparsers.add_parser('stats', help='저장된 실행/과정 수')
+
+    if not argv or (argv[0] not in HISTORY_COMMANDS and argv[0] not in ('-h', '--help')):
+        argv = ['list'] + argv
+    args = parser.parse_args(argv)
+
+    with HistoryStore() as store:
+        if args.command == 'list':
+            if args.limit < 0:
+                list_parser.error('--limit 은 0 이상이어야 합니다')
+            entries = store.courses(course_code=args.course_code, input_file=args.input, since=args.since,
+                                    status=args.status, limit=args.limit or None)
+            if args.json:
+                print(json.dumps(entries, ensure_ascii=False, indent=2))
+            else:
+                _print_history(entries)
+
+        elif args.command == 'prune':
+            if args.older_than is None and args.keep is None:
+                prune_parser.error('--older-than 또는 --keep 이 필요합니다')
+            if (args.older_than is not None and args.older_than < 0) or (args.keep is not None and args.keep < 0):
+                prune_parser.error('--older-than, --keep 은 0 이상이어야 합니다')
+            older_than = None
+            if args.older_than is not None:
+                older_than = datetime.now() - timedelta(days=args.older_than)
+            removed = store.prune(older_than=older_than, keep_runs=args.keep)
+            print(f"🧹 실행 {removed}개 삭제 (남은 실행 {store.stats()['runs']}개)")
+
+        elif args.command == 'import':
+            files = [Path(name) for name in args.files] or sorted(store.db_path.parent.glob('*.json'))
+            if not files:
+                print(f"📭 가져올 이력 파일이 없습니다: {store.db_path.parent}")
+                return
+
+            total = 0
+            for history_file in files:
+                try:
+                    imported = store.import_file(history_file)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  건너뜀: {e}")
+                    continue
+                total += imported
+                print(f"   - {history_file.name}: 실행 {imported}개" + ("" if imported else " (이미 가져옴)"))
+                if args.remove:
+                    history_file.unlink()
+            print(f"📥 이력 가져오기 완료: 실행 {total}개 → {store.db_path}")
+
+        else:
+            stats = store.stats()
+            print(f"📊 생성 이력: {store.db_path}")
+            print(f"   - 실행: {stats['runs']}개, 과정: {stats['courses']}개")
+            if stats['runs']:
+                print(f"   - 기간: {stats['oldest'][:16]} ~ {stats['newest'][:16]}")
 
 
 def main():
     """메인 함수"""
+    # 이력 조회/정리: python -m content_generator history ...
+    if len(sys.argv) > 1 and sys.argv[1] == 'history':
+        _history_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description='교육 콘텐츠 폴더 구조 자동 생성 도구',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -101,6 +809,22 @@ def main():
   # 모든 시트 일괄 처리 (TTL 제외)
   python -m content_generator -i 25ctvibec.xlsx --all-sheets
 
+  # 모든 시트를 4개 프로세스로 병렬 처리
+  python -m content_generator -i 25ctvibec.xlsx --all-sheets --jobs 4
+
+  # 여러 워크북: 작업 매니페스트(.json), 폴더, 글롭 패턴 (워커 풀 하나로 처리)
+  python -m content_generator -i jobs.json --jobs 4
+  python -m content_generator -i ~/Downloads/2025-2학기 -o ~/projects/contents_it/subjects
+
+  # 대용량 시트: 스트리밍 엔진으로 메모리 사용량 줄이기
+  python -m content_generator -i 25ctvibec.xlsx --all-sheets --engine openpyxl
+
+  # pandas 없이 xlsx를 직접 읽는 엔진 (시작/파싱 시간 단축)
+  python -m content_generator -i 25ctvibec.xlsx --all-sheets --engine native
+
+  # CDN 업로드용: 과정마다 폴더 대신 zip 파일 하나로 출력
+  python -m content_generator -i 25ctvibec.xlsx --all-sheets --output-format zip
+
   # 템플릿 지정
   python -m content_generator -i 25ctvibec.xlsx -t ct2022
 
@@ -110,13 +834,35 @@ def main():
 
   # 미리보기만 (실제 생성 안 함)
   python -m content_generator -i 25ctvibec.xlsx --dry-run
+
+  # 파일을 저장할 때마다 바뀐 시트만 다시 생성 (Ctrl+C로 종료)
+  python -m content_generator -i 25ctvibec.xlsx --all-sheets --watch
+
+  # 생성 서버: 프로세스를 띄워 두고 HTTP로 작업 받기 (워커 4개)
+  python -m content_generator --serve 127.0.0.1:8765 --jobs 4
+  python -m content_generator --serve unix:/tmp/content-generator.sock
+
+  # 생성하지 않고 모든 시트의 데이터 검사 (문제마다 행 번호, 오류가 있으면 종료 코드 1)
+  python -m content_generator -i 25ctvibec.xlsx --validate
+  python -m content_generator -i jobs.json --validate json > report.json
+
+  # 영상/다운로드 링크 검사 (깨진 링크가 있으면 종료 코드 1, 정상 링크는 24시간 캐시)
+  python -m content_generator -i 25ctvibec.xlsx --all-sheets --dry-run --check-links
+
+  # 단계별 시간, 파일 작업 수, 시트별 최대 메모리 측정
+  python -m content_generator -i 25ctvibec.xlsx --all-sheets --profile
+
+  # 생성 이력 조회/정리 (자세한 옵션: history --help)
+  python -m content_generator history 25ctvibec
+  python -m content_generator history prune --older-than 90
         '''
     )
 
     parser.add_argument(
         '-i', '--input',
         required=False,
-        help='입력 파일 (엑셀, CSV) 또는 구글 시트 URL'
+        help='입력 파일 (엑셀, CSV) 또는 구글 시트 URL. '
+             '여러 워크북은 작업 매니페스트(.json), 폴더, 글롭 패턴 ("terms/*.xlsx")'
     )
 
     parser.add_argument(
@@ -127,9 +873,32 @@ def main():
 
     parser.add_argument(
         '-t', '--template',
-        choices=['ct2022', 'it2023', 'auto'],
+        choices=get_registry().names() + [AUTO_TEMPLATE],
         default='ct2022',
-        help='템플릿 선택 (기본: ct2022)'
+        help='템플릿 선택 (기본: ct2022, auto: 과정 코드로 자동 선택)'
+    )
+
+    parser.add_argument(
+        '--index-mode',
+        choices=list(INDEX_MODES),
+        default='copy',
+        help='index.html 출력 방식 (기본: copy). hardlink: 과정당 한 번 쓰고 각 차시에 하드링크 '
+             '(지원하지 않으면 reflink 또는 복사)'
+    )
+
+    parser.add_argument(
+        '--output-format',
+        choices=list(OUTPUT_FORMATS),
+        default='dir',
+        help='출력 형식 (기본: dir). zip/tar.gz: 과정 폴더 대신 과정당 압축 파일 하나에 바로 기록 '
+             '({과정코드}.zip, 안의 경로/권한은 폴더 출력과 동일)'
+    )
+
+    parser.add_argument(
+        '--writer-threads',
+        type=int,
+        default=1,
+        help='폴더/파일 쓰기 스레드 수 (기본: 1). NFS 등 네트워크 경로에 출력할 때 늘리면 빨라짐'
     )
 
     parser.add_argument(
@@ -167,8 +936,108 @@ def main():
         help='엑셀 파일의 모든 시트 처리 (\'TTL\' 시트 제외)'
     )
 
+    parser.add_argument(
+        '--engine',
+        choices=list(ENGINES),
+        default='pandas',
+        help='엑셀 파서 엔진 (기본: pandas). openpyxl: DataFrame 없이 행 단위 스트리밍 (대용량 시트 메모리 절약), native: pandas/openpyxl 없이 xlsx 직접 읽기 (가장 빠름)'
+    )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='--all-sheets, 작업 매니페스트 병렬 처리 프로세스 수 (기본: 1, 순차 처리). --serve에서는 작업 워커 수'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='파싱 결과 캐시(~/.content-generator/cache)를 쓰지 않고 항상 다시 파싱'
+    )
+
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='입력 파일을 감시하며 저장될 때마다 내용이 바뀐 시트만 다시 생성 (Ctrl+C로 종료)'
+    )
+
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=f'--watch: 마지막 저장 후 이 시간(초) 동안 더 바뀌지 않으면 다시 생성 (기본: {DEFAULT_DEBOUNCE:g})'
+    )
+
+    parser.add_argument(
+        '--serve',
+        metavar='ADDRESS',
+        help='생성 서버 모드: 프로세스를 띄워 두고 HTTP로 작업을 받음. '
+             '주소는 127.0.0.1:8765 형식(루프백만) 또는 unix:/tmp/content-generator.sock (워커 수는 --jobs)'
+    )
+
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='단계별 시간, mkdir/write/chmod 횟수, 쓴 바이트, 시트별 최대 메모리를 측정해 '
+             '마지막에 출력하고 생성 이력에 저장 (메모리 추적으로 조금 느려짐)'
+    )
+
+    parser.add_argument(
+        '--validate',
+        nargs='?',
+        const='text',
+        choices=['text', 'json'],
+        help='생성하지 않고 대상 시트(-s 가 없으면 \'TTL\' 제외 모든 시트)의 모든 행을 검사해 '
+             '문제를 행 번호와 함께 출력 (오류가 있으면 종료 코드 1). json: JSON 보고서'
+    )
+
+    parser.add_argument(
+        '--check-links',
+        action='store_true',
+        help='강의영상/다운로드/guide 링크마다 HEAD 요청을 보내 깨진 링크를 출력 (있으면 종료 코드 1). '
+             '정상 링크는 ~/.content-generator/link_cache.json 에 저장해 --link-cache-ttl 동안 다시 검사하지 않음'
+    )
+
+    parser.add_argument(
+        '--link-concurrency',
+        type=int,
+        default=4,
+        help='--check-links: 호스트당 동시 요청 수 (기본: 4, 연결은 keep-alive로 재사용)'
+    )
+
+    parser.add_argument(
+        '--link-timeout',
+        type=float,
+        default=10.0,
+        help='--check-links: 요청 하나의 제한 시간(초) (기본: 10)'
+    )
+
+    parser.add_argument(
+        '--link-cache-ttl',
+        type=float,
+        default=24.0,
+        metavar='HOURS',
+        help='--check-links: 정상 링크 캐시 유지 시간(시간) (기본: 24, 0: 캐시 사용 안 함)'
+    )
+
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error('--jobs 는 1 이상이어야 합니다')
+    if args.writer_threads < 1:
+        parser.error('--writer-threads 는 1 이상이어야 합니다')
+    if args.debounce < 0:
+        parser.error('--debounce 는 0 이상이어야 합니다')
+    if args.link_concurrency < 1:
+        parser.error('--link-concurrency 는 1 이상이어야 합니다')
+    if args.link_timeout <= 0:
+        parser.error('--link-timeout 은 0보다 커야 합니다')
+    if args.link_cache_ttl < 0:
+        parser.error('--link-cache-ttl 은 0 이상이어야 합니다')
+    if args.serve and args.check_links:
+        parser.error('--check-links 는 --serve 와 함께 사용할 수 없습니다')
+
     # 저장된 설정 사용
     if args.use_last:
         if not config.has_config():
@@ -190,6 +1059,15 @@ def main():
             args.output = saved_config['output']
         if args.template == 'ct2022':  # 기본값인 경우
             args.template = saved_config['template']
+        if args.template not in get_registry().names() + [AUTO_TEMPLATE]:
+            print(f"❌ 저장된 설정의 템플릿을 찾을 수 없습니다: {args.template}")
+            print(f"   사용 가능: {', '.join(get_registry().names() + [AUTO_TEMPLATE])}")
+            sys.exit(1)
+
+    # 서버 모드: 입력 파일은 작업마다 받음
+    if args.serve:
+        _serve(args)
+        return
 
     # 입력 파일 확인
     if not args.input:
@@ -197,108 +1075,50 @@ def main():
         print("   -i 옵션으로 입력 파일을 지정하거나, --use-last 옵션을 사용하세요.")
         sys.exit(1)
 
+    # 작업 매니페스트(.json), 폴더, 글롭 패턴: 여러 워크북 처리
+    manifest_input = is_manifest_input(args.input)
+    if manifest_input and args.watch:
+        print("❌ 오류: --watch 는 입력 파일 하나에만 사용할 수 있습니다.")
+        sys.exit(1)
+
     # 파일 존재 확인
     input_path = Path(args.input)
-    if not input_path.exists():
+    if not manifest_input and not input_path.exists():
         print(f"❌ 오류: 파일을 찾을 수 없습니다: {args.input}")
         sys.exit(1)
 
+    # 데이터 검사만
+    if args.validate:
+        _validate(args, manifest_input)
+        return
+
+    if args.profile:
+        profiler.start()
+
+    broken_links = 0
     try:
         print("=" * 60)
         print("📚 Content Generator v1.0.0")
         print("=" * 60)
         print()
 
-        # --all-sheets 옵션: 모든 시트 처리
-        if args.all_sheets:
-
-            # 모든 시트 이름 가져오기
-            sheet_names = get_sheet_names(args.input)
-            # 'TTL' 제외
-            target_sheets = [name for name in sheet_names if name != 'TTL']
-
-            if not target_sheets:
-                print("❌ 처리할 시트가 없습니다. (TTL 제외)")
-                sys.exit(1)
-
-            print(f"📋 처리할 시트 목록 ({len(target_sheets)}개):")
-            for sheet in target_sheets:
-                print(f"   - {sheet}")
-            print()
-
-            # 각 시트마다 처리
-            success_count = 0
-            fail_count = 0
-            batch_results = []  # 배치 처리 결과 저장
-
-            for sheet in target_sheets:
-                print("=" * 60)
-                print(f"📄 시트 처리 중: {sheet}")
-                print("=" * 60)
-
-                try:
-                    # 파싱
-                    course_data = parse_course_file(args.input, sheet)
-
-                    if args.verbose:
-                        print(f"   - 과정 코드: {course_data['course_code']}")
-                        print(f"   - 과정명: {course_data['subject']}")
-                        print(f"   - 총 차시: {course_data['total_lessons']}")
-                        print(f"   - 챕터 수: {len(course_data['chapters'])}")
-                    print("✅ 파싱 완료")
-                    print()
-
-                    # 생성
-                    generator = ContentGenerator(
-                        course_data=course_data,
-                        output_dir=args.output,
-                        template=args.template,
-                        input_file=args.input  # 실제 파일 경로 전달
-                    )
+        # 작업 매니페스트/폴더/글롭: 여러 워크북을 워커 풀 하나로 처리
+        if manifest_input:
+            broken_links = _process_manifest(args)
 
-                    generator.generate(dry_run=args.dry_run)
-
-                    if not args.dry_run:
-                        print(f"✅ {course_data['course_code']} 생성 완료")
-                        print()
-                        success_count += 1
-
-                        # 배치 결과에 추가
-                        batch_results.append({
-                            "sheet_name": sheet,
-                            "course_code": course_data['course_code'],
-                            "status": "success",
-                            "generator": generator
-                        })
-
-                except Exception as e:
-                    print(f"❌ {sheet} 시트 처리 실패: {e}")
-                    if args.verbose:
-                        import traceback
-                        traceback.print_exc()
-                    print()
-                    fail_count += 1
-
-                    # 실패한 경우도 기록
-                    batch_results.append({
-                        "sheet_name": sheet,
-                        "course_code": None,
-                        "status": "failed",
-                        "error": str(e)
-                    })
-                    continue
+            if args.save_config and not args.dry_run:
+                print()
+                config.save_config(input_file=args.input, output_dir=args.output, template=args.template)
 
-            # 최종 결과
-            print("=" * 60)
-            print(f"📊 전체 처리 결과")
-            print(f"   - 성공: {success_count}개")
-            print(f"   - 실패: {fail_count}개")
-            print(f"   - 총: {len(target_sheets)}개")
-            print("=" * 60)
+        # --watch 옵션: 바뀐 시트만 반복 생성
+        elif args.watch:
+            _watch(args)
 
-            # 배치 작업 로그 생성
-            if not args.dry_run and batch_results:
-                _create_batch_log(args.input, args.output, args.template, batch_results)
+        # --all-sheets 옵션: 모든 시트 처리
+        elif args.all_sheets:
+            # 워크북은 한 번만 열어 모든 시트에서 공유
+            with WorkbookSession(args.input, engine=args.engine) as workbook:
+                broken_links = _process_all_sheets(args, workbook)
 
         # 단일 시트 처리 (기존 로직)
         else:
@@ -311,13 +1131,19 @@ def main():
             if sheet_name and sheet_name.isdigit():
                 sheet_name = int(sheet_name)
 
-            course_data = parse_course_file(args.input, sheet_name)
+            active_profiler = profiler.active()
+            if active_profiler is not None:
+                active_profiler.begin_sheet(str(sheet_name if sheet_name is not None else input_name))
+
+            with profiler.phase('parse'):
+                course_data = parse_course_file(args.input, sheet_name, engine=args.engine,
+                                                cache=_course_cache(args))
 
             if args.verbose:
-                print(f"   - 과정 코드: {course_data['course_code']}")
-                print(f"   - 과정명: {course_data['subject']}")
-                print(f"   - 총 차시: {course_data['total_lessons']}")
-                print(f"   - 챕터 수: {len(course_data['chapters'])}")
+                print(f"   - 과정 코드: {course_data.course_code}")
+                print(f"   - 과정명: {course_data.subject}")
+                print(f"   - 총 차시: {course_data.total_lessons}")
+                print(f"   - 챕터 수: {len(course_data.chapters)}")
             print("✅ 파싱 완료")
             print()
 
@@ -326,16 +1152,24 @@ def main():
                 course_data=course_data,
                 output_dir=args.output,
                 template=args.template,
-                input_file=args.input
+                input_file=args.input,
+                index_mode=args.index_mode,
+                writer_threads=args.writer_threads,
+                verbose=args.verbose,
+                output_format=args.output_format
             )
 
-            generator.generate(dry_run=args.dry_run)
+            with profiler.phase('generate'):
+                generator.generate(dry_run=args.dry_run)
+
+            if active_profiler is not None:
+                active_profiler.end_sheet()
 
             if not args.dry_run:
                 print()
                 print("=" * 60)
-                print(f"🎉 성공! {course_data['course_code']} 생성 완료")
-                print(f"📂 위치: {Path(args.output) / course_data['course_code']}")
+                print(f"🎉 성공! {course_data.course_code} 생성 완료")
+                print(f"📂 위치: {generator.output_path}")
                 print("=" * 60)
 
                 # 설정 저장
@@ -350,6 +1184,21 @@ def main():
                     print("💡 다음번에는 --use-last 옵션으로 간편하게 실행하세요:")
                     print(f"   python3 -m content_generator --use-last")
 
+            # 3. 링크 검사
+            links = _link_set(args)
+            if links is not None:
+                links.add_result(success_result(sheet_name, generator,
+                                                status="planned" if args.dry_run else "success"))
+                broken_links = _check_links(args, links)
+
+        # 프로파일 요약
+        if profiler.active() is not None:
+            profiler.active().print_summary()
+            profiler.stop()
+
+        if broken_links:
+            sys.exit(1)
+
     except Exception as e:
         print(f"\n❌ 오류 발생: {e}")
         if args.verbose:
@@ -0,0 +1,126 @@
+"""
+압축 파일 출력 모듈 (--output-format zip / tar.gz)
+
+생성 파일을 폴더에 하나씩 쓰지 않고 과정당 압축 파일 하나에 바로 기록한다.
+파일마다 내용을 한 번만 메모리에 두고 곧바로 압축 스트림에 쓰므로
+메모리 사용량은 과정 크기와 관계없이 가장 큰 파일 하나 정도로 유지된다.
+(zip은 형식상 끝에 쓰는 중앙 디렉터리용으로 항목당 작은 메타데이터를 보관, tar.gz는 보관하지 않음)
+
+압축 파일 안의 경로와 권한은 폴더 출력과 같다.
+    {과정코드}/subjects.json, {과정코드}/{차시}/index.html, {과정코드}/{차시}/assets/data/data.json
+    파일 0644, 폴더 0755
+"""
+
+import io
+import os
+import tarfile
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from .plan import FILE_MODE, DIRECTORY_MODE
+
+
+# 출력 형식 → 파일 확장자
+ARCHIVE_EXTENSIONS = {
+    'zip': '.zip',
+    'tar.gz': '.tar.gz',
+}
+
+
+class ArchiveWriter:
+    """과정 압축 파일 쓰기 (임시 파일에 쓰고 close()에서 교체)"""
+
+    def __init__(self, archive_path: Path, archive_format: str):
+        """
+        Args:
+            archive_path: 만들 압축 파일 경로
+            archive_format: 'zip' 또는 'tar.gz'
+
+        Raises:
+            ValueError: 지원하지 않는 형식인 경우
+        """
+        if archive_format not in ARCHIVE_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 압축 형식: {archive_format}")
+
+        self.archive_path = Path(archive_path)
+        self.archive_format = archive_format
+        self.bytes_written = 0
+        self._mtime = time.time()
+
+        self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=self.archive_path.parent, prefix=f'.{self.archive_path.name}.')
+        self._temp_path = Path(temp_name)
+        self._file = os.fdopen(fd, 'wb')
+
+        if archive_format == 'zip':
+            self._archive = zipfile.ZipFile(self._file, 'w', compression=zipfile.ZIP_DEFLATED)
+        else:
+            self._archive = tarfile.open(fileobj=self._file, mode='w:gz', format=tarfile.PAX_FORMAT)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add_directory(self, relative_path: str):
+        """폴더 항목 추가 (권한 0755)"""
+        name = relative_path.rstrip('/') + '/'
+        if self.archive_format == 'zip':
+            info = zipfile.ZipInfo(name, date_time=time.localtime(self._mtime)[:6])
+            info.external_attr = (0o40000 | DIRECTORY_MODE) << 16 | 0x10  # S_IFDIR + MS-DOS 폴더 플래그
+            self._archive.writestr(info, b'')
+        else:
+            info = tarfile.TarInfo(name.rstrip('/'))
+            info.type = tarfile.DIRTYPE
+            info.mode = DIRECTORY_MODE
+            info.mtime = self._mtime
+            self._archive.addfile(info)
+            self._archive.members.clear()
+
+    def add_file(self, relative_path: str, content: bytes, mode: int = FILE_MODE) -> int:
+        """
+        파일 항목 추가 (기본 권한 0644)
+
+        Returns:
+            추가한 바이트 수 (압축 전)
+        """
+        if self.archive_format == 'zip':
+            info = zipfile.ZipInfo(relative_path, date_time=time.localtime(self._mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = (0o100000 | mode) << 16  # S_IFREG
+            self._archive.writestr(info, content)
+        else:
+            info = tarfile.TarInfo(relative_path)
+            info.size = len(content)
+            info.mode = mode
+            info.mtime = self._mtime
+            self._archive.addfile(info, io.BytesIO(content))
+            self._archive.members.clear()  # 쓰기 전용이라 추가한 항목 목록은 필요 없음
+
+        self.bytes_written += len(content)
+        return len(content)
+
+    def close(self):
+        """압축 파일 마무리 후 최종 경로로 교체 (권한 0644)"""
+        self._archive.close()
+        self._file.close()
+        self._temp_path.chmod(FILE_MODE)
+        os.replace(self._temp_path, self.archive_path)
+
+    def abort(self):
+        """쓰던 임시 파일 삭제 (기존 압축 파일은 그대로 둠)"""
+        try:
+            self._archive.close()
+        except Exception:
+            pass
+        self._file.close()
+        try:
+            self._temp_path.unlink()
+        except OSError:
+            pass
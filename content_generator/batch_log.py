@@ -0,0 +1,112 @@
+"""
+배치 결과 기록 모듈
+
+시트별 처리 결과(배치 결과)를 생성 이력(history/)에 남기는 요약 형식으로 변환한다.
+CLI 배치, --watch, 작업 매니페스트, 생성 서버 작업이 같은 형식을 쓴다.
+
+배치 결과 항목 (생성기 대신 과정 요약을 바로 담아 과정 데이터를 붙잡지 않음):
+    {"sheet_name": ..., "course_code": ..., "status": "success", "course": {과정 요약}}
+    {"sheet_name": ..., "course_code": None, "status": "failed", "error": "..."}
+    {"sheet_name": ..., "course_code": ..., "status": "planned", "course": {과정 요약}}  (--dry-run, 기록 안 함)
+
+배치 결과는 BatchLogWriter로 시트가 끝날 때마다 생성 이력 저장소(history.HistoryStore)에 기록한다.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+
+def success_result(sheet_name, generator, status: str = "success") -> Dict:
+    """
+    생성 완료한 시트의 배치 결과 (생성 직후 과정 요약만 남김)
+
+    Args:
+        sheet_name: 시트 이름
+        generator: 생성을 마친 ContentGenerator
+        status: success, 또는 --dry-run이면 planned (이력에 기록하지 않고 링크 검사에만 사용)
+    """
+    course_data = generator.course_data
+    return {
+        "sheet_name": sheet_name,
+        "course_code": course_data.course_code,
+        "status": status,
+        "course": {
+            "sheet_name": sheet_name,
+            "course_code": course_data.course_code,
+            "subject": course_data.subject,
+            "status": status,
+            "total_lessons": course_data.total_lessons,
+            "chapters": len(course_data.chapters),
+            "output_dir": str(generator.output_path),
+            "lessons": [
+                {
+                    "number": lesson.number,
+                    "title": lesson.title,
+                    "video_url": lesson.video_url,
+                    "download_url": lesson.download_url or generator._get_guide_for_lesson(lesson.index)
+                }
+                for lesson in course_data.lessons
+            ]
+        }
+    }
+
+
+def course_entry(result: Dict) -> Dict:
+    """배치 결과 하나 → 생성 이력에 남길 과정 요약 (planned는 서버 dry_run 응답용)"""
+    if result['status'] in ('success', 'planned'):
+        return result['course']
+    entry = {
+        "sheet_name": result['sheet_name'],
+        "status": "failed",
+        "error": result.get('error', 'Unknown error')
+    }
+    if 'input_file' in result:
+        entry["input_file"] = result['input_file']  # 작업 매니페스트: 워크북별 입력 파일
+    return entry
+
+
+def compact_result(result: Dict) -> Dict:
+    """이력에 기록한 배치 결과 → 메모리에 남길 최소 정보 (과정 요약 제외)"""
+    return {key: value for key, value in result.items() if key != 'course'}
+
+
+class BatchLogWriter:
+    """배치 결과를 시트가 끝날 때마다 생성 이력 저장소에 기록 (메모리에는 최소 결과만 유지)"""
+
+    def __init__(self, store, input_file: str, output_dir: str, template: str,
+                 batch_type: str = "all_sheets", generated_at: Optional[datetime] = None,
+                 details: Optional[Dict] = None):
+        """
+        Args:
+            store: 생성 이력 저장소 (history.HistoryStore)
+            input_file: 입력 파일
+            output_dir: 출력 디렉토리
+            template: 템플릿
+            batch_type: 배치 종류
+            generated_at: 기록 시각 (기본: 현재)
+            details: 배치 종류별 추가 정보 (--watch 주기 등)
+        """
+        self.store = store
+        self.run_id = store.begin_run(batch_type, input_file, output_dir, template,
+                                      generated_at=generated_at, details=details)
+        self.total_courses = 0
+        self.success_count = 0
+
+    def add(self, result: Dict) -> Dict:
+        """
+        배치 결과 하나 기록 (바로 커밋 - 중단되어도 끝난 시트까지는 남음)
+
+        Returns:
+            메모리에 남길 최소 결과 (compact_result)
+        """
+        entry = course_entry(result)
+        self.store.add_course(self.run_id, entry)
+        self.total_courses += 1
+        if entry['status'] == 'success':
+            self.success_count += 1
+        return compact_result(result)
+
+    def close(self, profile: Optional[Dict] = None):
+        """배치 기록 마무리 (--profile이면 측정값 저장)"""
+        self.store.finish_run(self.run_id, profile)
+
@@ -0,0 +1,182 @@
+"""
+파싱 결과 캐시 모듈
+
+같은 워크북을 다시 처리할 때(--use-last, --dry-run 후 실제 생성 등) 파싱을 건너뛰도록
+파싱된 과정 데이터를 ~/.content-generator/cache 에 저장한다.
+
+- 키: (파일 절대 경로, 크기, 수정 시각, 시트, 파서 로직 버전)
+- 형식: 요약 JSON 한 줄(과정 코드, 차시 수) + pickle + zlib 압축 (항목당 파일 하나)
+  생성 전 검사는 요약만 읽어 과정 데이터를 풀지 않는다
+- 정리: 최근 사용 순(LRU)으로 전체 크기 상한을 넘는 항목 삭제
+- 파서 로직 버전이 바뀌면 이전 버전 항목은 자동으로 삭제
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+
+from .config import CONFIG_DIR
+from .models import Course
+
+
+CACHE_DIR = CONFIG_DIR / 'cache'
+
+# 캐시 전체 크기 상한 (바이트)
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+CACHE_SUFFIX = '.pickle.z'
+
+
+class CourseCache:
+    """파싱된 과정 데이터 캐시"""
+
+    def __init__(self, version: int, cache_dir: Path = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        """
+        Args:
+            version: 파서 로직 버전 (CourseDataParser.LOGIC_VERSION)
+            cache_dir: 캐시 폴더
+            max_bytes: 캐시 전체 크기 상한
+        """
+        self.version = version
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def load(self, file_path: str, sheet_name) -> Optional[Course]:
+        """
+        캐시된 과정 데이터 읽기
+
+        Returns:
+            과정 데이터 (없거나 읽을 수 없으면 None)
+        """
+        entry = self._entry_path(file_path, sheet_name)
+        if entry is None:
+            return None
+
+        try:
+            with open(entry, 'rb') as f:
+                f.readline()  # 요약 줄
+                course_data = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 깨진 항목은 지우고 다시 파싱
+            self._remove(entry)
+            return None
+
+        # 최근 사용 시각 갱신 (LRU)
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return course_data
+
+    def load_summary(self, file_path: str, sheet_name) -> Optional[Dict]:
+        """
+        캐시 항목의 요약만 읽기 (과정 데이터는 풀지 않음)
+
+        Returns:
+            {"course_code", "total_lessons"} (없거나 읽을 수 없으면 None)
+        """
+        entry = self._entry_path(file_path, sheet_name)
+        if entry is None:
+            return None
+
+        try:
+            with open(entry, 'rb') as f:
+                summary = json.loads(f.readline())
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._remove(entry)
+            return None
+        if not isinstance(summary, dict) or 'course_code' not in summary or 'total_lessons' not in summary:
+            self._remove(entry)  # 요약이 없는 이전 형식 항목
+            return None
+        return summary
+
+    def contains(self, file_path: str, sheet_name) -> bool:
+        """캐시 항목 존재 여부"""
+        entry = self._entry_path(file_path, sheet_name)
+        return entry is not None and entry.is_file()
+
+    def store(self, file_path: str, sheet_name, course_data: Course):
+        """
+        과정 데이터 저장 (저장 실패는 무시 - 캐시는 없어도 동작)
+
+        Args:
+            file_path: 입력 파일 경로
+            sheet_name: 시트 이름 또는 인덱스
+            course_data: 파싱된 과정 데이터
+        """
+        entry = self._entry_path(file_path, sheet_name)
+        if entry is None:
+            return
+
+        temp_name = None
+        try:
+            summary = {"course_code": course_data.course_code, "total_lessons": course_data.total_lessons}
+            header = json.dumps(summary).encode('utf-8') + b'\n'
+            payload = header + zlib.compress(pickle.dumps(course_data, protocol=pickle.HIGHEST_PROTOCOL), 1)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # 다른 프로세스(--jobs)가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체
+            fd, temp_name = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_name, entry)
+        except (OSError, pickle.PicklingError):
+            if temp_name is not None:
+                self._remove(Path(temp_name))
+            return
+
+        self._evict()
+
+    def _entry_path(self, file_path: str, sheet_name) -> Optional[Path]:
+        """캐시 항목 경로 (입력 파일이 없으면 None)"""
+        path = Path(file_path).resolve()
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        # 시트는 None과 0을 같은 첫 번째 시트로 취급, 이름/인덱스는 구분
+        key = json.dumps([str(path), stat.st_size, stat.st_mtime_ns, repr(sheet_name or 0)])
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f'v{self.version}-{digest}{CACHE_SUFFIX}'
+
+    def _entries(self):
+        if not self.cache_dir.is_dir():
+            return []
+        return [path for path in self.cache_dir.iterdir() if path.name.endswith(CACHE_SUFFIX)]
+
+    def _evict(self):
+        """다른 버전 항목 삭제 후, 크기 상한을 넘으면 오래 안 쓴 항목부터 삭제"""
+        prefix = f'v{self.version}-'
+        entries = []
+        for entry in self._entries():
+            if not entry.name.startswith(prefix):
+                self._remove(entry)
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            self._remove(entry)
+            total -= size
+
+    @staticmethod
+    def _remove(entry: Path):
+        try:
+            entry.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,23 @@
+"""
+콘솔 출력 모듈
+
+워커 프로세스(--jobs, 작업 매니페스트, --serve)에서 작업의 콘솔 출력을 모아 두었다가
+작업 순서대로 한 번에 출력/응답할 수 있도록 한다.
+"""
+
+import io
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Tuple
+
+
+def run_captured(function, *args) -> Tuple[str, object]:
+    """
+    콘솔 출력(stdout, stderr)을 모아서 결과와 함께 반환
+
+    Returns:
+        (콘솔 출력, 함수 결과)
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        result = function(*args)
+    return buffer.getvalue(), result
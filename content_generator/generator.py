@@ -2,340 +2,621 @@
 컨텐츠 폴더 구조 생성 모듈
 """
 
+import errno
+import hashlib
 import json
+import os
 import shutil
+import threading
+from bisect import bisect_right
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
+from . import profiler
+from .archive import ArchiveWriter, ARCHIVE_EXTENSIONS
+from .history import HistoryStore
+from .json_encoder import JSON_ENCODERS, DEFAULT_JSON_ENCODER, encode_json, encode_subjects
+from .models import Course, Lesson
+from .plan import GenerationPlan, PlannedFile
+from .template_registry import get_registry
+from .writer import TreeWriter
+
+
+# 과정 폴더에 저장하는 생성 파일 목록 (경로 → 해시, 크기, 수정 시각)
+MANIFEST_FILENAME = '.manifest.json'
+
+# index.html 출력 방식 (copy: 차시마다 파일 쓰기, hardlink: 한 번 쓰고 하드링크로 공유)
+INDEX_MODES = ('copy', 'hardlink')
+
+# 출력 형식 (dir: 과정 폴더에 파일 쓰기, zip/tar.gz: 과정당 압축 파일 하나)
+OUTPUT_FORMATS = ('dir',) + tuple(ARCHIVE_EXTENSIONS)
+
+# Linux copy-on-write 복제 ioctl
+FICLONE = 0x40049409
+
+
+def _reflink(source: Path, target: Path):
+    """copy-on-write 복제 (지원하지 않는 환경이면 OSError)"""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.ENOTSUP, "reflink를 지원하지 않는 환경입니다")
+
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    target.chmod(0o644)
+    profiler.count('chmod')
+
 
 class ContentGenerator:
     """컨텐츠 생성기"""
 
-    def __init__(self, course_data: Dict, output_dir: str, template: str = "ct2022", input_file: str = None):
+    def __init__(self, course_data: Course, output_dir: str, template: str = "ct2022", input_file: str = None,
+                 index_mode: str = "copy", writer_threads: int = 1, verbose: bool = False,
+                 output_format: str = "dir", history_log: bool = True,
+                 json_encoder: str = DEFAULT_JSON_ENCODER):
         """
         Args:
-            course_data: 파싱된 과정 데이터
+            course_data: 파싱된 과정 데이터 (딕셔너리 형식이면 Course로 변환)
             output_dir: 출력 디렉토리
-            template: 템플릿 종류 (ct2022, it2023)
+            template: 템플릿 종류 (ct2022, it2023, auto: 과정 코드로 자동 선택)
             input_file: 입력 파일 경로 (문서화용)
+            index_mode: index.html 출력 방식 (copy, hardlink)
+            writer_threads: 폴더/파일 쓰기 스레드 수 (네트워크 파일 시스템용)
+            verbose: 상세 로그 출력 (쓰기 처리량 등)
+            output_format: 출력 형식 (dir, zip, tar.gz)
+            history_log: 생성 이력 저장 여부 (배치/감시 모드는 배치 단위로 따로 기록)
+            json_encoder: data.json/subjects.json 인코더 (fast, stdlib - 출력은 바이트 단위로 같음)
+
+        Raises:
+            ValueError: 지원하지 않는 옵션 값이나 없는 템플릿인 경우
         """
+        if index_mode not in INDEX_MODES:
+            raise ValueError(f"지원하지 않는 index.html 출력 방식: {index_mode}")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식: {output_format}")
+        if json_encoder not in JSON_ENCODERS:
+            raise ValueError(f"지원하지 않는 JSON 인코더: {json_encoder}")
+
+        if isinstance(course_data, dict):
+            # 직접 만든 과정 데이터
+            course_data = Course.from_dict(course_data)
+
         self.course_data = course_data
         self.output_dir = Path(output_dir)
-        self.template = template
-        self.course_code = course_data['course_code']
+        self.course_code = course_data.course_code
+        self.template = get_registry().resolve(template, self.course_code)
+        self._compiled_template = get_registry().get(self.template)
         self.course_dir = self.output_dir / self.course_code
         self.input_file = input_file
-
-    def generate(self, dry_run: bool = False):
+        self.manifest_file = self.course_dir / MANIFEST_FILENAME
+        self.output_format = output_format
+        if output_format == 'dir':
+            self.output_path = self.course_dir
+        else:
+            self.output_path = self.output_dir / f"{self.course_code}{ARCHIVE_EXTENSIONS[output_format]}"
+        self.index_mode = index_mode
+        self.history_log = history_log
+        self.json_encoder = json_encoder
+        self.write_stats = {"written": 0, "unchanged": 0, "removed": 0}
+        self.index_link_stats = {"hardlink": 0, "reflink": 0, "copy": 0}
+        self.writer_threads = writer_threads
+        self.verbose = verbose
+        self._hardlink_supported = True
+        self._stats_lock = threading.Lock()
+        self._previous_manifest: Dict[str, Dict] = {}
+        self._manifest: Dict[str, Dict] = {}
+
+    def __getstate__(self):
+        """프로세스 간 전달용 상태 (--jobs 결과 반환, 잠금 객체 제외)"""
+        state = self.__dict__.copy()
+        del state['_stats_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._stats_lock = threading.Lock()
+
+    def generate(self, dry_run: bool = False) -> Optional[GenerationPlan]:
         """
         폴더 구조 생성
 
         Args:
-            dry_run: True면 실제 생성하지 않고 미리보기만
+            dry_run: True면 실제 생성하지 않고 생성 계획(JSON)만 출력
+
+        Returns:
+            생성 계획 (압축 파일 출력은 메모리를 아끼려고 내용을 모아 두지 않으므로 None)
         """
         print(f"📁 생성할 과정: {self.course_code}")
-        print(f"📝 과정명: {self.course_data['subject']}")
-        print(f"📊 총 차시: {self.course_data['total_lessons']}")
+        print(f"📝 과정명: {self.course_data.subject}")
+        print(f"📊 총 차시: {self.course_data.total_lessons}")
         print(f"🎨 템플릿: {self.template}")
-        print(f"📂 출력 경로: {self.course_dir}")
+        print(f"📂 출력 경로: {self.output_path}")
         print()
 
         if dry_run:
-            print("🔍 [DRY RUN] 실제 생성 없이 미리보기:")
-            self._preview_structure()
-            return
-
-        # 실제 생성
-        self._create_course_structure()
-        self._create_subjects_json()
-        self._create_lesson_files()
-        self._create_generation_log()
-
+            with profiler.phase('generate.plan'):
+                plan = self.plan()
+            print("🔍 [DRY RUN] 실제 생성 없이 생성 계획만 출력:")
+            print(plan.to_json())
+            print(
+                f"📋 계획: 폴더 {len(plan.directories)}개, 파일 {len(plan.files)}개, "
+                f"{plan.total_bytes:,} 바이트"
+            )
+            return plan
+
+        if self.output_format != 'dir':
+            # 압축 파일 하나에 바로 기록 (계획을 파일 단위로 만들면서 기록)
+            with profiler.phase('generate.archive'):
+                self._create_archive()
+            if self.history_log:
+                with profiler.phase('generate.history_log'):
+                    self._create_generation_log()
+            print(f"\n✅ 완료! {self.output_path.name} 생성됨")
+            return None
+
+        # 실제 생성: 계획을 만든 뒤 한꺼번에 실행 (내용이 같은 파일은 다시 쓰지 않음)
+        with profiler.phase('generate.plan'):
+            plan = self.plan()
+        with profiler.phase('generate.manifest'):
+            self._load_manifest()
+        with profiler.phase('generate.structure'):
+            self._create_directories(plan)
+        with profiler.phase('generate.files'):
+            self._write_planned_files(plan)
+        with profiler.phase('generate.cleanup'):
+            self._remove_stale_files()
+        with profiler.phase('generate.manifest'):
+            self._save_manifest()
+        if self.history_log:
+            with profiler.phase('generate.history_log'):
+                self._create_generation_log()
+
+        print(
+            f"📄 파일: 작성 {self.write_stats['written']}개, "
+            f"변경 없음 {self.write_stats['unchanged']}개, "
+            f"삭제 {self.write_stats['removed']}개"
+        )
         print(f"\n✅ 완료! {self.course_code} 생성됨")
+        return plan
 
-    def _preview_structure(self):
-        """생성될 구조 미리보기"""
-        print(f"{self.course_code}/")
-        print(f"├── subjects.json")
-
-        for lesson in self.course_data['lessons']:
-            lesson_num = lesson['number']
-            print(f"├── {lesson_num}/")
-            print(f"│   ├── index.html")
-            print(f"│   └── assets/data/data.json")
+    def plan(self) -> GenerationPlan:
+        """
+        생성 계획 만들기 (디스크 접근 없음)
 
-    def _create_course_structure(self):
-        """과정 폴더 구조 생성"""
-        # 과정 루트 디렉토리
+        Returns:
+            폴더, 파일 내용, 권한을 모두 담은 계획
+        """
+        return GenerationPlan(
+            course_code=self.course_code,
+            output_path=self.output_path,
+            output_format=self.output_format,
+            directories=list(self._planned_directories()),
+            files=list(self._planned_files()),
+        )
+
+    def _planned_directories(self) -> Iterator[str]:
+        """만들 폴더 (출력 디렉토리 기준 경로, 상위 폴더 먼저)"""
+        yield self.course_code
+        for lesson in self.course_data.lessons:
+            lesson_path = f"{self.course_code}/{lesson.number}"
+            yield lesson_path
+            yield f"{lesson_path}/assets"
+            yield f"{lesson_path}/assets/data"
+
+    def _planned_files(self) -> Iterator[PlannedFile]:
+        """만들 파일 (subjects.json, 차시마다 index.html + data.json)"""
+        yield PlannedFile(f"{self.course_code}/subjects.json", self._render_subjects_json())
+
+        # index.html은 모든 차시가 같은 내용 (한 번만 렌더링)
+        index_html = self._get_template_html().encode('utf-8')
+        for lesson in self.course_data.lessons:
+            lesson_path = f"{self.course_code}/{lesson.number}"
+            yield PlannedFile(f"{lesson_path}/index.html", index_html, shared=True)
+            yield PlannedFile(f"{lesson_path}/assets/data/data.json", self._render_data_json(lesson))
+
+    def _create_directories(self, plan: GenerationPlan):
+        """계획된 폴더 생성 (상위 폴더부터, 같은 깊이는 병렬)"""
+        # 과정 루트 디렉토리 (출력 디렉토리가 없으면 함께 생성)
         self.course_dir.mkdir(parents=True, exist_ok=True)
+        profiler.count('mkdir')
 
-        # 각 차시 폴더
-        for lesson in self.course_data['lessons']:
-            lesson_dir = self.course_dir / lesson['number']
-            lesson_dir.mkdir(exist_ok=True)
-
-            # assets/data 폴더
-            data_dir = lesson_dir / 'assets' / 'data'
-            data_dir.mkdir(parents=True, exist_ok=True)
+        writer = TreeWriter(self.writer_threads)
+        writer.make_directories(self.output_dir / directory for directory in plan.directories[1:])
+        self._check_writer_errors(writer)
 
         print(f"✅ 폴더 구조 생성 완료")
 
-    def _create_subjects_json(self):
-        """subjects.json 생성"""
+    def _create_archive(self):
+        """
+        과정 압축 파일 생성 (폴더 출력과 같은 경로/권한, 파일은 하나씩 만들어 바로 기록)
+
+        증분 생성용 매니페스트(.manifest.json)는 압축 파일에 넣지 않는다.
+        """
+        files = 0
+        with ArchiveWriter(self.output_path, self.output_format) as archive:
+            for directory in self._planned_directories():
+                archive.add_directory(directory)
+            for planned in self._planned_files():
+                archive.add_file(planned.path, planned.content, planned.mode)
+                files += 1
+
+        self.write_stats['written'] = files
+        profiler.count('write')
+        profiler.count('bytes_written', archive.bytes_written)
+
+        print(f"✅ {self.output_format} 압축 파일 생성 완료: 파일 {files}개, "
+              f"{archive.bytes_written / 1024:.0f}KB → {self.output_path.stat().st_size / 1024:.0f}KB")
+
+    def _render_subjects_json(self) -> bytes:
+        """subjects.json 내용"""
         # 각 차시마다 별도의 subject로 생성 (25itcoms 형식)
         subjects = []
 
-        for lesson in self.course_data['lessons']:
+        for lesson in self.course_data.lessons:
             # "차시" 값이 있으면 "1차", "2차" 형식으로, 없으면 차시번호 사용
-            if lesson.get('order'):
-                title_prefix = f"{lesson['order']}차"
+            if lesson.order:
+                title_prefix = f"{lesson.order}차"
             else:
-                title_prefix = f"{lesson['index']}차"
+                title_prefix = f"{lesson.index}차"
+
+            subjects.append((f"{title_prefix} {lesson.title}", [f"{lesson.number} {lesson.title}"]))
+
+        with profiler.phase('generate.json_encode'):
+            if self.json_encoder == 'stdlib':
+                return encode_json({
+                    "subjects": [{"title": title, "lists": lists} for title, lists in subjects]
+                })
+            return encode_subjects(subjects)
+
+    def _write_planned_files(self, plan: GenerationPlan):
+        """계획된 파일 쓰기 (스레드 풀로 한꺼번에 실행)"""
+        writer = TreeWriter(self.writer_threads)
+        shared_files = [planned for planned in plan.files if planned.shared]
+        tasks = []
+
+        if self.index_mode == 'hardlink' and shared_files:
+            # 첫 공유 파일을 먼저 쓰고 나머지는 그 파일에 링크
+            first = shared_files[0]
+            first_file = self.output_dir / first.path
+            writer.write_files([(first_file, partial(self._write_file, first_file, first.content))])
+            self._check_writer_errors(writer)
+
+            for planned in plan.files:
+                file_path = self.output_dir / planned.path
+                if planned is first:
+                    continue
+                if planned.shared:
+                    tasks.append((file_path, partial(self._write_linked_file, file_path, planned.content, first_file)))
+                else:
+                    tasks.append((file_path, partial(self._write_file, file_path, planned.content)))
+        else:
+            for planned in plan.files:
+                file_path = self.output_dir / planned.path
+                if planned.shared:
+                    tasks.append((file_path, partial(self._write_unshared_file, file_path, planned.content)))
+                else:
+                    tasks.append((file_path, partial(self._write_file, file_path, planned.content)))
 
-            subjects.append({
-                "title": f"{title_prefix} {lesson['title']}",
-                "lists": [f"{lesson['number']} {lesson['title']}"]
-            })
+        writer.write_files(tasks)
+        self._check_writer_errors(writer)
 
-        subjects_data = {"subjects": subjects}
+        print(f"✅ subjects.json 생성 완료")
+        print(f"✅ {len(self.course_data.lessons)}개 차시 파일 생성 완료")
+        if self.verbose:
+            print(f"   - 쓰기 처리량: {writer.throughput()}")
+
+        if self.index_mode == 'hardlink' and shared_files:
+            unique_files = self._verify_shared_files(shared_files)
+            print(
+                f"✅ index.html 공유: 하드링크 {self.index_link_stats['hardlink']}개, "
+                f"reflink {self.index_link_stats['reflink']}개, "
+                f"복사 {self.index_link_stats['copy']}개 "
+                f"(검증 완료, 실제 파일 {unique_files}개)"
+            )
+
+    def _check_writer_errors(self, writer: TreeWriter):
+        """
+        쓰기 실패 확인 (실패한 파일을 모두 출력)
 
-        # 파일 저장
-        subjects_file = self.course_dir / 'subjects.json'
-        with open(subjects_file, 'w', encoding='utf-8') as f:
-            json.dump(subjects_data, f, ensure_ascii=False, indent='\t')
+        Raises:
+            RuntimeError: 실패한 작업이 있는 경우
+        """
+        if not writer.errors:
+            return
 
-        subjects_file.chmod(0o644)
-        print(f"✅ subjects.json 생성 완료")
+        for path, error in sorted(writer.errors, key=lambda item: str(item[0])):
+            print(f"   ❌ {path}: {error}")
+        raise RuntimeError(f"파일 쓰기 실패 {len(writer.errors)}개")
 
-    def _get_lesson_title(self, lesson_num: str) -> str:
-        """차시 번호로 차시명 찾기"""
-        for lesson in self.course_data['lessons']:
-            if lesson['number'] == lesson_num:
-                return lesson['title']
-        return ""
+    def _write_unshared_file(self, file_path: Path, content: bytes) -> int:
+        """공유 파일(index.html)을 차시별 파일로 쓰기"""
+        stat = self._stat(file_path)
+        if stat is not None and stat.st_nlink > 1:
+            # hardlink 모드로 만든 공유 파일은 차시별 파일로 분리
+            file_path.unlink()
+            profiler.count('unlink')
+        return self._write_file(file_path, content)
 
-    def _create_lesson_files(self):
-        """각 차시별 파일 생성"""
-        for lesson in self.course_data['lessons']:
-            lesson_dir = self.course_dir / lesson['number']
+    def _write_linked_file(self, file_path: Path, content: bytes, shared_file: Path):
+        """
+        공유 파일(index.html)을 첫 파일에 하드링크로 연결
 
-            # index.html 생성
-            self._create_index_html(lesson_dir)
+        하드링크를 만들 수 없으면 reflink, 그것도 안 되면 복사한다.
 
-            # data.json 생성
-            self._create_data_json(lesson_dir, lesson)
+        Args:
+            file_path: 만들 파일
+            content: 파일 내용 (복사하거나 기존 파일과 비교할 때 사용)
+            shared_file: 공유할 첫 파일
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        stat = self._stat(file_path)
+
+        if stat is not None and os.path.samestat(stat, shared_file.stat()):
+            # 이미 공유 파일에 링크됨
+            self._count(self.write_stats, 'unchanged')
+            self._count(self.index_link_stats, 'hardlink')
+        elif self._hardlink_supported and self._replace_with_link(shared_file, file_path, os.link):
+            stat = file_path.stat()
+            self._count(self.write_stats, 'written')
+            self._count(self.index_link_stats, 'hardlink')
+        elif not self._is_current(file_path, stat, content, digest) and \
+                self._replace_with_link(shared_file, file_path, _reflink):
+            stat = file_path.stat()
+            self._count(self.write_stats, 'written')
+            self._count(self.index_link_stats, 'reflink')
+        else:
+            self._write_file(file_path, content)
+            self._count(self.index_link_stats, 'copy')
+            return
 
-        # 권한 설정
-        self._set_permissions()
+        self._record_file(file_path, digest, len(content), stat)
+
+    def _replace_with_link(self, source: Path, target: Path, link_function) -> bool:
+        """임시 파일에 링크/복제 후 교체 (실패하면 False)"""
+        temp_file = target.with_name(f'.{target.name}.tmp')
+        try:
+            if temp_file.exists():
+                temp_file.unlink()
+            link_function(source, temp_file)
+            os.replace(temp_file, target)
+            profiler.count('link')
+            return True
+        except OSError:
+            if link_function is os.link:
+                # 같은 과정 안에서는 다시 시도해도 실패하므로 이후 차시는 건너뜀
+                self._hardlink_supported = False
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+            return False
+
+    def _verify_shared_files(self, shared_files: List[PlannedFile]) -> int:
+        """
+        공유 파일(index.html) 내용이 계획과 같은지 확인 (같은 파일은 한 번만 읽음)
 
-        print(f"✅ {len(self.course_data['lessons'])}개 차시 파일 생성 완료")
+        Returns:
+            실제 파일(inode) 수
 
-    def _create_index_html(self, lesson_dir: Path):
-        """index.html 생성 (템플릿 기반)"""
-        template_html = self._get_template_html()
+        Raises:
+            RuntimeError: 내용이 다른 차시가 있는 경우
+        """
+        checked = {}
+        failed = []
 
-        index_file = lesson_dir / 'index.html'
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(template_html)
+        for planned in shared_files:
+            file_path = self.output_dir / planned.path
+            stat = file_path.stat()
+            key = (stat.st_dev, stat.st_ino)
+            if key not in checked:
+                checked[key] = file_path.read_bytes() == planned.content
+            if not checked[key]:
+                failed.append(planned.path)
 
-    def _get_template_html(self) -> str:
-        """템플릿 HTML 반환"""
-        if self.template == "ct2022":
-            return self._get_ct2022_template()
-        elif self.template == "it2023":
-            return self._get_it2023_template()
-        else:
-            # 기본 템플릿
-            return self._get_ct2022_template()
-
-    def _get_ct2022_template(self) -> str:
-        """2022 CT 템플릿"""
-        return '''<!DOCTYPE html>
-<html lang="ko">
-<head>
-\t<meta charset="UTF-8">
-\t<meta name="viewport" content="width=device-width, user-scalable=no" />
-\t<meta http-equiv="X-UA-Compatible" content="ie=edge">
-\t<title>메가존아이티평생교육원</title>
-\t<script src="../../../resources/scripts/jquery/jquery.js"></script>
-\t<script src="../../../resources/scripts/vue/vue.min.js"></script>
-\t<script src="../../../resources/scripts/vue/vue-router.min.js"></script>
-
-\t<script src="../../../resources/scripts/2022/templates/layout_ct.js"></script>
-\t<script src="../../../resources/scripts/2022/templates/defaults.js"></script>
-\t<script src="../../../resources/scripts/sync.js"></script>
-
-\t<link rel="stylesheet" href="../../../resources/scripts/videojs/video-js.min.css">
-
-
-\t<link rel="stylesheet" href="../../../resources/styles/2022/base.css">
-\t<link rel="stylesheet" href="../../../resources/styles/2022/layout.css">
-\t<link rel="stylesheet" href="../../../resources/styles/2022/modules.css">
-\t<link rel="stylesheet" href="../../../resources/styles/2022/mediaquery.css">
-\t<link rel="stylesheet" href="../../../resources/styles/2022/type-2.css">
-
-\t<link rel="stylesheet" media="print" type="text/css" href="../../../resources/styles/print.css">
-</head>
-<body>
-\t<div id="app"></div>
-\t<script src="../../../resources/scripts/app.js"></script>
-\t<script src="../../../resources/scripts/videojs/video.min.js"></script>
-
-\t<script src="../../../resources/scripts/2022/commons_ct.js"></script>
-\t<script src="../../../resources/scripts/videojs/videojs-contrib-hls.min.js"></script>
-\t<script src="../../../resources/scripts/videojs/videojs.hotkeys.min.js"></script>
-</body>
-</html>'''
-
-    def _get_it2023_template(self) -> str:
-        """2023 IT 템플릿"""
-        return '''<!DOCTYPE html>
-<html lang="ko">
-<head>
-\t<meta charset="UTF-8">
-\t<meta name="viewport" content="width=device-width, user-scalable=no" />
-\t<meta http-equiv="X-UA-Compatible" content="ie=edge">
-\t<title>메가존아이티평생교육원</title>
-\t<script src="../../../resources/scripts/jquery/jquery.js"></script>
-\t<script src="../../../resources/scripts/vue/vue.min.js"></script>
-\t<script src="../../../resources/scripts/vue/vue-router.min.js"></script>
-
-\t<script src="../../../resources/scripts/2022/templates/layout.js"></script>
-\t<script src="../../../resources/scripts/2022/templates/defaults.js"></script>
-\t<script src="../../../resources/scripts/sync.js"></script>
-
-\t<link rel="stylesheet" href="../../../resources/scripts/videojs/video-js.min.css">
-
-\t<link rel="stylesheet" href="../../../resources/styles/2023/base.css">
-\t<link rel="stylesheet" href="../../../resources/styles/2025/layout.css">
-\t<link rel="stylesheet" href="../../../resources/styles/2023/modules.css">
-\t<link rel="stylesheet" href="../../../resources/styles/2023/mediaquery.css">
-\t<link rel="stylesheet" href="../../../resources/styles/2023/type-1.css">
-
-\t<link rel="stylesheet" media="print" type="text/css" href="../../../resources/styles/print.css">
-</head>
-<body>
-<div id="app"></div>
-<script src="../../../resources/scripts/app.js"></script>
-<script src="../../../resources/scripts/videojs/video.min.js"></script>
-
-<script src="../../../resources/scripts/2022/commons.js"></script>
-<script src="../../../resources/scripts/videojs/videojs-contrib-hls.min.js"></script>
-<script src="../../../resources/scripts/videojs/videojs.hotkeys.min.js"></script>
-</body>
-</html>'''
-
-    def _create_data_json(self, lesson_dir: Path, lesson: Dict):
-        """data.json 생성"""
-        data = {
-            "subject": self.course_data['subject'],
-            "index": lesson['index'],
-            "section": 1,
-            "sections": ["학습하기"],
-            "pages": [
-                {
-                    "path": "/lecture",
-                    "section": 1,
-                    "title": "학습하기",
-                    "component": "lecture",
-                    "media": lesson['video_url'],
-                    "data": {}
-                }
-            ]
-        }
+        if failed:
+            raise RuntimeError(f"index.html 검증 실패: {', '.join(failed)}")
+
+        return len(checked)
 
-        # guide 필드 추가 (다운로드 자료가 있으면)
-        if lesson['download_url']:
-            data['guide'] = lesson['download_url']
+    def _get_template_html(self) -> str:
+        """템플릿 HTML 반환 (컴파일된 템플릿 캐시 사용)"""
+        with profiler.phase('generate.render'):
+            return self._compiled_template.render_index_html(course_code=self.course_code)
+
+    def _render_data_json(self, lesson: Lesson) -> bytes:
+        """차시 data.json 내용"""
+        # guide 필드 (다운로드 자료가 있으면)
+        if lesson.download_url:
+            guide = lesson.download_url
+        elif self._compiled_template.guide_required:
+            # guide 필드 필수 템플릿 (ct2022): Part별로 다운로드 자료 공유
+            guide = self._get_guide_for_lesson(lesson.index)
         else:
-            # ct2022 템플릿은 guide 필드 필수
-            if self.template == "ct2022":
-                # Part별로 다운로드 자료 공유
-                data['guide'] = self._get_guide_for_lesson(lesson['index'])
+            guide = None
 
-        # 파일 저장
-        data_file = lesson_dir / 'assets' / 'data' / 'data.json'
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent='\t')
+        with profiler.phase('generate.json_encode'):
+            return self._compiled_template.encode_data_json(
+                guide,
+                fast=self.json_encoder == 'fast',
+                subject=self.course_data.subject,
+                index=lesson.index,
+                media=lesson.video_url
+            )
 
     def _get_guide_for_lesson(self, lesson_index: int) -> str:
         """차시에 맞는 guide URL 반환"""
-        # 현재 차시가 속한 Part를 찾아서 해당 Part의 첫 차시 다운로드 URL 사용
-        current_chapter = None
-
-        # 역순으로 순회하여 lesson_start가 lesson_index 이하인 가장 가까운 chapter 찾기
-        for chapter in reversed(self.course_data['chapters']):
-            if chapter['lesson_start'] <= lesson_index:
-                current_chapter = chapter
-                break
-
-        if current_chapter:
-            # 해당 Part의 첫 차시에서 다운로드 URL 찾기
-            first_lesson_num = current_chapter['lessons'][0]
-            for lesson in self.course_data['lessons']:
-                if lesson['number'] == first_lesson_num and lesson['download_url']:
-                    return lesson['download_url']
-
-        # 찾지 못한 경우 첫 번째 다운로드 URL 사용
-        for lesson in self.course_data['lessons']:
-            if lesson['download_url']:
-                return lesson['download_url']
-
-        # 그래도 없으면 빈 문자열
-        return ""
-
-    def _set_permissions(self):
-        """파일 권한 설정 (644)"""
-        for lesson in self.course_data['lessons']:
-            lesson_dir = self.course_dir / lesson['number']
-
-            # index.html
-            index_file = lesson_dir / 'index.html'
-            if index_file.exists():
-                index_file.chmod(0o644)
-
-            # data.json
-            data_file = lesson_dir / 'assets' / 'data' / 'data.json'
-            if data_file.exists():
-                data_file.chmod(0o644)
+        # 현재 차시가 속한 Part의 첫 차시 다운로드 URL (파싱 시 미리 계산됨)
+        position = bisect_right(self.course_data.chapter_starts, lesson_index) - 1
+        if position >= 0:
+            return self.course_data.chapters[position].guide
+
+        # 찾지 못한 경우 첫 번째 다운로드 URL (없으면 빈 문자열)
+        return self.course_data.default_guide
+
+    def _load_manifest(self):
+        """이전 생성 결과의 매니페스트 읽기 (없거나 깨졌으면 빈 매니페스트)"""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                self._previous_manifest = json.load(f).get('files', {})
+        except (OSError, ValueError, AttributeError):
+            self._previous_manifest = {}
+        self._manifest = {}
+
+    def _save_manifest(self):
+        """매니페스트 저장 (변경된 경우만)"""
+        if self._manifest == self._previous_manifest and self.manifest_file.exists():
+            return
 
-    def _create_generation_log(self):
-        """생성 이력 로그 파일 생성 (레포지토리 폴더)"""
-        # 레포지토리 루트 경로 찾기 (__file__의 2단계 상위)
-        repo_root = Path(__file__).parent.parent
-        history_dir = repo_root / 'history'
-        history_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump({"files": self._manifest}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        self.manifest_file.chmod(0o644)
+        profiler.count('write')
+        profiler.count('chmod')
+
+    @staticmethod
+    def _stat(file_path: Path) -> Optional[os.stat_result]:
+        """파일 정보 (없으면 None)"""
+        try:
+            return file_path.stat()
+        except FileNotFoundError:
+            return None
+
+    def _is_current(self, file_path: Path, stat: Optional[os.stat_result], content: bytes, digest: str) -> bool:
+        """
+        디스크의 파일 내용이 content와 같은지 확인
+
+        매니페스트의 해시와 크기/수정 시각이 일치하면 파일을 읽지 않고 같은 것으로 판단한다.
+        """
+        if stat is None or stat.st_size != len(content):
+            return False
+
+        previous = self._previous_manifest.get(file_path.relative_to(self.course_dir).as_posix())
+        if previous and previous.get('sha256') == digest and previous.get('mtime_ns') == stat.st_mtime_ns:
+            return True
+
+        return file_path.read_bytes() == content
+
+    def _record_file(self, file_path: Path, digest: str, size: int, stat: os.stat_result):
+        """매니페스트에 생성 파일 기록"""
+        with self._stats_lock:
+            self._manifest[file_path.relative_to(self.course_dir).as_posix()] = {
+                "sha256": digest,
+                "size": size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+
+    def _count(self, stats: Dict[str, int], key: str):
+        """통계 카운트 증가 (쓰기 스레드 간 공유)"""
+        with self._stats_lock:
+            stats[key] += 1
+
+    def _write_file(self, file_path: Path, content: bytes) -> int:
+        """
+        파일 쓰기 (디스크 내용과 같으면 쓰지 않음, 권한 644)
+
+        Returns:
+            실제로 쓴 바이트 수 (변경 없으면 0)
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        stat = self._stat(file_path)
+
+        written = 0
+        if self._is_current(file_path, stat, content, digest):
+            if stat.st_mode & 0o777 != 0o644:
+                with profiler.phase('generate.chmod'):
+                    file_path.chmod(0o644)
+                profiler.count('chmod')
+            self._count(self.write_stats, 'unchanged')
+        else:
+            if stat is not None and stat.st_nlink > 1:
+                # 하드링크로 공유 중인 파일은 링크를 끊고 새로 쓰기 (다른 차시 보호)
+                file_path.unlink()
+                profiler.count('unlink')
+            with profiler.phase('generate.write'):
+                file_path.write_bytes(content)
+            with profiler.phase('generate.chmod'):
+                file_path.chmod(0o644)
+            stat = file_path.stat()
+            self._count(self.write_stats, 'written')
+            written = len(content)
+            profiler.count('write')
+            profiler.count('chmod')
+            profiler.count('bytes_written', written)
+
+        self._record_file(file_path, digest, len(content), stat)
+        return written
+
+    def _remove_stale_files(self):
+        """이전 생성 결과에만 있는 파일 삭제 (빈 폴더도 정리)"""
+        for relative_path in sorted(set(self._previous_manifest) - set(self._manifest)):
+            file_path = self._stale_file_path(relative_path)
+            if file_path is None or not file_path.is_file():
+                continue
+
+            file_path.unlink()
+            profiler.count('unlink')
+            self._count(self.write_stats, 'removed')
+
+            # 비어 있는 상위 폴더 삭제 (과정 폴더 직전까지)
+            parent = file_path.parent
+            while parent != self.course_dir:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+                parent = parent.parent
+
+    def _stale_file_path(self, relative_path: str) -> Optional[Path]:
+        """
+        매니페스트 항목 → 과정 폴더 안의 파일 경로
 
-        # 현재 날짜+시간으로 파일명 생성 (YYMMDD_HHMM.json)
+        매니페스트는 공유 출력 폴더에 있어 누구나 고칠 수 있으므로, 절대 경로나 '..'이 들어간 항목,
+        (심볼릭 링크 등으로) 과정 폴더 밖을 가리키는 항목은 None (삭제하지 않음)
+        """
+        relative = Path(relative_path)
+        if relative.is_absolute() or relative.anchor or '..' in relative.parts:
+            return None
+
+        file_path = self.course_dir / relative
+        try:
+            file_path.resolve().relative_to(self.course_dir.resolve())
+        except (OSError, ValueError):
+            return None
+        return file_path
+
+    def _create_generation_log(self):
+        """생성 이력 저장 (레포지토리 history/ 이력 데이터베이스)"""
         now = datetime.now()
-        filename = now.strftime('%y%m%d_%H%M.json')  # 예: 251119_1007.json
-        history_file = history_dir / filename
 
         # 이력 데이터 (간략한 정보만)
         log_data = {
             "generated_at": now.isoformat(),
             "course_code": self.course_code,
-            "subject": self.course_data['subject'],
-            "total_lessons": self.course_data['total_lessons'],
-            "chapters": len(self.course_data['chapters']),
+            "subject": self.course_data.subject,
+            "total_lessons": self.course_data.total_lessons,
+            "chapters": len(self.course_data.chapters),
             "template": self.template,
             "input_file": self.input_file,
-            "output_dir": str(self.course_dir),
+            "output_dir": str(self.output_path),
             "lessons": [
                 {
-                    "number": lesson['number'],
-                    "title": lesson['title'],
-                    "video_url": lesson['video_url'],
-                    "download_url": lesson['download_url'] or self._get_guide_for_lesson(lesson['index'])
+                    "number": lesson.number,
+                    "title": lesson.title,
+                    "video_url": lesson.video_url,
+                    "download_url": lesson.download_url or self._get_guide_for_lesson(lesson.index)
                 }
-                for lesson in self.course_data['lessons']
+                for lesson in self.course_data.lessons
             ]
         }
 
-        # 파일 저장
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, ensure_ascii=False, indent=2)
+        # --profile: 이 시트의 지금까지 측정값
+        active_profiler = profiler.active()
+        if active_profiler is not None and active_profiler.current_sheet() is not None:
+            log_data["profile"] = active_profiler.current_sheet()
 
-        history_file.chmod(0o644)
-        print(f"📝 생성 이력 저장: {history_file}")
+        with HistoryStore() as store:
+            run_id = store.record(log_data, 'single')
+        print(f"📝 생성 이력 저장: {store.db_path} (실행 #{run_id})")
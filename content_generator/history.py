@@ -0,0 +1,371 @@
+"""
+생성 이력 저장소 모듈
+
+생성 이력을 레포지토리 history/ 폴더의 SQLite 데이터베이스(history.db) 하나에 저장한다.
+환경 변수 CONTENT_GENERATOR_HISTORY_DB로 다른 데이터베이스 파일을 쓸 수 있다 (벤치마크 등).
+실행마다 JSON 파일을 만들던 방식과 달리 같은 분에 여러 번 실행해도 덮어쓰지 않고,
+과정 코드/시각/입력 파일 인덱스로 "마지막으로 언제, 어떤 파일로 생성했는지"를 바로 조회한다.
+
+- runs: 실행 하나 (단일 생성, --all-sheets 배치, --watch 주기, 작업 매니페스트)
+- courses: 실행에 속한 과정 하나 (차시 목록은 JSON 문자열)
+- 여러 프로세스(--jobs, --serve 워커)가 동시에 기록할 수 있도록 WAL 모드 사용
+- 기존 history/*.json 이력은 import_file()로 한 번 가져옴 (같은 파일은 다시 가져오지 않음)
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+HISTORY_DIR = Path(__file__).parent.parent / 'history'
+HISTORY_DB = HISTORY_DIR / 'history.db'
+HISTORY_DB_ENV = 'CONTENT_GENERATOR_HISTORY_DB'
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    generated_at TEXT NOT NULL,
+    batch_type TEXT NOT NULL,
+    input_file TEXT,
+    output_dir TEXT,
+    template TEXT,
+    total_courses INTEGER NOT NULL DEFAULT 0,
+    success_count INTEGER NOT NULL DEFAULT 0,
+    fail_count INTEGER NOT NULL DEFAULT 0,
+    details TEXT,
+    profile TEXT,
+    source TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS courses (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    generated_at TEXT NOT NULL,
+    input_file TEXT,
+    sheet_name TEXT,
+    course_code TEXT,
+    template TEXT,
+    subject TEXT,
+    status TEXT NOT NULL,
+    total_lessons INTEGER,
+    chapters INTEGER,
+    output_dir TEXT,
+    error TEXT,
+    lessons TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_generated_at ON runs(generated_at);
+CREATE INDEX IF NOT EXISTS courses_code ON courses(course_code, generated_at);
+CREATE INDEX IF NOT EXISTS courses_input ON courses(input_file, generated_at);
+CREATE INDEX IF NOT EXISTS courses_generated_at ON courses(generated_at);
+CREATE INDEX IF NOT EXISTS courses_run ON courses(run_id)
+"""
+
+# 이전 버전 → 현재 버전 (버전별 추가 문장)
+MIGRATIONS = {
+    2: ["ALTER TABLE courses ADD COLUMN template TEXT"],  # 작업 매니페스트: 과정별 템플릿
+}
+
+COURSE_COLUMNS = (
+    "c.id, c.run_id, c.generated_at, c.input_file, c.sheet_name, c.course_code, "
+    "COALESCE(c.template, r.template) AS template, c.subject, c.status, c.total_lessons, c.chapters, "
+    "c.output_dir, c.error, c.lessons, r.batch_type"
+)
+
+
+def _timestamp(value: Optional[datetime] = None) -> str:
+    """저장용 시각 문자열 (기존 이력과 같은 isoformat)"""
+    return (value or datetime.now()).isoformat()
+
+
+def history_db_path() -> Path:
+    """사용할 데이터베이스 경로 (환경 변수 CONTENT_GENERATOR_HISTORY_DB가 있으면 그 경로, 없으면 HISTORY_DB)"""
+    override = os.environ.get(HISTORY_DB_ENV)
+    return Path(override) if override else HISTORY_DB
+
+
+class HistoryStore:
+    """생성 이력 데이터베이스"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로 (폴더가 없으면 생성, 없으면 history_db_path())
+        """
+        self.db_path = Path(db_path) if db_path is not None else history_db_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._migrate()
+            self.db_path.chmod(0o644)
+
+    def _migrate(self):
+        """스키마 생성/갱신 (여러 프로세스가 동시에 열어도 한 번만 실행)"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version == 0:
+                for statement in SCHEMA.split(';'):
+                    self._conn.execute(statement)
+            else:
+                for target in range(version + 1, SCHEMA_VERSION + 1):
+                    for statement in MIGRATIONS.get(target, []):
+                        self._conn.execute(statement)
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """연결 닫기"""
+        self._conn.close()
+
+    def begin_run(self, batch_type: str, input_file: str, output_dir: str, template: str,
+                  generated_at: Optional[datetime] = None, details: Optional[Dict] = None) -> int:
+        """
+        실행 기록 시작 (과정은 add_course로 하나씩 추가)
+
+        Args:
+            batch_type: 실행 종류 (single, all_sheets, watch, manifest, server)
+            input_file: 입력 파일
+            output_dir: 출력 디렉토리
+            template: 템플릿
+            generated_at: 실행 시각 (기본: 현재)
+            details: 실행 종류별 추가 정보 (--watch 주기 번호, 바뀐 시트 등)
+
+        Returns:
+            실행 ID
+        """
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (generated_at, batch_type, input_file, output_dir, template, details) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (_timestamp(generated_at), batch_type, input_file, output_dir, template,
+                 json.dumps(details, ensure_ascii=False) if details is not None else None)
+            )
+        return cursor.lastrowid
+
+    def add_course(self, run_id: int, course: Dict, generated_at: Optional[datetime] = None):
+        """
+        실행에 과정 하나 추가 (실행의 건수도 함께 갱신 - 중간에 중단되어도 건수가 맞음)
+
+        Args:
+            run_id: 실행 ID
+            course: 과정 요약 (batch_log.course_entry 형식, 작업 매니페스트는 input_file/template 포함)
+            generated_at: 과정 생성 시각 (기본: 현재)
+        """
+        with self._conn:
+            self._insert_course(run_id, course, _timestamp(generated_at))
+
+    def finish_run(self, run_id: int, profile: Optional[Dict] = None):
+        """실행 기록 마무리 (--profile이면 측정값 저장)"""
+        if profile is None:
+            return
+        with self._conn:
+            self._conn.execute("UPDATE runs SET profile = ? WHERE id = ?",
+                               (json.dumps(profile, ensure_ascii=False), run_id))
+
+    def _insert_course(self, run_id: int, course: Dict, generated_at: str):
+        """과정 행 추가 + 실행 건수 갱신 (트랜잭션 안에서 호출, 입력 파일/템플릿은 없으면 실행 값)"""
+        success = course['status'] == 'success'
+        self._conn.execute(
+            "INSERT INTO courses (run_id, generated_at, input_file, sheet_name, course_code, template, subject, "
+            "status, total_lessons, chapters, output_dir, error, lessons) "
+            "SELECT ?, ?, COALESCE(?, input_file), ?, ?, ?, ?, ?, ?, ?, ?, ?, ? FROM runs WHERE id = ?",
+            (run_id, generated_at, course.get('input_file'), course.get('sheet_name'), course.get('course_code'),
+             course.get('template'), course.get('subject'),
+             course['status'], course.get('total_lessons'), course.get('chapters'), course.get('output_dir'),
+             course.get('error'),
+             json.dumps(course['lessons'], ensure_ascii=False) if 'lessons' in course else None,
+             run_id)
+        )
+        self._conn.execute(
+            "UPDATE runs SET total_courses = total_courses + 1, "
+            "success_count = success_count + ?, fail_count = fail_count + ? WHERE id = ?",
+            (int(success), int(not success), run_id)
+        )
+
+    def record(self, log_data: Dict, batch_type: str, details: Optional[Dict] = None,
+               source: Optional[str] = None) -> Optional[int]:
+        """
+        이력 형식(배치 로그 또는 단일 생성 로그) 하나를 실행 하나로 저장
+
+        Args:
+            log_data: {"generated_at", "input_file", "output_dir", "template", "courses"[, "profile"]}
+                      또는 단일 생성 로그 (과정 필드가 최상위에 있는 형식)
+            batch_type: 실행 종류
+            details: 실행 종류별 추가 정보
+            source: 가져온 원본 (같은 원본은 한 번만 저장)
+
+        Returns:
+            실행 ID (이미 가져온 원본이면 None)
+        """
+        if 'courses' in log_data:
+            courses = log_data['courses']
+        else:
+            courses = [{"status": "success", **{
+                key: value for key, value in log_data.items()
+                if key not in ('generated_at', 'template', 'input_file', 'profile')
+            }}]
+
+        generated_at = log_data['generated_at']
+        try:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "INSERT INTO runs (generated_at, batch_type, input_file, output_dir, template, details, "
+                    "profile, source) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (generated_at, batch_type, log_data.get('input_file'), log_data.get('output_dir'),
+                     log_data.get('template'),
+                     json.dumps(details, ensure_ascii=False) if details is not None else None,
+                     json.dumps(log_data['profile'], ensure_ascii=False) if 'profile' in log_data else None,
+                     source)
+                )
+                for course in courses:
+                    self._insert_course(cursor.lastrowid, course, generated_at)
+        except sqlite3.IntegrityError:
+            if source is None:
+                raise
+            return None
+        return cursor.lastrowid
+
+    def import_file(self, history_file: Path) -> int:
+        """
+        기존 JSON 이력 파일 가져오기
+
+        Args:
+            history_file: history/*.json (단일 생성, 배치, --watch)
+
+        Returns:
+            새로 저장한 실행 수 (이미 가져온 파일이면 0)
+
+        Raises:
+            ValueError: 이력 형식이 아닌 경우
+        """
+        history_file = Path(history_file)
+        try:
+            with open(history_file, 'r', encoding='utf-8') as f:
+                log_data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"이력 파일을 읽을 수 없습니다: {history_file} ({e})")
+
+        source = history_file.name
+        if log_data.get('batch_type') == 'watch':
+            imported = 0
+            for cycle in log_data.get('cycles', []):
+                details = {
+                    "cycle": cycle['cycle'],
+                    "started_at": log_data.get('started_at'),
+                    "changed_sheets": cycle.get('changed_sheets', []),
+                    "removed_sheets": cycle.get('removed_sheets', []),
+                }
+                run_data = {**log_data, "generated_at": cycle['generated_at'], "courses": cycle['courses']}
+                if self.record(run_data, 'watch', details, source=f"{source}#{cycle['cycle']}") is not None:
+                    imported += 1
+            return imported
+
+        if 'generated_at' not in log_data or ('courses' not in log_data and 'course_code' not in log_data):
+            raise ValueError(f"이력 형식이 아닙니다: {history_file}")
+        batch_type = log_data.get('batch_type', 'single')
+        return int(self.record(log_data, batch_type, source=source) is not None)
+
+    def courses(self, course_code: Optional[str] = None, input_file: Optional[str] = None,
+                since: Optional[datetime] = None, status: Optional[str] = None,
+                limit: Optional[int] = 20) -> List[Dict]:
+        """
+        과정 이력 조회 (최근 순)
+
+        Args:
+            course_code: 과정 코드 (끝에 *를 붙이면 접두사 검색)
+            input_file: 입력 파일 (경로 또는 파일 이름)
+            since: 이 시각 이후만
+            status: success 또는 failed
+            limit: 최대 개수 (None이면 전체)
+
+        Returns:
+            과정 이력 목록 (실행 정보 batch_type, template, run_id 포함)
+        """
+        conditions, params = [], []
+        if course_code:
+            if course_code.endswith('*'):
+                conditions.append("c.course_code >= ? AND c.course_code < ?")
+                prefix = course_code[:-1]
+                params += [prefix, prefix + '\U0010ffff']
+            else:
+                conditions.append("c.course_code = ?")
+                params.append(course_code)
+        if input_file:
+            conditions.append("(c.input_file = ? OR c.input_file LIKE ? ESCAPE '\\')")
+            escaped = input_file.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params += [input_file, '%/' + escaped]
+        if since is not None:
+            conditions.append("c.generated_at >= ?")
+            params.append(_timestamp(since))
+        if status:
+            conditions.append("c.status = ?")
+            params.append(status)
+
+        query = (
+            f"SELECT {COURSE_COLUMNS} FROM courses c JOIN runs r ON r.id = c.run_id"
+            + (" WHERE " + " AND ".join(conditions) if conditions else "")
+            + " ORDER BY c.generated_at DESC, c.id DESC"
+        )
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        rows = []
+        for row in self._conn.execute(query, params):
+            entry = dict(row)
+            entry['lessons'] = json.loads(entry['lessons']) if entry['lessons'] else []
+            rows.append(entry)
+        return rows
+
+    def prune(self, older_than: Optional[datetime] = None, keep_runs: Optional[int] = None) -> int:
+        """
+        오래된 실행 삭제 (과정 이력도 함께 삭제)
+
+        Args:
+            older_than: 이 시각 이전 실행 삭제
+            keep_runs: 최근 실행 이 개수만 남기고 삭제
+
+        Returns:
+            삭제한 실행 수
+        """
+        removed = 0
+        with self._conn:
+            if older_than is not None:
+                removed += self._conn.execute("DELETE FROM runs WHERE generated_at < ?",
+                                              (_timestamp(older_than),)).rowcount
+            if keep_runs is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM runs WHERE id NOT IN "
+                    "(SELECT id FROM runs ORDER BY generated_at DESC, id DESC LIMIT ?)",
+                    (keep_runs,)
+                ).rowcount
+
+        if removed:
+            self._conn.execute("VACUUM")
+        return removed
+
+    def stats(self) -> Dict:
+        """전체 실행/과정 수, 가장 오래된/최근 실행 시각"""
+        row = self._conn.execute(
+            "SELECT COUNT(*), MIN(generated_at), MAX(generated_at) FROM runs"
+        ).fetchone()
+        course_count = self._conn.execute("SELECT COUNT(*) FROM courses").fetchone()[0]
+        return {"runs": row[0], "courses": course_count, "oldest": row[1], "newest": row[2]}
@@ -0,0 +1,175 @@
+"""
+JSON 인코딩 모듈
+
+data.json, subjects.json을 기존 출력(json.dumps(ensure_ascii=False, indent='\\t'))과 바이트 단위로 같게 만든다.
+
+표준 json은 indent를 주면 C 가속 인코더 대신 순수 파이썬으로 작은 조각을 하나씩 만들어 차시가 많으면 느리다.
+(orjson, ujson 같은 가속 라이브러리는 탭 들여쓰기를 지원하지 않아 같은 출력을 만들 수 없음)
+
+인코더:
+    fast    차시마다 같은 부분(sections, pages 골격)은 템플릿을 읽을 때 한 번만 직렬화해 두고
+            차시별 값만 C 문자열 이스케이프(json.encoder.encode_basestring)로 끼워 넣음 (기본)
+    stdlib  json.dumps (기준 출력, fast로 다룰 수 없는 값이면 fast도 이 경로 사용)
+"""
+
+import json
+import re
+from json.encoder import encode_basestring
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+JSON_ENCODERS = ('fast', 'stdlib')
+DEFAULT_JSON_ENCODER = 'fast'
+
+INDENT = '\t'
+
+
+def encode_json(data) -> bytes:
+    """기준 JSON 직렬화 (탭 들여쓰기, UTF-8) - fast 인코더 출력은 항상 이 결과와 같아야 함"""
+    return json.dumps(data, ensure_ascii=False, indent=INDENT).encode('utf-8')
+
+
+def slot_marker(name: str) -> str:
+    """FragmentEncoder에 넘길 데이터에서 값을 끼워 넣을 자리를 표시하는 문자열"""
+    return f"\x00slot:{name}\x00"
+
+
+def _encode_value(value) -> Optional[str]:
+    """
+    JSON 값 하나 (json.dumps와 같은 표기)
+
+    Returns:
+        JSON 텍스트 (객체/배열처럼 들여쓰기가 필요한 값이나 JSON 값이 아니면 None)
+    """
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return json.dumps(value)
+    return None
+
+
+def _substitute(node, values: Dict[str, object]):
+    """slot_marker 문자열을 값으로 바꾼 사본 (검증용 기준 데이터)"""
+    if isinstance(node, str):
+        return values.get(node, node)
+    if isinstance(node, dict):
+        return {key: _substitute(value, values) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_substitute(value, values) for value in node]
+    return node
+
+
+class FragmentEncoder:
+    """
+    미리 직렬화한 JSON 조각 사이에 값만 끼워 넣는 인코더
+
+    데이터를 한 번 json.dumps 한 텍스트를 slot_marker 자리에서 잘라 두고,
+    encode()에서는 자리 값과 최상위 객체 끝에 붙일 키(extra)만 직렬화한다.
+    """
+
+    def __init__(self, data, slots: Sequence[str]):
+        """
+        Args:
+            data: 직렬화할 데이터 (값을 끼워 넣을 자리는 slot_marker(이름) 문자열)
+            slots: 자리 이름 목록
+        """
+        self.data = data
+        self.slots = tuple(slots)
+        self._top_keys = frozenset(data) if isinstance(data, dict) else None
+
+        markers = {encode_basestring(slot_marker(name)): name for name in self.slots}
+        text = encode_json(data).decode('utf-8')
+        pieces = re.split('(' + '|'.join(map(re.escape, markers)) + ')', text) if markers else [text]
+        self._fragments: Optional[List[str]] = pieces[0::2]
+        self._order: List[str] = [markers[token] for token in pieces[1::2]]
+
+        if not self._verify():
+            self._fragments = None  # 기준 출력과 다르면 빠른 경로 사용 안 함
+
+    def _verify(self) -> bool:
+        """이스케이프가 필요한 예시 값으로 기준 출력(json.dumps)과 같은지 확인"""
+        samples = [
+            ({name: f'"{name}"\\\n\t\x01 값 ✓' for name in self.slots}, {'guide': '/a b'}),
+            ({name: position for position, name in enumerate(self.slots)}, None),
+        ]
+        for values, extra in samples:
+            expected = _substitute(self.data, {slot_marker(name): value for name, value in values.items()})
+            if extra:
+                if not isinstance(expected, dict):
+                    continue
+                expected.update(extra)
+            if self.encode(values, extra) != encode_json(expected):
+                return False
+        return True
+
+    def encode(self, values: Dict[str, object], extra: Optional[Dict[str, object]] = None) -> Optional[bytes]:
+        """
+        자리 값을 끼워 넣은 JSON
+
+        Args:
+            values: 자리 이름 → 값
+            extra: 최상위 객체 끝에 붙일 키 → 값 (data.json의 guide)
+
+        Returns:
+            UTF-8 JSON (빠른 경로로 만들 수 없는 값이면 None - 호출한 쪽에서 encode_json 사용)
+        """
+        if self._fragments is None:
+            return None
+
+        encoded = {}
+        for name in self.slots:
+            encoded[name] = _encode_value(values[name])
+            if encoded[name] is None:
+                return None
+
+        fragments = self._fragments
+        parts = [fragments[0]]
+        for position, name in enumerate(self._order, start=1):
+            parts.append(encoded[name])
+            parts.append(fragments[position])
+
+        if extra:
+            # 비어 있지 않은 최상위 객체 끝 "\n}" 앞에 키 추가 (json.dumps 키 순서와 같음)
+            if not self._top_keys or any(key in self._top_keys for key in extra):
+                return None
+            tail = parts.pop()
+            if not tail.endswith('\n}'):
+                return None
+            parts.append(tail[:-2])
+            for key, value in extra.items():
+                value = _encode_value(value)
+                if value is None:
+                    return None
+                parts.append(f",\n{INDENT}{encode_basestring(key)}: {value}")
+            parts.append('\n}')
+
+        return ''.join(parts).encode('utf-8')
+
+
+def encode_subjects(subjects: Sequence[Tuple[str, Sequence[str]]]) -> bytes:
+    """
+    subjects.json 내용 ({"subjects": [{"title": ..., "lists": [...]}]} 을 json.dumps 한 것과 같음)
+
+    Args:
+        subjects: [(제목, 목록 문자열들)] (차시마다 하나)
+    """
+    if not subjects:
+        return encode_json({"subjects": []})
+
+    items = []
+    for title, lists in subjects:
+        if lists:
+            values = ',\n\t\t\t\t'.join(map(encode_basestring, lists))
+            lists_text = f"[\n\t\t\t\t{values}\n\t\t\t]"
+        else:
+            lists_text = '[]'
+        items.append(f'\t\t{{\n\t\t\t"title": {encode_basestring(title)},\n\t\t\t"lists": {lists_text}\n\t\t}}')
+    return ('{\n\t"subjects": [\n' + ',\n'.join(items) + '\n\t]\n}').encode('utf-8')
@@ -0,0 +1,425 @@
+"""
+링크 검사 모듈 (--check-links)
+
+생성한 과정의 강의영상(video_url), 다운로드(download_url), 차시별 guide URL 중 고유한 URL마다
+HEAD 요청을 보내 깨진 링크를 찾는다.
+
+- asyncio 스트림으로 HTTP/1.1 HEAD 요청을 직접 보냄 (추가 의존성 없음)
+- 호스트마다 keep-alive 연결을 재사용하고 동시 요청 수를 제한 (--link-concurrency)
+- 리다이렉트는 MAX_REDIRECTS번까지 따라가고, HEAD를 거부하는 서버(405/501)는 GET(Range: bytes=0-0)으로 확인
+- 정상으로 확인된 URL은 ~/.content-generator/link_cache.json 에 저장해 TTL 동안 다시 검사하지 않음
+  (깨진 링크는 저장하지 않아 고친 뒤 다시 실행하면 바로 다시 확인)
+"""
+
+import asyncio
+import json
+import os
+import ssl
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from .config import CONFIG_DIR
+
+
+LINK_CACHE_FILE = CONFIG_DIR / 'link_cache.json'
+
+# 기본값: 정상 링크 캐시 유지 시간(시간), 호스트당 동시 요청 수, 요청당 제한 시간(초)
+DEFAULT_CACHE_TTL = 24
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 10.0
+
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# HEAD를 지원하지 않는 서버 응답 (GET으로 다시 확인)
+HEAD_UNSUPPORTED_STATUSES = (405, 501)
+
+# GET 응답 본문을 읽고 연결을 재사용할 최대 크기 (넘으면 연결을 닫음)
+MAX_DRAIN_BYTES = 64 * 1024
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+USER_AGENT = 'content-generator/1.0 (link-check)'
+
+# 과정 요약의 차시 항목에서 검사할 URL (download_url은 guide로 채워진 값)
+LINK_FIELDS = (('video_url', '영상'), ('download_url', '자료'))
+
+
+def course_links(course: Dict) -> List[Tuple[str, str]]:
+    """
+    과정 요약 → 검사할 링크 목록
+
+    Args:
+        course: 과정 요약 (batch_log.success_result의 "course")
+
+    Returns:
+        [(URL, "과정코드 N차시 영상")]
+    """
+    links = []
+    for lesson in course['lessons']:
+        for field, label in LINK_FIELDS:
+            url = lesson.get(field)
+            if url:
+                links.append((url, f"{course['course_code']} {lesson['number']}차시 {label}"))
+    return links
+
+
+class LinkSet:
+    """검사할 고유 URL과 URL을 쓰는 차시 목록"""
+
+    def __init__(self):
+        self.references: Dict[str, List[str]] = {}
+
+    def add_course(self, course: Dict):
+        """과정 요약의 링크 추가"""
+        for url, reference in course_links(course):
+            self.references.setdefault(url, []).append(reference)
+
+    def add_result(self, result: Dict) -> Dict:
+        """배치 결과의 링크 추가 (실패한 시트는 건너뜀) 후 결과를 그대로 반환"""
+        if 'course' in result:
+            self.add_course(result['course'])
+        return result
+
+    def __len__(self) -> int:
+        return len(self.references)
+
+
+class LinkCache:
+    """정상으로 확인된 URL 캐시 (TTL이 지나면 다시 검사)"""
+
+    def __init__(self, ttl_hours: float = DEFAULT_CACHE_TTL, cache_file: Path = LINK_CACHE_FILE):
+        """
+        Args:
+            ttl_hours: 캐시 유지 시간 (시간)
+            cache_file: 캐시 파일
+        """
+        self.ttl = ttl_hours * 3600
+        self.cache_file = Path(cache_file)
+        self.entries = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """캐시 파일 읽기 (만료된 항목 제외, 없거나 깨진 파일은 빈 캐시)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+
+        now = time.time()
+        return {
+            url: entry for url, entry in entries.items()
+            if isinstance(entry, dict) and now - entry.get('checked_at', 0) < self.ttl
+        }
+
+    def get(self, url: str) -> Optional[Dict]:
+        """캐시 항목 ({"status", "checked_at"}, 없거나 만료되면 None)"""
+        entry = self.entries.get(url)
+        if entry is None or time.time() - entry['checked_at'] >= self.ttl:
+            return None
+        return entry
+
+    def put(self, url: str, status: int):
+        """정상 확인 결과 저장 (save() 전까지는 메모리에만)"""
+        self.entries[url] = {"status": status, "checked_at": time.time()}
+
+    def save(self):
+        """캐시 파일 쓰기 (다른 실행이 그 사이 저장한 항목과 합침, 임시 파일 후 교체)"""
+        entries = self._load()
+        for url, entry in self.entries.items():
+            if entry['checked_at'] >= entries.get(url, {}).get('checked_at', 0):
+                entries[url] = entry
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=self.cache_file.parent, prefix='.link_cache-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(temp_name, self.cache_file)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+        self.entries = entries
+
+
+class _HostPool:
+    """호스트 하나의 keep-alive 연결 묶음 (동시 요청 수 제한)"""
+
+    def __init__(self, scheme: str, host: str, port: int, limit: int,
+                 ssl_context: Optional[ssl.SSLContext]):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context if scheme == 'https' else None
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.opened = 0
+
+    async def acquire(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """
+        연결 하나 가져오기 (쉬고 있는 연결 우선)
+
+        Returns:
+            (reader, writer, 재사용 여부)
+        """
+        if self.idle:
+            reader, writer = self.idle.pop()
+            return reader, writer, True
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl_context)
+        self.opened += 1
+        return reader, writer, False
+
+    def release(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, keep_alive: bool):
+        """요청이 끝난 연결 반환 (keep-alive가 아니면 닫음)"""
+        if keep_alive and not reader.at_eof():
+            self.idle.append((reader, writer))
+        else:
+            writer.close()
+
+    def close(self):
+        """쉬고 있는 연결 모두 닫기"""
+        for _, writer in self.idle:
+            writer.close()
+        self.idle.clear()
+
+
+async def _read_response(reader: asyncio.StreamReader, method: str) -> Tuple[int, Dict[str, str], bool]:
+    """
+    응답 상태와 헤더 읽기 (GET이면 작은 본문은 읽어 버림)
+
+    Returns:
+        (상태 코드, 헤더 - 이름은 소문자, 연결 재사용 가능 여부)
+
+    Raises:
+        ValueError: HTTP 응답이 아닌 경우
+    """
+    while True:
+        status_line = (await reader.readuntil(b'\r\n')).decode('latin-1').strip()
+        parts = status_line.split(' ', 2)
+        if len(parts) < 2 or not parts[0].startswith('HTTP/') or not parts[1].isdigit():
+            raise ValueError(f"HTTP 응답이 아닙니다: {status_line[:60]}")
+        status = int(parts[1])
+
+        headers = {}
+        while True:
+            line = (await reader.readuntil(b'\r\n')).decode('latin-1')
+            if line == '\r\n':
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if status >= 200:
+            break  # 100 Continue 등 중간 응답은 건너뜀
+
+    connection = headers.get('connection', '').lower()
+    if parts[0] == 'HTTP/1.0':
+        keep_alive = connection == 'keep-alive'
+    else:
+        keep_alive = connection != 'close'
+
+    if method == 'GET':
+        length = headers.get('content-length', '')
+        if length.isdigit() and int(length) <= MAX_DRAIN_BYTES and 'transfer-encoding' not in headers:
+            await reader.readexactly(int(length))
+        else:
+            keep_alive = False
+
+    return status, headers, keep_alive
+
+
+class LinkChecker:
+    """URL 목록을 HEAD 요청으로 검사 (호스트별 keep-alive 연결 재사용, 동시 요청 수 제한)"""
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                 cache: Optional[LinkCache] = None):
+        """
+        Args:
+            concurrency: 호스트당 동시 요청 수
+            timeout: 요청 하나의 제한 시간 (초, 연결 포함)
+            cache: 정상 링크 캐시 (None이면 항상 검사)
+        """
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.cache = cache
+        self.requests = 0
+        self.connections = 0
+
+    def check(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """
+        URL 검사 (캐시에 있는 정상 URL은 건너뜀)
+
+        Args:
+            urls: 검사할 URL (중복은 한 번만 검사)
+
+        Returns:
+            {URL: {"ok", "status" (응답 없으면 None), "error" (실패 이유, 정상이면 None), "cached"}}
+            (URL 순서 유지)
+        """
+        results: Dict[str, Optional[Dict]] = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            entry = self.cache.get(url) if self.cache is not None else None
+            if entry is not None:
+                results[url] = {"ok": True, "status": entry['status'], "error": None, "cached": True}
+            else:
+                results[url] = None
+                pending.append(url)
+
+        if pending:
+            checked = asyncio.run(self._check_all(pending))
+            for url, result in zip(pending, checked):
+                results[url] = result
+                if result['ok'] and self.cache is not None:
+                    self.cache.put(url, result['status'])
+            if self.cache is not None:
+                self.cache.save()
+
+        return results
+
+    async def _check_all(self, urls: List[str]) -> List[Dict]:
+        """URL 목록 동시 검사 (호스트마다 연결 묶음 하나)"""
+        pools: Dict[Tuple[str, str, int], _HostPool] = {}
+        ssl_context = ssl.create_default_context()
+        try:
+            return await asyncio.gather(*(self._check(url, pools, ssl_context) for url in urls))
+        finally:
+            for pool in pools.values():
+                self.connections += pool.opened
+                pool.close()
+
+    async def _check(self, url: str, pools: Dict, ssl_context: ssl.SSLContext) -> Dict:
+        """URL 하나 검사 (리다이렉트, HEAD 미지원 서버 처리)"""
+        target = url
+        method = 'HEAD'
+        redirects = 0
+        while True:
+            try:
+                parts = urlsplit(target)
+                if parts.scheme not in DEFAULT_PORTS or not parts.hostname:
+                    raise ValueError(f"지원하지 않는 URL: {target}")
+                key = (parts.scheme, parts.hostname, parts.port or DEFAULT_PORTS[parts.scheme])
+                if key not in pools:
+                    pools[key] = _HostPool(*key, limit=self.concurrency, ssl_context=ssl_context)
+                pool = pools[key]
+
+                # 제한 시간은 차례를 기다린 뒤부터
+                async with pool.semaphore:
+                    status, headers = await asyncio.wait_for(
+                        self._request(pool, parts, method), self.timeout
+                    )
+            except asyncio.TimeoutError:
+                return self._failure(f"시간 초과 ({self.timeout:g}초)")
+            except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+                return self._failure(str(e) or type(e).__name__)
+
+            if method == 'HEAD' and status in HEAD_UNSUPPORTED_STATUSES:
+                method = 'GET'
+                continue
+            if status in REDIRECT_STATUSES and headers.get('location'):
+                redirects += 1
+                if redirects > MAX_REDIRECTS:
+                    return self._failure(f"리다이렉트가 너무 많습니다 ({MAX_REDIRECTS}번 초과)")
+                target = urljoin(target, headers['location'])
+                continue
+            return {
+                "ok": 200 <= status < 400,
+                "status": status,
+                "error": None if 200 <= status < 400 else f"HTTP {status}",
+                "cached": False,
+            }
+
+    async def _request(self, pool: _HostPool, parts, method: str) -> Tuple[int, Dict[str, str]]:
+        """
+        요청 하나 보내고 응답 읽기
+
+        재사용한 keep-alive 연결을 서버가 이미 닫았으면 새 연결로 한 번 더 보낸다.
+        """
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        host = parts.netloc.rpartition('@')[2]
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {host}",
+            f"User-Agent: {USER_AGENT}",
+            "Accept: */*",
+            "Connection: keep-alive",
+        ]
+        if method == 'GET':
+            lines.append("Range: bytes=0-0")
+        request = ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+        for attempt in range(2):
+            reader, writer, reused = await pool.acquire()
+            try:
+                self.requests += 1
+                writer.write(request)
+                await writer.drain()
+                status, headers, keep_alive = await _read_response(reader, method)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            pool.release(reader, writer, keep_alive)
+            return status, headers
+
+    @staticmethod
+    def _failure(error: str) -> Dict:
+        """응답을 받지 못한 경우의 결과"""
+        return {"ok": False, "status": None, "error": error, "cached": False}
+
+
+def run_link_check(links: LinkSet, concurrency: int = DEFAULT_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                   cache_ttl: float = DEFAULT_CACHE_TTL) -> int:
+    """
+    링크 검사 단계: 검사 후 깨진 링크와 그 링크를 쓰는 차시 출력
+
+    Args:
+        links: 검사할 링크
+        concurrency: 호스트당 동시 요청 수
+        timeout: 요청 하나의 제한 시간 (초)
+        cache_ttl: 정상 링크 캐시 유지 시간 (시간, 0이면 캐시 사용 안 함)
+
+    Returns:
+        깨진 링크 수
+    """
+    if not links:
+        print("🔗 검사할 링크가 없습니다")
+        return 0
+
+    cache = LinkCache(ttl_hours=cache_ttl) if cache_ttl > 0 else None
+    checker = LinkChecker(concurrency=concurrency, timeout=timeout, cache=cache)
+    started = time.perf_counter()
+    results = checker.check(links.references)
+    elapsed = time.perf_counter() - started
+
+    cached_count = sum(1 for result in results.values() if result['cached'])
+    print(f"🔗 링크 검사: 고유 URL {len(results)}개 "
+          f"(캐시 {cached_count}개, 요청 {checker.requests}개 / 연결 {checker.connections}개, {elapsed:.2f}초)")
+
+    broken = [(url, result) for url, result in results.items() if not result['ok']]
+    if not broken:
+        print(f"✅ 링크 {len(results)}개 모두 정상")
+        return 0
+
+    print(f"❌ 깨진 링크 {len(broken)}개:")
+    for url, result in broken:
+        references = links.references[url]
+        shown = ', '.join(references[:3])
+        if len(references) > 3:
+            shown += f" 외 {len(references) - 3}곳"
+        print(f"   - {url}")
+        print(f"     {result['error']} ← {shown}")
+    return len(broken)
@@ -0,0 +1,273 @@
+"""
+작업 매니페스트 모듈 (여러 워크북 한 번에 처리)
+
+-i 에 워크북 대신 작업 매니페스트(.json), 폴더, 글롭 패턴을 주면 여러 워크북을 작업 목록 하나로 묶어
+프로세스 하나와 워커 풀 하나(--jobs)로 처리한다. 워크북마다 프로세스를 새로 띄우지 않는다.
+
+매니페스트 형식 (경로는 매니페스트 파일 기준 상대 경로):
+    {
+      "defaults": {"output": "./output", "template": "ct2022"},
+      "jobs": [
+        {"input": "25ctvibec.xlsx"},
+        {"input": "25itbasic.xlsx", "sheets": ["25itbasic"], "template": "it2023", "output": "./it"},
+        {"input": "term2/*.xlsx"}
+      ]
+    }
+    - sheets: 생략하면 모든 시트 ('TTL' 제외), CSV는 파일 하나가 과정 하나
+    - template, output: 작업 > defaults > CLI 옵션(-t, -o) 순서로 적용
+    - input이 글롭 패턴이면 맞는 파일마다 작업 하나
+
+폴더/글롭 입력 (-i ./term2, -i "term2/*.xlsx"): 파일마다 모든 시트, 템플릿/출력은 CLI 옵션.
+
+처리 순서:
+    1. 파싱: 워크북 단위로 워커 풀에서 파싱 (워크북은 한 번만 열기)
+    2. 중복 검사: 여러 시트가 같은 과정 코드를 만들면 아무것도 쓰기 전에 중단
+    3. 생성 전 검사: 파싱(데이터 검사 포함)에 실패한 시트가 있으면 아무것도 쓰기 전에 중단
+    4. 생성: 시트 단위로 같은 워커 풀에서 생성 (결과는 작업 순서대로 출력/기록)
+"""
+
+import glob
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .batch_log import success_result
+from .cache import CourseCache
+from .generator import ContentGenerator
+from .models import Course
+from .parser import parse_course_file, CourseDataParser, WorkbookSession
+from .template_registry import get_registry, AUTO_TEMPLATE
+
+
+# 매니페스트 작업 항목 키
+JOB_KEYS = ('input', 'sheets', 'template', 'output')
+
+# 폴더 입력에서 찾는 파일 형식
+WORKBOOK_SUFFIXES = ('.xlsx', '.csv')
+
+GLOB_CHARACTERS = '*?['
+
+
+def is_manifest_input(value: str) -> bool:
+    """-i 값이 작업 매니페스트/폴더/글롭 패턴인지 여부 (있는 워크북 파일이면 이름에 [ 등이 있어도 워크북)"""
+    if '://' in value:
+        return False  # URL
+    if not value.endswith('.json') and Path(value).is_file():
+        return False
+    return (
+        value.endswith('.json')
+        or Path(value).is_dir()
+        or any(char in value for char in GLOB_CHARACTERS)
+    )
+
+
+def _expand_pattern(pattern: str) -> List[str]:
+    """
+    폴더 또는 글롭 패턴 → 워크북 파일 목록 (이름 순, 같은 이름의 파일이 있으면 그 파일)
+
+    Raises:
+        ValueError: 맞는 파일이 없는 경우
+    """
+    path = Path(pattern)
+    if path.is_dir():
+        files = [str(child) for child in sorted(path.iterdir())
+                 if child.suffix in WORKBOOK_SUFFIXES and not child.name.startswith(('.', '~$'))]
+    elif path.is_file():
+        files = [pattern]  # "25ctvibec[final].xlsx" 처럼 글롭 문자가 들어간 실제 파일 이름
+    elif any(char in pattern for char in GLOB_CHARACTERS):
+        files = sorted(name for name in glob.glob(pattern) if not Path(name).name.startswith('~$'))
+    else:
+        raise ValueError(f"파일을 찾을 수 없습니다: {pattern}")
+
+    if not files:
+        raise ValueError(f"처리할 워크북이 없습니다: {pattern}")
+    return files
+
+
+def _make_job(input_file: str, sheets, template: str, output: str) -> Dict:
+    """
+    작업 하나 (검증 포함)
+
+    Raises:
+        ValueError: 값이 잘못된 경우
+    """
+    if template not in get_registry().names() + [AUTO_TEMPLATE]:
+        raise ValueError(f"지원하지 않는 템플릿: {template} ({input_file})")
+    if sheets is not None:
+        if not isinstance(sheets, list) or not sheets:
+            raise ValueError(f"sheets는 시트 이름/인덱스 목록이어야 합니다 ({input_file})")
+        if Path(input_file).suffix != '.xlsx':
+            raise ValueError(f"sheets는 엑셀 파일(.xlsx)에만 지정할 수 있습니다 ({input_file})")
+    return {"input": input_file, "sheets": sheets, "template": template, "output": output}
+
+
+def load_jobs(value: str, template: str, output: str) -> List[Dict]:
+    """
+    -i 값(작업 매니페스트, 폴더, 글롭 패턴) → 작업 목록
+
+    Args:
+        value: 매니페스트 경로(.json), 폴더, 또는 글롭 패턴
+        template: 기본 템플릿 (CLI -t)
+        output: 기본 출력 디렉토리 (CLI -o)
+
+    Returns:
+        [{"input", "sheets" (None이면 모든 시트), "template", "output"}]
+
+    Raises:
+        ValueError: 매니페스트 형식이 잘못되었거나 입력 파일이 없는 경우
+    """
+    if not value.endswith('.json'):
+        return [_make_job(input_file, None, template, output) for input_file in _expand_pattern(value)]
+
+    manifest_path = Path(value)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f"작업 매니페스트를 찾을 수 없습니다: {value}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"작업 매니페스트 JSON 오류: {value} ({e})")
+
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('jobs'), list) or not manifest['jobs']:
+        raise ValueError(f"작업 매니페스트에 jobs 목록이 필요합니다: {value}")
+
+    defaults = manifest.get('defaults', {})
+    if not isinstance(defaults, dict):
+        raise ValueError("defaults는 JSON 객체여야 합니다")
+    base_dir = manifest_path.parent
+
+    def resolve(path: str) -> str:
+        return str(base_dir / Path(path).expanduser())
+
+    jobs = []
+    for number, entry in enumerate(manifest['jobs'], start=1):
+        if not isinstance(entry, dict) or not entry.get('input'):
+            raise ValueError(f"작업 {number}: input(워크북 경로)이 필요합니다")
+        unknown = sorted(set(entry) - set(JOB_KEYS))
+        if unknown:
+            raise ValueError(f"작업 {number}: 알 수 없는 항목 {', '.join(unknown)} (사용 가능: {', '.join(JOB_KEYS)})")
+
+        job_template = entry.get('template', defaults.get('template', template))
+        job_output = entry['output'] if 'output' in entry else defaults.get('output')
+        job_output = resolve(job_output) if job_output is not None else output
+        for input_file in _expand_pattern(resolve(entry['input'])):
+            jobs.append(_make_job(input_file, entry.get('sheets', defaults.get('sheets')), job_template, job_output))
+    return jobs
+
+
+def parse_job(job: Dict, engine: str, use_cache: bool) -> List[Dict]:
+    """
+    작업 하나의 대상 시트 파싱 (워크북은 한 번만 열기)
+
+    Args:
+        job: 작업 (load_jobs 결과 항목)
+        engine: 엑셀 파서 엔진
+        use_cache: 파싱 결과 캐시 사용 여부
+
+    Returns:
+        시트 순서대로 [{"sheet_name", "course_data"}] 또는 실패 시 [{"sheet_name", "error"}]
+    """
+    cache = CourseCache(version=CourseDataParser.LOGIC_VERSION) if use_cache else None
+    input_name = Path(job['input']).name
+
+    if Path(job['input']).suffix != '.xlsx':
+        print(f"📖 데이터 파싱 중: {input_name}")
+        return [_parse_sheet(job, None, None, engine, cache)]
+
+    try:
+        workbook = WorkbookSession(job['input'], engine=engine)
+    except Exception as e:
+        print(f"❌ {input_name} 열기 실패: {e}")
+        return [{"sheet_name": None, "error": str(e)}]
+
+    with workbook:
+        if job['sheets'] is None:
+            sheets = [name for name in workbook.sheet_names if name != 'TTL']
+        else:
+            sheets = job['sheets']
+        print(f"📖 데이터 파싱 중: {input_name} (시트 {len(sheets)}개)")
+
+        uncached = [sheet for sheet in sheets if cache is None or not cache.contains(job['input'], sheet)]
+        try:
+            workbook.load_sheets(uncached)
+        except ValueError:
+            pass  # 없는 시트는 시트별로 실패 처리
+
+        return [_parse_sheet(job, sheet, workbook, engine, cache) for sheet in sheets]
+
+
+def _parse_sheet(job: Dict, sheet, workbook: Optional[WorkbookSession], engine: str,
+                 cache: Optional[CourseCache]) -> Dict:
+    """시트 하나 파싱 → {"sheet_name", "course_data"} 또는 {"sheet_name", "error"}"""
+    try:
+        course_data = parse_course_file(job['input'], sheet, workbook=workbook, engine=engine, cache=cache)
+    except Exception as e:
+        print(f"❌ {Path(job['input']).name} [{sheet}] 파싱 실패: {e}")
+        return {"sheet_name": sheet, "error": str(e)}
+    return {"sheet_name": sheet, "course_data": course_data}
+
+
+def find_duplicate_courses(parsed: List[Tuple[Dict, List[Dict]]]) -> Dict[str, List[str]]:
+    """
+    같은 과정 코드를 만드는 시트 찾기
+
+    Args:
+        parsed: [(작업, parse_job 결과)]
+
+    Returns:
+        {과정 코드: ["워크북 [시트]", ...]} (중복된 과정 코드만)
+    """
+    sources: Dict[str, List[str]] = {}
+    for job, entries in parsed:
+        for entry in entries:
+            if 'course_data' in entry:
+                code = entry['course_data'].course_code
+                sources.setdefault(code, []).append(f"{job['input']} [{entry['sheet_name']}]")
+    return {code: names for code, names in sources.items() if len(names) > 1}
+
+
+def generate_course(job: Dict, sheet, course_data: Course, options: Dict) -> Dict:
+    """
+    파싱된 시트 하나 생성
+
+    Args:
+        job: 작업
+        sheet: 시트 이름
+        course_data: 파싱된 과정 데이터
+        options: 생성 옵션 (index_mode, output_format, writer_threads, verbose, dry_run)
+
+    Returns:
+        배치 결과 (과정 요약에 입력 파일/템플릿 포함, dry-run 성공 시 status가 planned)
+    """
+    try:
+        generator = ContentGenerator(
+            course_data=course_data,
+            output_dir=job['output'],
+            template=job['template'],
+            input_file=job['input'],
+            index_mode=options['index_mode'],
+            writer_threads=options['writer_threads'],
+            verbose=options['verbose'],
+            output_format=options['output_format'],
+            history_log=False  # 매니페스트 실행 하나로 기록
+        )
+        generator.generate(dry_run=options['dry_run'])
+    except Exception as e:
+        print(f"❌ {Path(job['input']).name} [{sheet}] 생성 실패: {e}")
+        return {
+            "sheet_name": sheet,
+            "course_code": None,
+            "status": "failed",
+            "error": str(e),
+            "input_file": job['input']
+        }
+
+    if options['dry_run']:
+        result = success_result(sheet, generator, status="planned")
+    else:
+        print(f"✅ {course_data.course_code} 생성 완료")
+        print()
+        result = success_result(sheet, generator)
+    result['course']['input_file'] = job['input']
+    result['course']['template'] = generator.template
+    return result
@@ -0,0 +1,190 @@
+"""
+과정 데이터 모델
+
+파서가 만드는 과정 데이터(Course)와 차시(Lesson), 챕터(Chapter).
+수만 차시 과정도 가볍게 들고 있도록 __slots__ 객체로 두고, 반복되는 값은 저장하지 않는다.
+
+    - 차시 번호 문자열('01')은 차시 인덱스에서 바로 만든다 (차시마다 문자열을 들고 있지 않음)
+    - 챕터는 차시 번호 목록 대신 과정 차시 목록에서의 위치 범위만 가진다
+    - 생성기에서 쓰는 조회용 인덱스(챕터 시작 차시 테이블, 기본 guide)는 과정을 만들 때 한 번 계산한다
+
+생성 이력 등 JSON으로 남길 때는 to_dict()로 이전과 같은 딕셔너리 형식으로 내보낸다.
+"""
+
+from typing import Dict, List, Optional
+
+
+class Lesson:
+    """차시 하나"""
+
+    __slots__ = ('index', 'order', 'title', 'video_url', 'download_url')
+
+    def __init__(self, index: int, order: Optional[int], title, video_url: Optional[str],
+                 download_url: Optional[str]):
+        """
+        Args:
+            index: 차시 번호 (빈 셀이면 행 번호)
+            order: 각 Part내 차시 순서 (없으면 None)
+            title: 차시명
+            video_url: 강의영상 링크 (정규화됨)
+            download_url: 다운로드 링크 (정규화됨, 없으면 None)
+        """
+        self.index = index
+        self.order = order
+        self.title = title
+        self.video_url = video_url
+        self.download_url = download_url
+
+    @property
+    def number(self) -> str:
+        """차시 폴더 이름 (두 자리 차시 번호, 예: '01')"""
+        return f"{self.index:02d}"
+
+    def to_dict(self) -> Dict:
+        """딕셔너리 형식 (이전 과정 데이터의 차시 항목과 같음)"""
+        return {
+            'index': self.index,
+            'number': self.number,
+            'order': self.order,
+            'title': self.title,
+            'video_url': self.video_url,
+            'download_url': self.download_url,
+        }
+
+
+class Chapter:
+    """챕터 하나 (과정 차시 목록에서 연속된 구간)"""
+
+    __slots__ = ('number', 'name', 'lesson_start', 'positions', 'guide')
+
+    def __init__(self, number: int, name, lesson_start: int, positions: range):
+        """
+        Args:
+            number: 챕터구분 값
+            name: 챕터명
+            lesson_start: 챕터 첫 차시의 차시 번호
+            positions: 챕터에 속한 차시의 위치 (Course.lessons 기준)
+        """
+        self.number = number
+        self.name = name
+        self.lesson_start = lesson_start
+        self.positions = positions
+        self.guide = ""  # 챕터 첫 차시의 다운로드 URL (Course에서 계산)
+
+
+class Course:
+    """
+    과정 데이터
+
+    Attributes:
+        course_code: 과정 코드 (강의영상 링크에서 추출, 없으면 None)
+        subject: 과정명
+        lessons: 차시 목록 (시트 순서)
+        chapters: 챕터 목록 (시트 순서)
+        chapter_starts: 챕터 시작 차시 테이블 (정렬됨, bisect로 차시가 속한 챕터 위치 조회)
+        default_guide: 과정의 첫 다운로드 URL (없으면 빈 문자열)
+    """
+
+    __slots__ = ('course_code', 'subject', 'lessons', 'chapters', 'chapter_starts', 'default_guide')
+
+    def __init__(self, course_code: Optional[str], subject, lessons: List[Lesson], chapters: List[Chapter]):
+        """
+        Args:
+            course_code: 과정 코드
+            subject: 과정명
+            lessons: 차시 목록
+            chapters: 챕터 목록
+        """
+        self.course_code = course_code
+        self.subject = subject
+        self.lessons = lessons
+        self.chapters = chapters
+        self._index()
+
+    def _index(self):
+        """
+        생성기에서 쓰는 조회용 인덱스 계산
+
+        - chapters[*].guide: 챕터 첫 차시의 다운로드 URL (없으면 default_guide)
+        - chapter_starts: 차시가 속한 챕터 = lesson_start가 차시 번호 이하인 마지막 챕터
+        """
+        download_by_index = {}
+        default_guide = ""
+        for lesson in self.lessons:
+            if lesson.download_url:
+                download_by_index.setdefault(lesson.index, lesson.download_url)
+                default_guide = default_guide or lesson.download_url
+
+        for chapter in self.chapters:
+            first = self.lessons[chapter.positions[0]] if chapter.positions else None
+            chapter.guide = (first is not None and download_by_index.get(first.index)) or default_guide
+
+        # 뒤에서부터 누적 최솟값을 쓰면 챕터 순서가 뒤섞여 있어도 정렬된 테이블이 된다
+        chapter_starts = []
+        minimum_start = None
+        for chapter in reversed(self.chapters):
+            if minimum_start is None or chapter.lesson_start < minimum_start:
+                minimum_start = chapter.lesson_start
+            chapter_starts.append(minimum_start)
+        chapter_starts.reverse()
+
+        self.chapter_starts = chapter_starts
+        self.default_guide = default_guide
+
+    @property
+    def total_lessons(self) -> int:
+        """총 차시 수"""
+        return len(self.lessons)
+
+    def chapter_lesson_numbers(self, chapter: Chapter) -> List[str]:
+        """챕터에 속한 차시 번호 목록"""
+        return [self.lessons[position].number for position in chapter.positions]
+
+    def to_dict(self) -> Dict:
+        """
+        딕셔너리 형식 (이전 과정 데이터 형식, JSON 출력/이력용)
+
+        Returns:
+            {'course_code', 'subject', 'chapters': [{'number', 'name', 'lesson_start', 'lessons', 'guide'}],
+             'lessons': [{'index', 'number', 'order', 'title', 'video_url', 'download_url'}], 'total_lessons'}
+        """
+        return {
+            'course_code': self.course_code,
+            'subject': self.subject,
+            'chapters': [
+                {
+                    'number': chapter.number,
+                    'name': chapter.name,
+                    'lesson_start': chapter.lesson_start,
+                    'lessons': self.chapter_lesson_numbers(chapter),
+                    'guide': chapter.guide,
+                }
+                for chapter in self.chapters
+            ],
+            'lessons': [lesson.to_dict() for lesson in self.lessons],
+            'total_lessons': self.total_lessons,
+        }
+
+    @classmethod
+    def from_dict(cls, course_data: Dict) -> 'Course':
+        """
+        딕셔너리 형식 과정 데이터 → Course (직접 만든 과정 데이터, to_dict 결과)
+
+        챕터의 lessons는 차시 번호 목록으로, 과정 차시 목록에서 연속된 구간이어야 한다.
+        """
+        lessons = [
+            Lesson(lesson['index'], lesson.get('order'), lesson['title'], lesson['video_url'],
+                   lesson.get('download_url'))
+            for lesson in course_data['lessons']
+        ]
+        first_position = {}
+        for position, lesson in enumerate(lessons):
+            first_position.setdefault(lesson.number, position)
+
+        chapters = []
+        for chapter in course_data.get('chapters', []):
+            numbers = chapter.get('lessons', [])
+            start = first_position.get(numbers[0], len(lessons)) if numbers else len(lessons)
+            chapters.append(Chapter(chapter['number'], chapter.get('name'), chapter['lesson_start'],
+                                    range(start, min(start + len(numbers), len(lessons)))))
+        return cls(course_data['course_code'], course_data['subject'], lessons, chapters)
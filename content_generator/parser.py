@@ -1,10 +1,44 @@
 """
 엑셀/CSV 파일 파싱 모듈
+
+pandas/numpy/openpyxl은 가져오는 데 시간이 걸리므로 실제로 엑셀을 읽을 때 가져온다.
+(--help, 인자 오류 등은 빠르게 끝나도록)
 """
 
-import pandas as pd
+import csv
+import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from . import profiler
+from .cache import CourseCache
+from .models import Chapter, Course, Lesson
+from .validator import check_sheet, course_segment, format_issue, ERROR, WARNING, REQUIRED_COLUMNS
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# 파서 엔진 (pandas: DataFrame 기반, openpyxl: 행 단위 스트리밍, native: zip/XML 직접 읽기)
+ENGINES = ('pandas', 'openpyxl', 'native')
+
+# DataFrame 없이 행 단위로 읽는 엔진
+STREAMING_ENGINES = ('openpyxl', 'native')
+
+# 빈 셀로 취급하는 문자열 (pandas read_excel 기본 결측값과 동일)
+NA_STRINGS = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null',
+])
+
+# 문자열 숫자/불리언 형식 (pandas 컬럼 타입 추론과 같은 규칙)
+INT_PATTERN = re.compile(r'\s*[+-]?[0-9]+\s*')
+FLOAT_PATTERN = re.compile(
+    r'\s*[+-]?(?:(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?|inf|infinity)\s*',
+    re.IGNORECASE
+)
+BOOL_VALUES = {'true': True, 'false': False}
 
 
 class CourseDataParser:
@@ -24,99 +58,199 @@ class CourseDataParser:
         '다운로드(zip) 링크': 'download_url',
     }
 
-    REQUIRED_COLUMNS = ['과정명', '차시번호', '차시명', '강의영상(mp4) 링크']
+    REQUIRED_COLUMNS = list(REQUIRED_COLUMNS)
 
-    def __init__(self, file_path: str, sheet_name: Optional[str] = None):
+    # 파싱 로직 버전 (결과가 달라지는 변경 시 올리면 이전 파싱 캐시가 무효화됨)
+    # 2: 데이터 검사 추가 (검사 전에 캐시된 결과는 다시 파싱)
+    # 3: 과정 데이터를 딕셔너리 대신 models.Course로 저장
+    LOGIC_VERSION = 3
+
+    # 파싱 실패 메시지에 보여 줄 데이터 오류 수 (전체는 --validate)
+    MAX_REPORTED_ERRORS = 5
+
+    def __init__(self, file_path: str, sheet_name: Optional[str] = None,
+                 workbook: Optional['WorkbookSession'] = None,
+                 dataframe: Optional['pd.DataFrame'] = None,
+                 engine: str = 'pandas',
+                 columns: Optional[Dict[str, List]] = None):
         """
         Args:
             file_path: 엑셀/CSV 파일 경로
             sheet_name: 엑셀 시트 이름 또는 인덱스 (None이면 첫 번째 시트)
+            workbook: 이미 열어 둔 워크북 세션 (None이면 직접 열기)
+            dataframe: 미리 읽어 둔 시트 데이터 (병렬 처리용, 있으면 파일을 읽지 않음)
+            engine: 엑셀 파서 엔진 (pandas, openpyxl, native)
+            columns: 미리 읽어 둔 컬럼 값 (read_columns 결과, 있으면 파일을 읽지 않음)
         """
+        if engine not in ENGINES:
+            raise ValueError(f"지원하지 않는 엔진: {engine}")
+
         self.file_path = Path(file_path)
         self.sheet_name = sheet_name or 0  # 기본값: 첫 번째 시트
-        self.df: Optional[pd.DataFrame] = None
+        self.workbook = workbook
+        self.engine = engine
+        self.df: Optional['pd.DataFrame'] = dataframe
+        self.columns = columns
         self.course_code: Optional[str] = None
+        self.actual_sheet_name = None
+        if columns is not None and self.file_path.suffix == '.xlsx':
+            self.actual_sheet_name = self.sheet_name
 
-    def parse(self) -> Dict:
+    def parse(self) -> Course:
         """
         파일을 파싱하여 과정 데이터 반환
 
         Returns:
-            {
-                'course_code': '25ctvibec',
-                'subject': '과정명',
-                'chapters': [
-                    {
-                        'number': 1,
-                        'name': 'Part.1 ...',
-                        'lessons': [...]
-                    }
-                ],
-                'lessons': [...],
-                'total_lessons': 22
-            }
+            과정 데이터 (models.Course - 차시/챕터 목록과 생성기용 조회 인덱스, 딕셔너리 형식은 to_dict())
         """
+        # 생성 전 검사에서 읽어 둔 컬럼 값
+        if self.columns is not None:
+            self._print_sheet_name()
+            return self._parse_columns(self.columns)
+
+        # 스트리밍 엔진, CSV: DataFrame 없이 행 단위로 읽어 컬럼 값 리스트로 파싱
+        if self._reads_rows():
+            with profiler.phase('parse.stream'):
+                columns = self.read_columns()
+                self._print_sheet_name()
+                return self._parse_columns(columns)
+
         # 데이터 읽기
-        self._load_from_file()
+        with profiler.phase('parse.load'):
+            self._load_from_file()
+        self._print_sheet_name()
 
         # 컬럼 검증
         self._validate_columns()
+        if self.df.empty:
+            raise ValueError("차시 데이터가 없습니다")
+
+        # 데이터 검사 (빈 셀 채우기 전 원래 값으로)
+        with profiler.phase('parse.check'):
+            self._check_data(frame_columns(self.df))
 
         # 데이터 정리
-        self._clean_data()
+        with profiler.phase('parse.clean'):
+            self._clean_data()
 
         # 파싱
-        course_data = self._parse_course_data()
+        with profiler.phase('parse.build'):
+            course_data = self._parse_course_data()
 
         return course_data
 
+    def _reads_rows(self) -> bool:
+        """DataFrame 없이 행 단위로 읽는 경우 (스트리밍 엔진의 엑셀, CSV)"""
+        if self.df is not None:
+            return False
+        return self.file_path.suffix == '.csv' or (
+            self.engine in STREAMING_ENGINES and self.file_path.suffix == '.xlsx'
+        )
+
+    def read_columns(self) -> Dict[str, List]:
+        """
+        시트를 읽어 컬럼별 원래 값 리스트 반환 (과정 데이터는 만들지 않음, 데이터 검사용)
+
+        Returns:
+            {컬럼명: 값 리스트} (COLUMN_MAPPING 컬럼 중 있는 것만, 빈 셀은 None)
+
+        Raises:
+            ValueError: 시트가 없거나 지원하지 않는 파일 형식인 경우
+        """
+        if not self._reads_rows():
+            self._load_from_file()
+            return frame_columns(self.df)
+
+        if self.file_path.suffix == '.csv':
+            # 표준 csv 모듈로 읽기 (빈 줄은 pandas read_csv처럼 건너뜀, pandas 불필요)
+            with open(self.file_path, 'r', encoding='utf-8-sig', newline='') as f:
+                records = [record for record in csv.reader(f) if record]
+            header, records = (records[0], records[1:]) if records else ((), [])
+            return sheet_columns(header, _infer_column_types(records))
+
+        workbook = self.workbook or WorkbookSession(self.file_path, engine=self.engine)
+        try:
+            self.actual_sheet_name = workbook.resolve_sheet_name(self.sheet_name)
+            rows = workbook.iter_rows(self.actual_sheet_name)
+            header = next(rows, ())
+            if self.engine == 'native':
+                # pandas 경로와 같은 값이 나오도록 시트 값을 모아 컬럼 단위 타입 추론
+                rows = _infer_column_types(rows)
+            return sheet_columns(header, rows)
+        finally:
+            if workbook is not self.workbook:
+                workbook.close()
+
     def _load_from_file(self):
         """파일에서 데이터 로드"""
         if self.file_path.suffix == '.xlsx':
-            # 엑셀 파일 - sheet_name 지정 가능
-            try:
-                self.df = pd.read_excel(self.file_path, sheet_name=self.sheet_name)
-
-                # 컬럼명 앞뒤 공백 제거
-                self.df.columns = self.df.columns.str.strip()
-
-                # 사용 중인 시트 이름 출력
-                if isinstance(self.sheet_name, int):
-                    excel_file = pd.ExcelFile(self.file_path)
-                    sheet_names = excel_file.sheet_names
-                    if self.sheet_name < len(sheet_names):
-                        actual_sheet_name = sheet_names[self.sheet_name]
-                        print(f"📄 시트: '{actual_sheet_name}' (인덱스 {self.sheet_name})")
-                else:
-                    print(f"📄 시트: '{self.sheet_name}'")
-
-            except ValueError as e:
-                # 시트가 없는 경우
-                excel_file = pd.ExcelFile(self.file_path)
-                available_sheets = ', '.join([f"'{s}'" for s in excel_file.sheet_names])
-                raise ValueError(
-                    f"시트를 찾을 수 없습니다: {self.sheet_name}\n"
-                    f"사용 가능한 시트: {available_sheets}"
-                )
-        elif self.file_path.suffix == '.csv':
-            self.df = pd.read_csv(self.file_path)
+            # 엑셀 파일 - sheet_name 지정 가능 (세션이 있으면 재사용)
+            if self.df is None:
+                workbook = self.workbook or WorkbookSession(self.file_path)
+                try:
+                    self.actual_sheet_name = workbook.resolve_sheet_name(self.sheet_name)
+                    self.df = workbook.take_sheet(self.actual_sheet_name)
+                finally:
+                    if workbook is not self.workbook:
+                        workbook.close()
+            else:
+                self.actual_sheet_name = self.sheet_name
+
             # 컬럼명 앞뒤 공백 제거
             self.df.columns = self.df.columns.str.strip()
+
+        elif self.file_path.suffix == '.csv':
+            # 미리 읽어 둔 DataFrame (파일은 read_columns에서 직접 읽음)
+            self.df.columns = self.df.columns.str.strip()
         else:
             raise ValueError(f"지원하지 않는 파일 형식: {self.file_path.suffix}")
 
-    def _validate_columns(self):
+    def _print_sheet_name(self):
+        """사용 중인 시트 이름 출력 (엑셀만)"""
+        if self.actual_sheet_name is None:
+            return
+        if isinstance(self.sheet_name, int):
+            print(f"📄 시트: '{self.actual_sheet_name}' (인덱스 {self.sheet_name})")
+        else:
+            print(f"📄 시트: '{self.sheet_name}'")
+
+    def _validate_columns(self, columns: Optional[Iterable[str]] = None):
         """필수 컬럼 확인"""
+        if columns is None:
+            columns = self.df.columns
+
         missing_columns = []
         for col in self.REQUIRED_COLUMNS:
-            if col not in self.df.columns:
+            if col not in columns:
                 missing_columns.append(col)
 
         if missing_columns:
             raise ValueError(f"필수 컬럼 누락: {', '.join(missing_columns)}")
 
+    def _check_data(self, columns: Dict[str, List]):
+        """
+        데이터 검사 (validator.check_sheet): 경고는 건수만 출력
+
+        Raises:
+            ValueError: 데이터 오류가 있는 경우 (행 번호 포함, 앞의 MAX_REPORTED_ERRORS건)
+        """
+        issues = check_sheet(columns)
+        errors = [issue for issue in issues if issue['level'] == ERROR]
+        if errors:
+            lines = [f"데이터 오류 {len(errors)}건:"]
+            lines += [f"   - {format_issue(issue)}" for issue in errors[:self.MAX_REPORTED_ERRORS]]
+            if len(errors) > self.MAX_REPORTED_ERRORS:
+                lines.append(f"   (외 {len(errors) - self.MAX_REPORTED_ERRORS}건, --validate 로 전체 확인)")
+            raise ValueError('\n'.join(lines))
+
+        warning_count = sum(1 for issue in issues if issue['level'] == WARNING)
+        if warning_count:
+            print(f"⚠️  데이터 경고 {warning_count}건 (--validate 로 전체 확인)")
+
     def _clean_data(self):
         """데이터 정리 (빈 셀 채우기)"""
+        import pandas as pd
+
         # 과정명: 첫 번째 행 값으로 모두 채우기
         if '과정명' in self.df.columns:
             first_subject = self.df['과정명'].iloc[0]
@@ -131,62 +265,156 @@ class CourseDataParser:
         # NaN을 None으로 변환
         self.df = self.df.where(pd.notnull(self.df), None)
 
-    def _parse_course_data(self) -> Dict:
-        """과정 데이터 파싱"""
+    def _parse_course_data(self) -> Course:
+        """과정 데이터 파싱 (컬럼 단위 연산)"""
+        import pandas as pd
+
+        df = self.df
+
         # 과정명 추출
-        subject = self.df['과정명'].iloc[0]
+        subject = self._to_value_list(df['과정명'].iloc[:1])[0]
+
+        # 차시번호: 빈 셀은 행 번호로 대체
+        lesson_numbers = df['차시번호']
+        has_number = lesson_numbers.notna()
+        indexes = pd.Series(df.index + 1, index=df.index, dtype='int64')
+        if has_number.any():
+            indexes[has_number] = self._to_int_values(lesson_numbers[has_number])
+        indexes = indexes.tolist()
+
+        # 각 Part내 차시 순서
+        if '차시' in df.columns:
+            orders = self._to_int_list(df['차시'])
+        else:
+            orders = [None] * len(df)
 
-        # 차시 데이터 추출
-        lessons = []
+        if '다운로드(zip) 링크' in df.columns:
+            download_urls = self._normalize_url_column(df['다운로드(zip) 링크'])
+        else:
+            download_urls = [None] * len(df)
+
+        # 차시 데이터
+        lessons = [
+            Lesson(index, order, title, video_url, download_url)
+            for index, order, title, video_url, download_url in zip(
+                indexes,
+                orders,
+                self._to_value_list(df['차시명']),
+                self._normalize_url_column(df['강의영상(mp4) 링크']),
+                download_urls,
+            )
+        ]
+
+        # 챕터 정보 (챕터구분이 변경되는 행이 챕터 시작)
         chapters = []
-        current_chapter = None
-
-        for idx, row in self.df.iterrows():
-            # 차시 데이터
-            lesson = {
-                'index': int(row['차시번호']) if pd.notna(row['차시번호']) else idx + 1,
-                'number': f"{int(row['차시번호']):02d}" if pd.notna(row['차시번호']) else f"{idx + 1:02d}",
-                'order': int(row['차시']) if '차시' in row and pd.notna(row['차시']) else None,  # 각 Part내 차시 순서
-                'title': row['차시명'],
-                'video_url': self._normalize_url(row['강의영상(mp4) 링크']),
-                'download_url': self._normalize_url(row.get('다운로드(zip) 링크')),
-            }
+        if '챕터구분' in df.columns:
+            chapter_numbers = pd.Series(self._to_int_list(df['챕터구분']), dtype='Int64')
+            # 빈 셀은 직전 챕터 유지
+            previous_numbers = chapter_numbers.ffill().shift(1)
+            is_start = chapter_numbers.notna() & (
+                previous_numbers.isna() | (chapter_numbers != previous_numbers)
+            ).fillna(False)
+            start_positions = is_start.to_numpy().nonzero()[0].tolist()
+            end_positions = start_positions[1:] + [len(df)]
+
+            if '챕터명' in df.columns:
+                chapter_names = self._to_value_list(df['챕터명'])
+            else:
+                chapter_names = None
+
+            for start, end in zip(start_positions, end_positions):
+                chapter_num = int(chapter_numbers.iat[start])
+                chapters.append(Chapter(
+                    chapter_num,
+                    chapter_names[start] if chapter_names is not None else f'Part.{chapter_num}',
+                    indexes[start],
+                    range(start, end)
+                ))
+
+        return self._build_course_data(subject, chapters, lessons)
+
+    def _parse_columns(self, columns: Dict[str, List]) -> Course:
+        """
+        컬럼별 값 리스트(sheet_columns 결과)에서 과정 데이터 파싱
+
+        과정명 채우기, 챕터 forward fill을 pandas 경로와 같은 규칙으로 적용한다.
+        """
+        self._validate_columns(columns)
+        row_count = len(columns['차시번호'])
+        if not row_count:
+            raise ValueError("차시 데이터가 없습니다")
+
+        with profiler.phase('parse.check'):
+            self._check_data(columns)
+
+        empty = [None] * row_count
+        subjects = columns['과정명']
+        numbers = columns['차시번호']
+        orders = columns.get('차시', empty)
+        titles = columns['차시명']
+        video_urls = columns['강의영상(mp4) 링크']
+        download_urls = columns.get('다운로드(zip) 링크', empty)
+        chapter_numbers = columns.get('챕터구분', empty)
+        chapter_names = columns.get('챕터명', empty)
+        has_chapter_column = '챕터구분' in columns
+        has_chapter_name_column = '챕터명' in columns
+
+        lessons = []
+        chapter_starts = []  # (챕터 시작 위치, 챕터구분, 챕터명)
+        current_chapter_num = None
+        chapter_value = None  # forward fill 상태
+        chapter_name = None
+
+        for row_index in range(row_count):
+            number = numbers[row_index]
+            order = orders[row_index]
+            lesson = Lesson(
+                int(number) if number is not None else row_index + 1,
+                int(order) if order is not None else None,  # 각 Part내 차시 순서
+                titles[row_index],
+                self._normalize_url(video_urls[row_index]),
+                self._normalize_url(download_urls[row_index]),
+            )
             lessons.append(lesson)
 
-            # 챕터 정보 (챕터구분이 변경될 때)
-            if '챕터구분' in row and pd.notna(row['챕터구분']):
-                chapter_num = int(row['챕터구분'])
-                if current_chapter is None or current_chapter['number'] != chapter_num:
-                    current_chapter = {
-                        'number': chapter_num,
-                        'name': row.get('챕터명', f'Part.{chapter_num}'),
-                        'lesson_start': lesson['index'],
-                        'lessons': []
-                    }
-                    chapters.append(current_chapter)
-
-            if current_chapter:
-                current_chapter['lessons'].append(lesson['number'])
-
-        # 과정 코드 추출 (강의영상 링크에서)
+            # 챕터 정보 (forward fill 후 챕터구분이 변경될 때)
+            chapter_value = self._coalesce(chapter_numbers[row_index], chapter_value)
+            chapter_name = self._coalesce(chapter_names[row_index], chapter_name)
+
+            if has_chapter_column and chapter_value is not None:
+                chapter_num = int(chapter_value)
+                if current_chapter_num != chapter_num:
+                    current_chapter_num = chapter_num
+                    chapter_starts.append((
+                        row_index,
+                        chapter_num,
+                        chapter_name if has_chapter_name_column else f'Part.{chapter_num}'
+                    ))
+
+        # 챕터는 다음 챕터 시작 전까지의 차시 (챕터가 시작되기 전 차시는 어느 챕터에도 속하지 않음)
+        end_positions = [start for start, _, _ in chapter_starts[1:]] + [row_count]
+        chapters = [
+            Chapter(chapter_num, name, lessons[start].index, range(start, end))
+            for (start, chapter_num, name), end in zip(chapter_starts, end_positions)
+        ]
+
+        return self._build_course_data(subjects[0], chapters, lessons)
+
+    @staticmethod
+    def _coalesce(value, previous):
+        """빈 셀이면 이전 값 유지 (forward fill)"""
+        return previous if value is None else value
+
+    def _build_course_data(self, subject, chapters: List[Chapter], lessons: List[Lesson]) -> Course:
+        """과정 코드 추출 후 과정 데이터 구성"""
+        # 과정 코드 추출 (첫 차시 강의영상 링크에서, 나머지 차시와 같은지는 데이터 검사에서 확인)
+        # 예: https://cdn-it.livestudy.com/mov/2025/25ctvibec/25ctvibec_01.mp4 → 25ctvibec
         if lessons:
-            video_url = lessons[0]['video_url']
-            # 예: https://cdn-it.livestudy.com/mov/2025/25ctvibec/25ctvibec_01.mp4
-            # → 25ctvibec
-            parts = video_url.split('/')
-            for i, part in enumerate(parts):
-                if part.isdigit() and len(part) == 4:  # 년도 (2025)
-                    if i + 1 < len(parts):
-                        self.course_code = parts[i + 1]
-                        break
-
-        return {
-            'course_code': self.course_code,
-            'subject': subject,
-            'chapters': chapters,
-            'lessons': lessons,
-            'total_lessons': len(lessons)
-        }
+            segment = course_segment(lessons[0].video_url)
+            if segment is not None:
+                self.course_code = segment[1]
+
+        return Course(self.course_code, subject, lessons, chapters)
 
     def _normalize_url(self, url: Optional[str]) -> Optional[str]:
         """URL 정규화 (https:// 추가)"""
@@ -200,20 +428,308 @@ class CourseDataParser:
             return f"https://{url}"
         return url
 
+    @staticmethod
+    def _to_value_list(column: 'pd.Series') -> List:
+        """컬럼 값 리스트 (빈 셀은 None)"""
+        return column.astype(object).where(column.notna(), None).tolist()
+
+    @staticmethod
+    def _to_int_values(column: 'pd.Series') -> 'np.ndarray':
+        """빈 셀이 없는 컬럼을 int() 변환과 같은 규칙으로 정수 배열로 변환"""
+        import pandas as pd
+
+        if pd.api.types.is_numeric_dtype(column):
+            return column.to_numpy().astype('int64')
+        return column.map(int).to_numpy().astype('int64')
+
+    def _to_int_list(self, column: 'pd.Series') -> List[Optional[int]]:
+        """정수 리스트 (빈 셀은 None)"""
+        import numpy as np
+
+        mask = column.notna().to_numpy()
+        values = np.full(len(column), None, dtype=object)
+        if mask.any():
+            values[mask] = self._to_int_values(column[mask]).astype(object)
+        return values.tolist()
+
+    @staticmethod
+    def _normalize_url_column(column: 'pd.Series') -> List[Optional[str]]:
+        """URL 컬럼 정규화 (_normalize_url과 같은 규칙, 빈 값은 None)"""
+        import numpy as np
+
+        values = column.astype(object)
+        mask = values.notna() & values.astype(bool)
+        urls = np.full(len(column), None, dtype=object)
+        if mask.any():
+            text = values[mask].astype(str).str.strip()
+            normalized = text.where(text.str.startswith('http'), 'https://' + text)
+            normalized = normalized.where(~text.str.startswith('/'), 'https:' + text)
+            urls[mask.to_numpy()] = normalized.to_numpy(dtype=object)
+        return urls.tolist()
+
+
+def sheet_columns(header: Sequence, rows: Iterable[Sequence]) -> Dict[str, List]:
+    """
+    헤더 + 행 → 컬럼별 값 리스트 (스트리밍 엔진, CSV)
+
+    pandas 경로와 같게 중간의 빈 행은 행으로 포함하고 끝부분의 빈 행은 버린다.
+
+    Args:
+        header: 헤더 행 (컬럼명 앞뒤 공백 제거, 중복 시 첫 번째 컬럼)
+        rows: 데이터 행
 
-def parse_course_file(file_path: str, sheet_name: Optional[str] = None) -> Dict:
+    Returns:
+        {컬럼명: 값 리스트} (COLUMN_MAPPING 컬럼 중 있는 것만, 빈 셀/결측 문자열은 None)
+    """
+    positions: Dict[str, int] = {}
+    for position, name in enumerate(header):
+        if isinstance(name, str):
+            positions.setdefault(name.strip(), position)
+
+    wanted = [(name, positions[name]) for name in CourseDataParser.COLUMN_MAPPING if name in positions]
+    columns: Dict[str, List] = {name: [] for name, _ in wanted}
+    pending_blank_rows = 0
+
+    for row in rows:
+        if all(value is None or value == '' for value in row):
+            pending_blank_rows += 1
+            continue
+
+        # 데이터 행이 나오면 보류한 빈 행도 포함
+        for name, position in wanted:
+            values = columns[name]
+            if pending_blank_rows:
+                values.extend([None] * pending_blank_rows)
+            value = row[position] if position < len(row) else None
+            if isinstance(value, str) and value in NA_STRINGS:
+                value = None
+            values.append(value)
+        pending_blank_rows = 0
+
+    return columns
+
+
+def frame_columns(df: 'pd.DataFrame') -> Dict[str, List]:
+    """DataFrame → 컬럼별 값 리스트 (sheet_columns와 같은 형식, 빈 셀은 None)"""
+    return {
+        name: df[name].astype(object).where(df[name].notna(), None).tolist()
+        for name in CourseDataParser.COLUMN_MAPPING if name in df.columns
+    }
+
+
+def _infer_column(values: List) -> List:
+    """
+    컬럼 값 타입 추론 (pandas read_csv/read_excel과 같은 규칙)
+
+    빈 값/결측 문자열은 None, 컬럼 전체가 정수(숫자 문자열 포함)면 int (빈 값이 섞이면 float),
+    실수면 float, true/false면 bool, 그 외에는 원래 값을 그대로 둔다.
+    """
+    cells = [None if value is None or (isinstance(value, str) and value in NA_STRINGS) else value
+             for value in values]
+    present = [value for value in cells if value is not None]
+    if not present:
+        return cells
+
+    # 엑셀 값(str 이외)은 숫자 컬럼에 섞인 불리언을 pandas처럼 0/1로 취급
+    def is_int(value):
+        if isinstance(value, str):
+            return INT_PATTERN.fullmatch(value) is not None
+        return isinstance(value, int)
+
+    def is_number(value):
+        if isinstance(value, str):
+            return FLOAT_PATTERN.fullmatch(value) is not None
+        return isinstance(value, (int, float))
+
+    def is_bool(value):
+        if isinstance(value, str):
+            return value.lower() in BOOL_VALUES
+        return isinstance(value, bool)
+
+    if all(is_bool(value) for value in present):
+        return [
+            value if value is None or isinstance(value, bool) else BOOL_VALUES[value.lower()]
+            for value in cells
+        ]
+    if all(is_int(value) for value in present):
+        convert = float if len(present) < len(cells) else int
+    elif all(is_number(value) for value in present):
+        convert = float
+    else:
+        return cells
+
+    return [None if value is None else convert(value) for value in cells]
+
+
+def _infer_column_types(rows: Iterable[Sequence]) -> Iterator[tuple]:
+    """
+    행 목록을 컬럼 단위로 타입 추론한 뒤 다시 행으로 반환 (모든 행을 메모리에 읽음)
+
+    끝부분의 빈 행은 pandas처럼 추론 대상에서 제외한다.
+    """
+    records = list(rows)
+    while records and all(value is None or value == '' for value in records[-1]):
+        records.pop()
+
+    width = max((len(record) for record in records), default=0)
+    columns = [
+        _infer_column([record[position] if position < len(record) else None for record in records])
+        for position in range(width)
+    ]
+    return zip(*columns)
+
+
+class WorkbookSession:
+    """
+    엑셀 워크북 세션
+
+    파일을 한 번만 열어 시트 목록과 시트 데이터를 여러 파서가 공유하도록 한다.
+    (--all-sheets 처리 시 시트마다 파일을 다시 여는 비용 제거)
+    """
+
+    def __init__(self, file_path: str, engine: str = 'pandas'):
+        """
+        Args:
+            file_path: 엑셀 파일 경로
+            engine: 파서 엔진 (pandas: 시트를 DataFrame으로 읽기, openpyxl/native: 행 스트리밍)
+        """
+        self.file_path = Path(file_path)
+        self.engine = engine
+
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {self.file_path}")
+
+        if self.file_path.suffix != '.xlsx':
+            raise ValueError("엑셀 파일(.xlsx)만 지원합니다")
+
+        self._frames: Dict[str, 'pd.DataFrame'] = {}
+        if engine == 'openpyxl':
+            import openpyxl
+
+            # 읽기 전용 모드: 시트 XML을 필요할 때 행 단위로 읽음
+            self._book = openpyxl.load_workbook(
+                self.file_path, read_only=True, data_only=True, keep_links=False
+            )
+            self.sheet_names: List[str] = list(self._book.sheetnames)
+        elif engine == 'native':
+            from .xlsx_reader import XlsxReader
+
+            # zip/XML 직접 읽기 (pandas/openpyxl 불필요)
+            self._book = XlsxReader(self.file_path)
+            self.sheet_names: List[str] = list(self._book.sheet_names)
+        else:
+            import pandas as pd
+
+            self._excel_file = pd.ExcelFile(self.file_path)
+            self.sheet_names: List[str] = list(self._excel_file.sheet_names)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """워크북 닫기 (남은 시트 데이터 해제)"""
+        self._frames.clear()
+        if self.engine in STREAMING_ENGINES:
+            self._book.close()
+        else:
+            self._excel_file.close()
+
+    def resolve_sheet_name(self, sheet_name) -> str:
+        """
+        시트 이름 또는 인덱스를 실제 시트 이름으로 변환
+
+        Raises:
+            ValueError: 시트가 없는 경우
+        """
+        if isinstance(sheet_name, int) and 0 <= sheet_name < len(self.sheet_names):
+            return self.sheet_names[sheet_name]
+        if sheet_name in self.sheet_names:
+            return sheet_name
+
+        available_sheets = ', '.join([f"'{s}'" for s in self.sheet_names])
+        raise ValueError(
+            f"시트를 찾을 수 없습니다: {sheet_name}\n"
+            f"사용 가능한 시트: {available_sheets}"
+        )
+
+    def load_sheets(self, sheet_names: List):
+        """
+        여러 시트를 한 번에 읽어 세션에 보관 (스트리밍 엔진은 생략)
+
+        Args:
+            sheet_names: 시트 이름 또는 인덱스 리스트
+        """
+        names = [self.resolve_sheet_name(name) for name in sheet_names]
+        names = [name for name in dict.fromkeys(names) if name not in self._frames]
+        if names and self.engine == 'pandas':
+            import pandas as pd
+
+            self._frames.update(pd.read_excel(self._excel_file, sheet_name=names))
+
+    def take_sheet(self, sheet_name) -> 'pd.DataFrame':
+        """
+        시트 DataFrame 반환 (세션에서는 해제하여 메모리를 붙잡지 않음)
+
+        Args:
+            sheet_name: 시트 이름 또는 인덱스
+        """
+        name = self.resolve_sheet_name(sheet_name)
+        if name not in self._frames:
+            self.load_sheets([name])
+        return self._frames.pop(name)
+
+    def iter_rows(self, sheet_name) -> Iterator[tuple]:
+        """
+        시트의 행을 값 튜플로 하나씩 반환 (스트리밍 엔진 전용)
+
+        Args:
+            sheet_name: 시트 이름 또는 인덱스
+        """
+        name = self.resolve_sheet_name(sheet_name)
+        if self.engine == 'native':
+            return self._book.iter_rows(name)
+        return self._book[name].iter_rows(values_only=True)
+
+
+def parse_course_file(file_path: str, sheet_name: Optional[str] = None,
+                      workbook: Optional[WorkbookSession] = None,
+                      dataframe: Optional['pd.DataFrame'] = None,
+                      engine: str = 'pandas',
+                      cache: Optional['CourseCache'] = None,
+                      columns: Optional[Dict[str, List]] = None) -> Course:
     """
     과정 파일 파싱 (헬퍼 함수)
 
     Args:
         file_path: 엑셀 또는 CSV 파일 경로
         sheet_name: 엑셀 시트 이름 또는 인덱스 (None이면 첫 번째 시트)
+        workbook: 공유할 워크북 세션 (None이면 파일을 직접 열기)
+        dataframe: 미리 읽어 둔 시트 데이터 (있으면 파일을 읽지 않음)
+        engine: 엑셀 파서 엔진 (pandas, openpyxl, native)
+        cache: 파싱 결과 캐시 (None이면 사용 안 함)
+        columns: 미리 읽어 둔 컬럼 값 (read_columns 결과, 있으면 파일을 읽지 않음)
 
     Returns:
         파싱된 과정 데이터
     """
-    parser = CourseDataParser(file_path, sheet_name)
-    return parser.parse()
+    if cache is not None:
+        with profiler.phase('parse.cache'):
+            course_data = cache.load(file_path, sheet_name)
+        if course_data is not None:
+            print(f"♻️  캐시된 파싱 결과 사용 (파일 변경 없음)")
+            return course_data
+
+    parser = CourseDataParser(file_path, sheet_name, workbook=workbook, dataframe=dataframe,
+                              engine=engine, columns=columns)
+    course_data = parser.parse()
+
+    if cache is not None:
+        with profiler.phase('parse.cache'):
+            cache.store(file_path, sheet_name, course_data)
+    return course_data
 
 
 def get_sheet_names(file_path: str) -> list:
@@ -226,15 +742,5 @@ def get_sheet_names(file_path: str) -> list:
     Returns:
         시트 이름 리스트
     """
-    from pathlib import Path
-
-    file_path = Path(file_path)
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
-
-    if file_path.suffix != '.xlsx':
-        raise ValueError("엑셀 파일(.xlsx)만 지원합니다")
-
-    excel_file = pd.ExcelFile(file_path)
-    return excel_file.sheet_names
+    with WorkbookSession(file_path) as workbook:
+        return workbook.sheet_names
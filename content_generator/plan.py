@@ -0,0 +1,84 @@
+"""
+생성 계획 모듈
+
+과정 하나를 만들 때 필요한 폴더, 파일(렌더링된 내용), 권한을 디스크에 접근하지 않고 미리 계산한다.
+--dry-run은 계획을 JSON으로 출력하고, 실제 생성은 같은 계획을 한꺼번에 실행한다.
+
+경로는 출력 디렉토리 기준 POSIX 경로 ({과정코드}/{차시}/index.html 형식)로,
+폴더 출력과 압축 파일 출력에서 같다.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+
+FILE_MODE = 0o644
+DIRECTORY_MODE = 0o755
+
+
+class PlannedFile:
+    """계획된 파일 하나"""
+
+    __slots__ = ('path', 'content', 'mode', 'shared')
+
+    def __init__(self, path: str, content: bytes, mode: int = FILE_MODE, shared: bool = False):
+        """
+        Args:
+            path: 출력 디렉토리 기준 경로
+            content: 파일 내용
+            mode: 권한
+            shared: 여러 차시가 같은 내용을 쓰는 파일 여부 (index.html, hardlink 모드에서 공유)
+        """
+        self.path = path
+        self.content = content
+        self.mode = mode
+        self.shared = shared
+
+
+class GenerationPlan:
+    """과정 하나의 생성 계획"""
+
+    def __init__(self, course_code: str, output_path: Path, output_format: str,
+                 directories: List[str], files: List[PlannedFile]):
+        """
+        Args:
+            course_code: 과정 코드
+            output_path: 최종 출력 경로 (과정 폴더 또는 압축 파일)
+            output_format: 출력 형식 (dir, zip, tar.gz)
+            directories: 만들 폴더 (상위 폴더 먼저)
+            files: 만들 파일
+        """
+        self.course_code = course_code
+        self.output_path = Path(output_path)
+        self.output_format = output_format
+        self.directories = directories
+        self.files = files
+
+    @property
+    def total_bytes(self) -> int:
+        """파일 내용 합계 (바이트)"""
+        return sum(len(planned.content) for planned in self.files)
+
+    def to_dict(self) -> Dict:
+        """JSON 출력용 계획 (파일 내용 대신 크기)"""
+        return {
+            "course_code": self.course_code,
+            "output_format": self.output_format,
+            "output_path": str(self.output_path),
+            "directory_mode": f"{DIRECTORY_MODE:04o}",
+            "directories": self.directories,
+            "files": [
+                {"path": planned.path, "mode": f"{planned.mode:04o}", "bytes": len(planned.content)}
+                for planned in self.files
+            ],
+            "totals": {
+                "directories": len(self.directories),
+                "files": len(self.files),
+                "bytes": self.total_bytes,
+            },
+        }
+
+    def to_json(self) -> str:
+        """계획 JSON 문자열"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
@@ -0,0 +1,151 @@
+"""
+프로파일링 모듈 (--profile)
+
+단계별 실행 시간, 파일 시스템 작업 수(mkdir/write/chmod 등), 쓴 바이트 수,
+시트별 최대 메모리를 기록한다. 프로파일러가 켜져 있지 않으면 모든 기록 함수는 아무 일도 하지 않는다.
+"""
+
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class Profiler:
+    """단계별 시간/파일 작업 기록기"""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.sheets: List[Dict] = []
+        self._current_sheet: Optional[Dict] = None
+        self._lock = threading.Lock()
+
+    def add_time(self, name: str, seconds: float):
+        """단계 시간 누적 (현재 시트와 전체에 모두 기록)"""
+        with self._lock:
+            for record in self._targets('phases'):
+                record[name] = record.get(name, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1):
+        """카운터 증가 (현재 시트와 전체에 모두 기록)"""
+        with self._lock:
+            for record in self._targets('counters'):
+                record[name] = record.get(name, 0) + amount
+
+    def begin_sheet(self, sheet_name: str):
+        """시트 단위 기록 시작 (최대 메모리 측정 초기화)"""
+        self._current_sheet = {"sheet_name": sheet_name, "phases": {}, "counters": {}}
+        if tracemalloc.is_tracing() and hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+    def end_sheet(self) -> Optional[Dict]:
+        """시트 단위 기록 종료"""
+        record = self._current_sheet
+        if record is None:
+            return None
+
+        if tracemalloc.is_tracing():
+            record["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        self.sheets.append(record)
+        self._current_sheet = None
+        return record
+
+    def current_sheet(self) -> Optional[Dict]:
+        """진행 중인 시트 기록"""
+        return self._current_sheet
+
+    def add_sheet(self, record: Dict):
+        """다른 프로세스에서 기록한 시트 결과 합치기 (--jobs)"""
+        self.sheets.append(record)
+        with self._lock:
+            for name, seconds in record.get("phases", {}).items():
+                self.phases[name] = self.phases.get(name, 0.0) + seconds
+            for name, amount in record.get("counters", {}).items():
+                self.counters[name] = self.counters.get(name, 0) + amount
+
+    def summary(self) -> Dict:
+        """이력 JSON에 넣을 요약"""
+        return {
+            "phases": {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            "counters": dict(self.counters),
+            "sheets": [
+                dict(record, phases={name: round(seconds, 6) for name, seconds in record["phases"].items()})
+                for record in self.sheets
+            ],
+        }
+
+    def print_summary(self):
+        """요약 출력"""
+        print()
+        print("=" * 60)
+        print("⏱️  프로파일 요약 (병렬 작업은 스레드별 시간 합계)")
+        print("=" * 60)
+        for name, seconds in self.phases.items():
+            print(f"   {name:<28} {seconds:>10.4f}s")
+
+        counters = self.counters
+        print(
+            f"   파일 시스템: mkdir {counters.get('mkdir', 0)}, write {counters.get('write', 0)}, "
+            f"chmod {counters.get('chmod', 0)}, link {counters.get('link', 0)}, "
+            f"unlink {counters.get('unlink', 0)}"
+        )
+        print(f"   쓴 바이트: {counters.get('bytes_written', 0):,}")
+
+        for record in self.sheets:
+            peak = record.get("peak_memory_bytes")
+            if peak is not None:
+                print(f"   최대 메모리 [{record['sheet_name']}]: {peak / 1024 / 1024:.1f} MB")
+        print("=" * 60)
+
+    def _targets(self, key: str) -> List[Dict]:
+        targets = [getattr(self, key)]
+        if self._current_sheet is not None:
+            targets.append(self._current_sheet[key])
+        return targets
+
+
+_active: Optional[Profiler] = None
+
+
+def start() -> Profiler:
+    """프로파일링 시작 (메모리 추적 포함)"""
+    global _active
+    _active = Profiler()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return _active
+
+
+def stop():
+    """프로파일링 종료"""
+    global _active
+    _active = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def active() -> Optional[Profiler]:
+    """실행 중인 프로파일러 (꺼져 있으면 None)"""
+    return _active
+
+
+@contextmanager
+def phase(name: str):
+    """단계 시간 측정"""
+    if _active is None:
+        yield
+        return
+
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        _active.add_time(name, time.perf_counter() - start_time)
+
+
+def count(name: str, amount: int = 1):
+    """파일 작업 등 카운트"""
+    if _active is not None:
+        _active.count(name, amount)
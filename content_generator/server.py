@@ -0,0 +1,519 @@
+"""
+로컬 생성 서버 모듈 (--serve)
+
+프로세스를 띄워 둔 채 HTTP(로컬 TCP 또는 Unix 소켓)로 생성 작업을 받는다.
+작업마다 `python -m content_generator`를 새로 실행할 때 드는 인터프리터 시작, pandas 가져오기,
+템플릿 로딩 비용을 워커 프로세스가 한 번만 치르도록 한다.
+
+API (요청/응답 모두 JSON):
+    GET  /health  → {"status": "ok", "workers": 워커 수, "running": 실행/대기 중인 작업 수}
+    POST /jobs    → 작업 결과(job_record) + "log" (콘솔 출력)
+
+POST /jobs는 Content-Type: application/json 요청만 받고(415), TCP에서는 Host 헤더가 서버의 루프백 주소/포트여야 한다(403).
+웹 페이지가 보내는 text/plain 요청이나 DNS 리바인딩으로 로컬 파일을 읽고 쓰지 못하게 하기 위함.
+작업 하나는 생성 이력에 실행 하나(server)로 기록한다 (dry_run은 기록하지 않음).
+
+작업 요청 예시:
+    {
+        "input": "/path/to/25ctvibec.xlsx",   # 또는 "workbook": base64 내용 + "filename": "25ctvibec.xlsx"
+        "sheet": "25ctvibec",                 # 시트 이름/인덱스 (생략 시 첫 번째 시트)
+        "all_sheets": false,                  # true면 'TTL' 제외 모든 시트
+        "template": "ct2022",
+        "output": "/path/to/subjects",
+        "index_mode": "copy",
+        "output_format": "dir",               # dir, zip, tar.gz
+        "dry_run": false
+    }
+"""
+
+import base64
+import binascii
+import ipaddress
+import json
+import os
+import shutil
+import signal
+import socketserver
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .batch_log import BatchLogWriter, course_entry, success_result
+from .cache import CourseCache
+from .console import run_captured
+from .history import HistoryStore
+from .generator import ContentGenerator, INDEX_MODES, OUTPUT_FORMATS
+from .parser import parse_course_file, CourseDataParser, WorkbookSession
+from .template_registry import get_registry, AUTO_TEMPLATE
+
+
+# 요청 본문 크기 상한 (업로드 워크북 base64 포함)
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+# 워커 수를 넘어 대기시킬 수 있는 작업 수 (넘으면 503)
+MAX_PENDING_JOBS = 16
+
+UNIX_PREFIX = 'unix:'
+
+# 업로드할 수 있는 파일 형식 (파서 엔진이 읽을 수 있는 형식)
+UPLOAD_SUFFIXES = ('.xlsx', '.csv')
+
+# POST /jobs 요청 본문 형식
+JSON_CONTENT_TYPE = 'application/json'
+
+# TCP로 받을 수 있는 호스트 (작업이 로컬 경로를 읽고 쓰므로 루프백만 허용)
+LOOPBACK_HOSTNAMES = ('localhost',)
+
+
+class JobError(ValueError):
+    """잘못된 작업 요청"""
+
+
+def parse_address(address: str) -> Tuple[str, object]:
+    """
+    서버 주소 해석
+
+    Args:
+        address: 'unix:/tmp/cg.sock', 'HOST:PORT' 또는 'PORT'
+
+    Returns:
+        ('unix', 소켓 경로) 또는 ('tcp', (호스트, 포트))
+
+    Raises:
+        ValueError: 주소 형식이 잘못되었거나 루프백이 아닌 호스트인 경우
+    """
+    if address.startswith(UNIX_PREFIX):
+        path = address[len(UNIX_PREFIX):]
+        if not path:
+            raise ValueError("Unix 소켓 경로가 비어 있습니다")
+        return 'unix', path
+
+    host, _, port = address.rpartition(':')
+    try:
+        port_number = int(port)
+    except ValueError:
+        raise ValueError(f"서버 주소 형식이 잘못되었습니다: {address} (예: 127.0.0.1:8765, unix:/tmp/cg.sock)")
+
+    host = host or '127.0.0.1'
+    if not _is_loopback(host):
+        # 작업 요청이 서버 사용자 권한으로 임의의 로컬 파일을 읽고 쓰므로 네트워크에 열지 않음
+        raise ValueError(f"로컬 주소만 사용할 수 있습니다: {host} (127.0.0.1, localhost 또는 unix:소켓 경로)")
+    return 'tcp', (host, port_number)
+
+
+def _is_loopback(host: str) -> bool:
+    """루프백 호스트 여부 (localhost, 127.0.0.0/8)"""
+    if host.lower() in LOOPBACK_HOSTNAMES:
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _preload(engine: str):
+    """무거운 모듈과 템플릿 미리 읽기"""
+    get_registry()
+    if engine == 'pandas':
+        import pandas  # noqa: F401
+
+
+def _init_worker(engine: str):
+    """워커 프로세스 초기화 (fork로 시작하면 서버 프로세스에서 미리 읽은 모듈을 그대로 씀)"""
+    # Ctrl+C는 서버 프로세스가 받아 워커를 정리 (워커마다 KeyboardInterrupt 출력 방지)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _preload(engine)
+
+
+def run_job(job: Dict) -> Dict:
+    """
+    작업 하나 실행 (워커 프로세스에서 호출)
+
+    Args:
+        job: 검증된 작업 (_build_job 결과)
+
+    Returns:
+        작업 결과(job_record) + "log" (dry_run 성공 시트는 status가 planned)
+    """
+    log, batch_results = run_captured(_run_sheets, job)
+    record = job_record(job['input_name'], job['output'], job['template'], batch_results)
+    record["log"] = log
+    return record
+
+
+def _run_sheets(job: Dict) -> list:
+    """작업의 시트 파싱 + 생성 → 배치 결과 리스트 (dry_run이 아니면 생성 이력에 기록)"""
+    cache = None if job['no_cache'] else CourseCache(version=CourseDataParser.LOGIC_VERSION)
+    batch_results = []
+
+    workbook = None
+    try:
+        sheets = [job['sheet']]
+        if job['all_sheets']:
+            workbook = WorkbookSession(job['input'], engine=job['engine'])
+            sheets = [name for name in workbook.sheet_names if name != 'TTL']
+
+        for sheet in sheets:
+            batch_results.append(_run_sheet(job, sheet, workbook, cache))
+    except Exception as e:
+        # 워크북을 열지 못한 경우 등: 작업 전체 실패
+        batch_results.append({
+            "sheet_name": job['sheet'],
+            "course_code": None,
+            "status": "failed",
+            "error": str(e)
+        })
+    finally:
+        if workbook is not None:
+            workbook.close()
+
+    if not job['dry_run']:
+        _log_job(job, batch_results)
+    return batch_results
+
+
+def job_record(input_file: str, output_dir: str, template: str, batch_results: List[Dict],
+               generated_at: Optional[datetime] = None) -> Dict:
+    """
+    작업 결과 (POST /jobs 응답, 생성 이력의 배치 실행과 같은 항목)
+
+    Args:
+        input_file: 입력 파일
+        output_dir: 출력 디렉토리
+        template: 템플릿
+        batch_results: 배치 결과 리스트
+        generated_at: 기록 시각 (기본: 현재)
+    """
+    courses = [course_entry(result) for result in batch_results]
+    success_count = sum(1 for course in courses if course['status'] == 'success')
+    fail_count = sum(1 for course in courses if course['status'] == 'failed')
+
+    return {
+        "generated_at": (generated_at or datetime.now()).isoformat(),
+        "batch_type": "all_sheets",
+        "input_file": input_file,
+        "output_dir": output_dir,
+        "template": template,
+        "total_courses": len(batch_results),
+        "success_count": success_count,
+        "fail_count": fail_count,
+        "courses": courses
+    }
+
+
+def _log_job(job: Dict, batch_results: list):
+    """작업 하나를 생성 이력에 실행 하나로 기록 (CLI 배치, 작업 매니페스트와 같은 방식)"""
+    details = {"sheet": job['sheet'], "all_sheets": job['all_sheets']}
+    with HistoryStore() as store:
+        batch_log = BatchLogWriter(store, job['input_name'], job['output'], job['template'],
+                                   batch_type="server", details=details)
+        for result in batch_results:
+            batch_log.add(result)
+        batch_log.close()
+    print(f"📝 작업 이력 저장: {store.db_path} (실행 #{batch_log.run_id})")
+
+
+def _run_sheet(job: Dict, sheet, workbook: Optional[WorkbookSession], cache: Optional[CourseCache]) -> Dict:
+    """시트 하나 파싱 + 생성 → 배치 결과 (dry_run 성공 시 status가 planned)"""
+    try:
+        course_data = parse_course_file(job['input'], sheet, workbook=workbook, engine=job['engine'],
+                                        cache=cache)
+        generator = ContentGenerator(
+            course_data=course_data,
+            output_dir=job['output'],
+            template=job['template'],
+            input_file=job['input_name'],
+            index_mode=job['index_mode'],
+            output_format=job['output_format'],
+            history_log=False  # 작업 단위로 기록 (_log_job)
+        )
+        generator.generate(dry_run=job['dry_run'])
+    except Exception as e:
+        print(f"❌ {sheet} 시트 처리 실패: {e}")
+        return {
+            "sheet_name": sheet,
+            "course_code": None,
+            "status": "failed",
+            "error": str(e)
+        }
+
+    if job['dry_run']:
+        return success_result(sheet, generator, status="planned")
+    return success_result(sheet, generator)
+
+
+def _build_job(payload: Dict, defaults: Dict, upload_dir: str) -> Dict:
+    """
+    요청 JSON → 작업 (업로드된 워크북은 upload_dir에 저장)
+
+    Raises:
+        JobError: 요청이 잘못된 경우
+    """
+    if not isinstance(payload, dict):
+        raise JobError("요청 본문은 JSON 객체여야 합니다")
+
+    if payload.get('workbook') is not None:
+        filename = Path(str(payload.get('filename') or 'upload.xlsx')).name
+        if Path(filename).suffix not in UPLOAD_SUFFIXES:
+            raise JobError(f"지원하지 않는 파일 형식: {filename}")
+        try:
+            content = base64.b64decode(payload['workbook'], validate=True)
+        except (binascii.Error, TypeError):
+            raise JobError("workbook은 base64로 인코딩된 파일 내용이어야 합니다")
+        input_path = Path(upload_dir) / filename
+        input_path.write_bytes(content)
+        input_file, input_name = str(input_path), filename
+    elif payload.get('input'):
+        input_file = input_name = str(payload['input'])
+        if not Path(input_file).is_file():
+            raise JobError(f"파일을 찾을 수 없습니다: {input_file}")
+    else:
+        raise JobError("input(파일 경로) 또는 workbook(업로드 내용)이 필요합니다")
+
+    template = payload.get('template', defaults['template'])
+    if template not in get_registry().names() + [AUTO_TEMPLATE]:
+        raise JobError(f"지원하지 않는 템플릿: {template}")
+
+    index_mode = payload.get('index_mode', defaults['index_mode'])
+    if index_mode not in INDEX_MODES:
+        raise JobError(f"지원하지 않는 index.html 출력 방식: {index_mode}")
+
+    # 시트 이름 처리 (숫자 문자열을 int로 변환, CLI와 동일)
+    sheet = payload.get('sheet')
+    if isinstance(sheet, str) and sheet.isdigit():
+        sheet = int(sheet)
+    if sheet is not None and not isinstance(sheet, (str, int)):
+        raise JobError("sheet는 시트 이름 또는 인덱스여야 합니다")
+
+    output_format = payload.get('output_format', defaults['output_format'])
+    if output_format not in OUTPUT_FORMATS:
+        raise JobError(f"지원하지 않는 출력 형식: {output_format}")
+
+    return {
+        "input": input_file,
+        "input_name": input_name,
+        "sheet": sheet,
+        "all_sheets": bool(payload.get('all_sheets', False)),
+        "template": template,
+        "output": str(payload.get('output') or defaults['output']),
+        "index_mode": index_mode,
+        "output_format": output_format,
+        "dry_run": bool(payload.get('dry_run', False)),
+        "engine": defaults['engine'],
+        # 업로드 파일은 작업마다 경로가 달라 캐시해도 다시 쓰이지 않음
+        "no_cache": defaults['no_cache'] or payload.get('workbook') is not None,
+    }
+
+
+class GenerationServer:
+    """생성 작업 서버 (워커 프로세스 풀 + 작업 수 제한)"""
+
+    def __init__(self, workers: int = 1, defaults: Optional[Dict] = None,
+                 max_pending: int = MAX_PENDING_JOBS):
+        """
+        Args:
+            workers: 작업 워커 프로세스 수
+            defaults: 요청에 없을 때 쓸 값 (output, template, index_mode, output_format, engine, no_cache)
+            max_pending: 워커 수를 넘어 대기시킬 수 있는 작업 수
+        """
+        self.workers = workers
+        self.defaults = {
+            "output": './output',
+            "template": 'ct2022',
+            "index_mode": 'copy',
+            "output_format": 'dir',
+            "engine": 'pandas',
+            "no_cache": False,
+            **(defaults or {}),
+        }
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.defaults['engine'],)
+        )
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._running = 0
+        self._lock = threading.Lock()
+        self._http_server = None
+
+    @property
+    def running(self) -> int:
+        """실행/대기 중인 작업 수"""
+        return self._running
+
+    def submit(self, payload: Dict) -> Dict:
+        """
+        작업 실행 후 결과 반환 (요청 스레드에서 완료까지 대기)
+
+        Raises:
+            JobError: 요청이 잘못된 경우
+            RuntimeError: 대기 작업이 너무 많은 경우
+        """
+        if not self._slots.acquire(blocking=False):
+            raise RuntimeError("대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도하세요")
+
+        upload_dir = tempfile.mkdtemp(prefix='content-generator-upload-')
+        try:
+            job = _build_job(payload, self.defaults, upload_dir)
+            with self._lock:
+                self._running += 1
+            try:
+                return self._executor.submit(run_job, job).result()
+            finally:
+                with self._lock:
+                    self._running -= 1
+        finally:
+            shutil.rmtree(upload_dir, ignore_errors=True)
+            self._slots.release()
+
+    def serve(self, address: str):
+        """
+        요청 처리 시작 (shutdown() 또는 Ctrl+C까지 대기)
+
+        Args:
+            address: 'unix:/tmp/cg.sock', 'HOST:PORT' 또는 'PORT'
+        """
+        kind, location = parse_address(address)
+        handler = _make_handler(self)
+
+        # 요청을 받기 전에 가져오기/템플릿 로딩을 끝내 둠 (워커는 첫 작업 때 fork되며 그대로 물려받음)
+        print(f"⏳ 워커 {self.workers}개 준비 중...")
+        _preload(self.defaults['engine'])
+
+        if kind == 'unix':
+            if os.path.exists(location):
+                os.unlink(location)  # 이전 실행이 남긴 소켓 파일
+            self._http_server = _UnixHTTPServer(location, handler)
+        else:
+            self._http_server = ThreadingHTTPServer(location, handler)
+
+        print(f"🚀 생성 서버 시작: {self.url}")
+        print(f"   - 워커: {self.workers}개")
+        print(f"   - 작업 요청: POST /jobs, 상태 확인: GET /health")
+        print(f"   - 종료: Ctrl+C")
+
+        try:
+            self._http_server.serve_forever()
+        finally:
+            self.close()
+
+    @property
+    def url(self) -> Optional[str]:
+        """서버 주소 (시작 전이면 None)"""
+        if self._http_server is None:
+            return None
+        if isinstance(self._http_server, _UnixHTTPServer):
+            return f"{UNIX_PREFIX}{self._http_server.server_address}"
+        host, port = self._http_server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def shutdown(self):
+        """serve() 종료 요청 (다른 스레드에서 호출)"""
+        if self._http_server is not None:
+            self._http_server.shutdown()
+
+    def close(self):
+        """소켓과 워커 정리"""
+        if self._http_server is not None:
+            self._http_server.server_close()
+            if isinstance(self._http_server, _UnixHTTPServer):
+                try:
+                    os.unlink(self._http_server.server_address)
+                except OSError:
+                    pass
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=True)  # 3.8 이하: 대기 중인 작업 취소 옵션 없음
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix 소켓 HTTP 서버"""
+    daemon_threads = True
+
+
+def _make_handler(server: GenerationServer):
+    """요청 핸들러 클래스 (서버 인스턴스 연결)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = 'ContentGenerator/1.0'
+
+        def do_GET(self):
+            if self.path.rstrip('/') == '/health':
+                self._send_json(200, {"status": "ok", "workers": server.workers, "running": server.running})
+            else:
+                self._send_json(404, {"error": f"알 수 없는 경로: {self.path}"})
+
+        def do_POST(self):
+            if self.path.rstrip('/') != '/jobs':
+                self._send_json(404, {"error": f"알 수 없는 경로: {self.path}"})
+                return
+
+            if not self._is_local_host():
+                self._send_json(403, {"error": "서버 주소로 보낸 요청만 처리합니다 (Host 헤더 확인)"})
+                return
+            content_type = (self.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+            if content_type != JSON_CONTENT_TYPE:
+                self._send_json(415, {"error": f"요청 본문은 {JSON_CONTENT_TYPE} 이어야 합니다"})
+                return
+
+            try:
+                length = int(self.headers.get('Content-Length') or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self._send_json(400, {"error": "Content-Length가 올바르지 않습니다"})
+                return
+            if length > MAX_REQUEST_BYTES:
+                self._send_json(413, {"error": "요청이 너무 큽니다"})
+                return
+
+            try:
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                if not isinstance(payload, dict):
+                    raise JobError("요청 본문은 JSON 객체여야 합니다")
+                result = server.submit(payload)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                self._send_json(400, {"error": "요청 본문이 올바른 JSON이 아닙니다"})
+            except JobError as e:
+                self._send_json(400, {"error": str(e)})
+            except RuntimeError as e:
+                self._send_json(503, {"error": str(e)})
+            except Exception as e:
+                self._send_json(500, {"error": str(e)})
+            else:
+                self._send_json(200, result)
+
+        def _is_local_host(self) -> bool:
+            """Host 헤더가 서버의 루프백 주소/포트인지 (Unix 소켓은 브라우저가 접근할 수 없어 확인 안 함)"""
+            if isinstance(self.server, _UnixHTTPServer):
+                return True
+            value = self.headers.get('Host') or ''
+            if value.startswith('['):
+                host, _, port = value[1:].partition(']')  # [::1]:8765
+                port = port[1:] if port.startswith(':') else port
+            else:
+                host, _, port = value.partition(':')
+            if port and not port.isdigit():
+                return False
+            return _is_loopback(host) and int(port or 80) == self.server.server_address[1]
+
+        def _send_json(self, status: int, data: Dict):
+            body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def address_string(self):
+            # Unix 소켓은 클라이언트 주소가 없음
+            return self.client_address[0] if self.client_address else 'unix'
+
+        def log_message(self, format, *args):
+            print(f"🌐 {self.address_string()} {format % args}")
+
+    return Handler
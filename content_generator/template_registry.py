@@ -0,0 +1,226 @@
+"""
+템플릿 레지스트리 모듈
+
+templates/<이름>/ 폴더의 템플릿 파일을 읽어 프로세스당 한 번만 컴파일하고,
+(경로, 수정 시각) 기준으로 캐시한다.
+
+템플릿 폴더 구성:
+    index.html     차시 뷰어 페이지 ($이름 형식 치환 가능)
+    data.json      data.json 골격 (선택, "$subject" 같은 값은 차시별 값으로 치환)
+    template.json  메타데이터 (선택)
+                   - course_code_pattern: auto 선택 시 과정 코드 매칭 정규식
+                   - guide_required: 다운로드 자료가 없어도 guide 필드 기록 여부
+"""
+
+import json
+import re
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, List, Optional, Tuple
+
+from .json_encoder import FragmentEncoder, encode_json, slot_marker
+
+
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+AUTO_TEMPLATE = 'auto'
+DEFAULT_TEMPLATE = 'ct2022'
+
+TEMPLATE_FILES = ('index.html', 'data.json', 'template.json')
+
+# data.json 골격에서 차시별 값으로 바뀌는 값 ("$subject" 형식)
+DATA_JSON_FIELDS = ('subject', 'index', 'media')
+
+# 템플릿에 data.json 골격이 없을 때 쓰는 기본 구조
+DEFAULT_DATA_SKELETON = {
+    "subject": "$subject",
+    "index": "$index",
+    "section": 1,
+    "sections": ["학습하기"],
+    "pages": [
+        {
+            "path": "/lecture",
+            "section": 1,
+            "title": "학습하기",
+            "component": "lecture",
+            "media": "$media",
+            "data": {}
+        }
+    ]
+}
+
+
+class CompiledTemplate:
+    """컴파일된 템플릿"""
+
+    def __init__(self, name: str, directory: Path):
+        """
+        Args:
+            name: 템플릿 이름 (폴더명)
+            directory: 템플릿 폴더 경로
+        """
+        self.name = name
+        self.directory = directory
+
+        index_file = directory / 'index.html'
+        self.index_html = Template(index_file.read_text(encoding='utf-8'))
+        self._static_index_html: Optional[str] = None
+        if not self.index_html.pattern.search(self.index_html.template):
+            # 치환할 값이 없는 템플릿은 렌더링 결과를 그대로 재사용
+            self._static_index_html = self.index_html.template
+
+        data_file = directory / 'data.json'
+        self.data_skeleton: Optional[Dict] = None
+        if data_file.exists():
+            with open(data_file, 'r', encoding='utf-8') as f:
+                self.data_skeleton = json.load(f)
+
+        metadata_file = directory / 'template.json'
+        self.metadata: Dict[str, Any] = {}
+        if metadata_file.exists():
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                self.metadata = json.load(f)
+
+        # data.json 빠른 인코딩: 차시마다 같은 부분은 미리 직렬화
+        self._data_encoder = FragmentEncoder(
+            _fill_placeholders(self.data_skeleton or DEFAULT_DATA_SKELETON,
+                               {name: slot_marker(name) for name in DATA_JSON_FIELDS}),
+            DATA_JSON_FIELDS
+        )
+
+        pattern = self.metadata.get('course_code_pattern')
+        self.course_code_pattern = re.compile(pattern) if pattern else None
+        self.guide_required = bool(self.metadata.get('guide_required', False))
+
+    def render_index_html(self, **context) -> str:
+        """index.html 렌더링"""
+        if self._static_index_html is not None:
+            return self._static_index_html
+        return self.index_html.safe_substitute(context)
+
+    def encode_data_json(self, guide: Optional[str] = None, fast: bool = True, **values) -> bytes:
+        """
+        차시 data.json 내용 (골격이 없으면 기본 구조)
+
+        Args:
+            guide: guide 필드 값 (None이면 guide 필드 없음)
+            fast: 미리 직렬화한 조각 사용 여부 (False면 json.dumps, 결과는 같음)
+            **values: DATA_JSON_FIELDS 값 (subject, index, media)
+
+        Returns:
+            UTF-8 JSON (탭 들여쓰기)
+        """
+        extra = {'guide': guide} if guide is not None else None
+        if fast:
+            encoded = self._data_encoder.encode(values, extra)
+            if encoded is not None:
+                return encoded
+
+        data = _fill_placeholders(self.data_skeleton or DEFAULT_DATA_SKELETON, values)
+        if extra:
+            data.update(extra)
+        return encode_json(data)
+
+    def matches(self, course_code: Optional[str]) -> bool:
+        """auto 선택 시 과정 코드가 이 템플릿에 해당하는지"""
+        if not course_code or self.course_code_pattern is None:
+            return False
+        return bool(self.course_code_pattern.search(course_code))
+
+
+def _fill_placeholders(node, values: Dict):
+    """"$이름" 문자열을 values 값으로 바꾼 사본 반환"""
+    if isinstance(node, str):
+        if node.startswith('$') and node[1:] in values:
+            return values[node[1:]]
+        return node
+    if isinstance(node, dict):
+        return {key: _fill_placeholders(value, values) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_fill_placeholders(value, values) for value in node]
+    return node
+
+
+class TemplateRegistry:
+    """템플릿 레지스트리 (폴더 기반, 컴파일 결과 캐시)"""
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR):
+        """
+        Args:
+            template_dir: 템플릿 폴더들이 있는 디렉토리
+        """
+        self.template_dir = Path(template_dir)
+        self._cache: Dict[str, Tuple[Tuple, CompiledTemplate]] = {}
+
+    def names(self) -> List[str]:
+        """사용 가능한 템플릿 이름 목록"""
+        if not self.template_dir.is_dir():
+            return []
+        return sorted(
+            path.name for path in self.template_dir.iterdir()
+            if (path / 'index.html').is_file()
+        )
+
+    def get(self, name: str) -> CompiledTemplate:
+        """
+        컴파일된 템플릿 반환 (파일이 바뀌지 않았으면 캐시 사용)
+
+        Raises:
+            ValueError: 템플릿이 없는 경우
+        """
+        directory = self.template_dir / name
+        cache_key = self._cache_key(directory)
+        if cache_key is None:
+            available = ', '.join(self.names())
+            raise ValueError(f"템플릿을 찾을 수 없습니다: {name} (사용 가능: {available})")
+
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        template = CompiledTemplate(name, directory)
+        self._cache[name] = (cache_key, template)
+        return template
+
+    def resolve(self, name: str, course_code: Optional[str] = None) -> str:
+        """
+        템플릿 이름 결정
+
+        auto이면 과정 코드에 맞는 템플릿(예: 25ct* → ct2022, 25it* → it2023)을 고르고,
+        맞는 템플릿이 없으면 기본 템플릿을 쓴다.
+
+        Raises:
+            ValueError: 없는 템플릿 이름인 경우 (오타로 다른 템플릿이 쓰이지 않도록)
+        """
+        names = self.names()
+        if name == AUTO_TEMPLATE:
+            for candidate in names:
+                if self.get(candidate).matches(course_code):
+                    return candidate
+            return DEFAULT_TEMPLATE
+        if name in names:
+            return name
+        raise ValueError(f"템플릿을 찾을 수 없습니다: {name} (사용 가능: {', '.join(names)})")
+
+    @staticmethod
+    def _cache_key(directory: Path) -> Optional[Tuple]:
+        """캐시 키: (경로, 각 템플릿 파일의 수정 시각) - index.html이 없으면 None"""
+        key = [str(directory)]
+        for filename in TEMPLATE_FILES:
+            try:
+                key.append(directory.joinpath(filename).stat().st_mtime_ns)
+            except OSError:
+                if filename == 'index.html':
+                    return None
+                key.append(None)
+        return tuple(key)
+
+
+_registry: Optional[TemplateRegistry] = None
+
+
+def get_registry() -> TemplateRegistry:
+    """프로세스 공용 템플릿 레지스트리"""
+    global _registry
+    if _registry is None:
+        _registry = TemplateRegistry()
+    return _registry
@@ -0,0 +1,381 @@
+"""
+데이터 검사 모듈 (--validate)
+
+시트의 모든 행을 컬럼 단위로 한 번에 검사해 문제마다 행 번호와 함께 보고한다.
+검사는 파서가 만든 컬럼별 값 리스트를 파이썬 반복으로 훑는다. native/openpyxl 엔진과 CSV는 pandas를
+가져오지 않으므로 DataFrame 연산을 쓰지 않는다 (벤치마크 validate 단계: 6,000행 약 10ms, 파싱 시간의 2% 미만).
+파싱(CourseDataParser)이 과정 데이터를 만들기 전에 같은 검사를 실행하므로 잘못된 값이
+파싱 도중 예외를 내거나 조용히 받아들여지지 않는다.
+
+- 오류 (error): 파싱/생성이 실패하거나 잘못된 결과가 나오는 값 → 시트 처리 중단
+    필수 컬럼 누락, 차시 없음, 정수가 아닌 차시번호/차시/챕터구분, 차시번호 중복,
+    첫 차시 강의영상 링크에서 과정 코드를 알 수 없음, 과정 코드(년도/과정 경로)가 첫 차시와 다른 강의영상 링크,
+    여러 시트가 같은 과정 코드 (--validate)
+- 경고 (warning): 생성은 되지만 확인이 필요한 값
+    빈 행, 차시번호 없음 (행 순서로 대체), 차시명/강의영상 링크 없음, 첫 행 과정명 없음,
+    강의영상 링크에 과정 코드 경로 없음
+
+행 번호는 시트의 행 번호 (헤더가 1행, 첫 데이터가 2행)다. CSV는 빈 줄을 뺀 행 번호.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# 첫 데이터 행의 시트 행 번호 (1행은 헤더)
+FIRST_DATA_ROW = 2
+
+REQUIRED_COLUMNS = ('과정명', '차시번호', '차시명', '강의영상(mp4) 링크')
+
+# 정수여야 하는 컬럼
+INTEGER_COLUMNS = ('차시번호', '차시', '챕터구분')
+
+# 검사 대상 컬럼 순서 (같은 행의 문제 정렬용)
+COLUMN_ORDER = ('과정명', '차시', '챕터구분', '챕터명', '강의 수', '차시번호', '차시명',
+                '학습자페이지 노출 차시명', '강의영상(mp4) 링크', '다운로드(zip) 링크')
+
+
+def course_segment(url: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    강의영상 링크의 (년도, 과정 코드) 경로
+
+    예: https://cdn-it.livestudy.com/mov/2025/25ctvibec/25ctvibec_01.mp4 → ('2025', '25ctvibec')
+
+    Returns:
+        (년도, 과정 코드) - 네 자리 숫자 경로 다음 경로, 없으면 None
+    """
+    if not url:
+        return None
+    parts = str(url).split('/')
+    for i, part in enumerate(parts[:-1]):
+        if part.isdigit() and len(part) == 4:
+            return part, parts[i + 1]
+    return None
+
+
+def _is_integer(value) -> bool:
+    """int()로 값이 바뀌지 않고 변환되는지 (정수, 정수인 실수, 정수 문자열)"""
+    if isinstance(value, int):
+        return True
+    if isinstance(value, float):
+        return value.is_integer()
+    if isinstance(value, str):
+        try:
+            int(value)
+        except ValueError:
+            return False
+        return True
+    return False
+
+
+def _issue(level: str, code: str, message: str, position: Optional[int] = None,
+           column: Optional[str] = None, value=None) -> Dict:
+    """문제 항목 하나 (position: 데이터 행 위치, 0부터)"""
+    issue = {
+        "level": level,
+        "code": code,
+        "row": position + FIRST_DATA_ROW if position is not None else None,
+        "column": column,
+        "message": message,
+    }
+    if value is not None:
+        issue["value"] = value if isinstance(value, (int, float, str, bool)) else str(value)
+    return issue
+
+
+def check_sheet(columns: Dict[str, List]) -> List[Dict]:
+    """
+    시트 하나의 모든 행 검사 (컬럼 단위)
+
+    Args:
+        columns: {컬럼명: 값 리스트} (parser.sheet_columns/frame_columns 결과, 빈 셀은 None)
+
+    Returns:
+        문제 목록 [{"level", "code", "row", "column", "message"[, "value"]}] (행 순서)
+    """
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        return [_issue(ERROR, 'missing_column', f"필수 컬럼 누락: {', '.join(missing)}")]
+
+    row_count = len(columns['차시번호'])
+    if not row_count:
+        return [_issue(ERROR, 'no_rows', "차시 데이터가 없습니다")]
+
+    issues = []
+
+    # 빈 행 (중간에 있으면 빈 차시로 생성됨)
+    width = len(columns)
+    blank_positions = {
+        position for position, row in enumerate(zip(*columns.values())) if row.count(None) == width
+    }
+    for position in sorted(blank_positions):
+        issues.append(_issue(WARNING, 'blank_row', "빈 행 (빈 차시로 생성됨)", position))
+
+    # 정수 컬럼
+    for name in INTEGER_COLUMNS:
+        for position, value in enumerate(columns.get(name, ())):
+            if value is not None and type(value) is not int and not _is_integer(value):
+                issues.append(_issue(ERROR, 'invalid_integer', f"정수가 아닌 {name}: {value}",
+                                     position, name, value))
+
+    # 차시번호 중복 (빈 차시번호는 행 순서로 대체되므로 함께 비교)
+    first_positions: Dict[int, int] = {}
+    for position, value in enumerate(columns['차시번호']):
+        if value is None:
+            number = position + 1
+            if position not in blank_positions:
+                issues.append(_issue(WARNING, 'missing_lesson_number',
+                                     f"차시번호 없음 (행 순서 {number:02d}로 대체)", position, '차시번호'))
+        elif _is_integer(value):
+            number = int(value)
+        else:
+            continue
+        if number in first_positions:
+            issues.append(_issue(
+                ERROR, 'duplicate_lesson_number',
+                f"차시번호 중복: {number:02d} ({first_positions[number] + FIRST_DATA_ROW}행과 같음)",
+                position, '차시번호', number
+            ))
+        else:
+            first_positions[number] = position
+
+    # 과정 코드: 첫 차시 강의영상 링크 기준
+    video_urls = columns['강의영상(mp4) 링크']
+    reference = course_segment(video_urls[0])
+    if video_urls[0] is None:
+        issues.append(_issue(ERROR, 'course_code_missing',
+                             "첫 차시 강의영상 링크가 없어 과정 코드를 알 수 없습니다", 0, '강의영상(mp4) 링크'))
+    elif reference is None:
+        issues.append(_issue(ERROR, 'course_code_missing',
+                             "첫 차시 강의영상 링크에 년도/과정 코드 경로가 없어 과정 코드를 알 수 없습니다",
+                             0, '강의영상(mp4) 링크', video_urls[0]))
+
+    # 첫 차시 링크의 과정 경로까지 같은 링크는 과정 코드도 같음 (대부분의 행)
+    same_prefix = None
+    if reference is not None:
+        parts = str(video_urls[0]).split('/')
+        same_prefix = '/'.join(parts[:parts.index(reference[0]) + 2]) + '/'
+
+    for position in range(1, row_count):
+        url = video_urls[position]
+        if url is None or (same_prefix is not None and isinstance(url, str) and url.startswith(same_prefix)):
+            continue
+        segment = course_segment(url)
+        if segment is None:
+            issues.append(_issue(WARNING, 'course_code_not_found', "강의영상 링크에 년도/과정 코드 경로가 없습니다",
+                                 position, '강의영상(mp4) 링크', url))
+        elif reference is not None and segment != reference:
+            issues.append(_issue(
+                ERROR, 'course_code_mismatch',
+                f"강의영상 링크의 과정 경로 {'/'.join(segment)} 가 첫 차시({'/'.join(reference)})와 다릅니다",
+                position, '강의영상(mp4) 링크', url
+            ))
+
+    # 빈 값 (빈 행, 첫 차시 강의영상 링크는 위에서 보고)
+    for name, code, message, first in (('차시명', 'missing_title', "차시명 없음", 0),
+                                       ('강의영상(mp4) 링크', 'missing_video_url', "강의영상 링크 없음", 1)):
+        values = columns[name]
+        for position in range(first, row_count):
+            if values[position] is None and position not in blank_positions:
+                issues.append(_issue(WARNING, code, message, position, name))
+    if columns['과정명'][0] is None:
+        issues.append(_issue(WARNING, 'missing_subject', "첫 행에 과정명이 없습니다", 0, '과정명'))
+
+    issues.sort(key=_issue_order)
+    return issues
+
+
+def _issue_order(issue: Dict):
+    """문제 정렬 기준 (행, 컬럼 순서)"""
+    column = issue['column']
+    return (
+        issue['row'] or 0,
+        COLUMN_ORDER.index(column) if column in COLUMN_ORDER else -1,
+    )
+
+
+def format_issue(issue: Dict) -> str:
+    """문제 한 줄 표시 (예: "5행 [차시번호] 차시번호 중복: 03 (4행과 같음)")"""
+    location = f"{issue['row']}행 " if issue['row'] is not None else ""
+    column = f"[{issue['column']}] " if issue['column'] else ""
+    return f"{location}{column}{issue['message']}"
+
+
+class ValidationReport:
+    """여러 시트의 데이터 검사 결과"""
+
+    def __init__(self):
+        self.sheets: List[Dict] = []
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    def add_sheet(self, input_file: str, sheet, columns: Optional[Dict[str, List]] = None,
+                  error: Optional[str] = None):
+        """
+        시트 하나 검사 결과 추가
+
+        Args:
+            input_file: 입력 파일
+            sheet: 시트 이름 (CSV는 None)
+            columns: 시트 컬럼 값 (읽지 못했으면 None)
+            error: 시트를 읽지 못한 이유
+        """
+        if columns is None:
+            issues = [_issue(ERROR, 'unreadable', error or "시트를 읽을 수 없습니다")]
+            row_count = 0
+        else:
+            issues = check_sheet(columns)
+            row_count = len(next(iter(columns.values()), ()))
+
+        course_code = None
+        if columns is not None and columns.get('강의영상(mp4) 링크'):
+            segment = course_segment(columns['강의영상(mp4) 링크'][0])
+            course_code = segment[1] if segment is not None else None
+
+        self.sheets.append({
+            "input_file": input_file,
+            "sheet": sheet,
+            "course_code": course_code,
+            "rows": row_count,
+            "issues": issues,
+        })
+
+    def add_checked_sheet(self, input_file: str, sheet, course_code: Optional[str], rows: int):
+        """
+        이미 검사를 통과한 시트 추가 (다시 읽지 않음, 시트 간 과정 코드 검사에만 사용)
+
+        Args:
+            input_file: 입력 파일
+            sheet: 시트 이름
+            course_code: 시트가 만드는 과정 코드
+            rows: 행 수
+        """
+        self.sheets.append({
+            "input_file": input_file,
+            "sheet": sheet,
+            "course_code": course_code,
+            "rows": rows,
+            "issues": [],
+        })
+
+    def finish(self):
+        """시트 간 검사 (같은 과정 코드를 만드는 시트) 후 소요 시간 기록"""
+        sources: Dict[str, List[Dict]] = {}
+        for sheet in self.sheets:
+            if sheet['course_code'] is not None:
+                sources.setdefault(sheet['course_code'], []).append(sheet)
+
+        for code, sheets in sources.items():
+            if len(sheets) < 2:
+                continue
+            names = ', '.join(_sheet_label(sheet) for sheet in sheets)
+            for sheet in sheets:
+                sheet['issues'].insert(0, _issue(ERROR, 'duplicate_course_code',
+                                                 f"여러 시트가 같은 과정 코드 {code} 를 만듭니다: {names}"))
+
+        self.seconds = time.perf_counter() - self.started
+
+    @property
+    def error_count(self) -> int:
+        return sum(1 for sheet in self.sheets for issue in sheet['issues'] if issue['level'] == ERROR)
+
+    @property
+    def warning_count(self) -> int:
+        return sum(1 for sheet in self.sheets for issue in sheet['issues'] if issue['level'] == WARNING)
+
+    def to_dict(self) -> Dict:
+        """JSON 출력용 보고서"""
+        return {
+            "sheets": self.sheets,
+            "totals": {
+                "sheets": len(self.sheets),
+                "rows": sum(sheet['rows'] for sheet in self.sheets),
+                "errors": self.error_count,
+                "warnings": self.warning_count,
+            },
+        }
+
+    def to_json(self) -> str:
+        """보고서 JSON 문자열"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def print_summary(self):
+        """시트별 문제 전체 출력"""
+        for sheet in self.sheets:
+            errors = sum(1 for issue in sheet['issues'] if issue['level'] == ERROR)
+            warnings = len(sheet['issues']) - errors
+            label = _sheet_label(sheet)
+            if not sheet['issues']:
+                print(f"✅ {label}: 문제 없음 (행 {sheet['rows']:,}개)")
+                continue
+            icon = '❌' if errors else '⚠️ '
+            print(f"{icon} {label}: 오류 {errors}건, 경고 {warnings}건 (행 {sheet['rows']:,}개)")
+            for issue in sheet['issues']:
+                marker = '오류' if issue['level'] == ERROR else '경고'
+                print(f"   - {marker} {format_issue(issue)}")
+
+        totals = self.to_dict()['totals']
+        print()
+        print("=" * 60)
+        print(f"📊 데이터 검사 결과: 시트 {totals['sheets']}개, 행 {totals['rows']:,}개 ({self.seconds:.2f}초)")
+        print(f"   - 오류: {totals['errors']}건")
+        print(f"   - 경고: {totals['warnings']}건")
+        print("=" * 60)
+
+
+def _sheet_label(sheet: Dict) -> str:
+    """보고서의 시트 표시 (파일 이름 [시트])"""
+    name = Path(sheet['input_file']).name
+    return f"{name} [{sheet['sheet']}]" if sheet['sheet'] is not None else name
+
+
+def validate_file(report: ValidationReport, input_file: str, sheets: Optional[List] = None,
+                  engine: str = 'pandas'):
+    """
+    워크북(또는 CSV)의 대상 시트를 읽어 검사 결과를 보고서에 추가 (아무것도 생성하지 않음)
+
+    Args:
+        report: 검사 보고서
+        input_file: 엑셀/CSV 파일
+        sheets: 검사할 시트 이름/인덱스 (None이면 'TTL' 제외 모든 시트)
+        engine: 엑셀 파서 엔진
+    """
+    from .parser import CourseDataParser, WorkbookSession
+
+    if Path(input_file).suffix != '.xlsx':
+        try:
+            columns = CourseDataParser(input_file, engine=engine).read_columns()
+        except Exception as e:
+            report.add_sheet(input_file, None, error=str(e))
+            return
+        report.add_sheet(input_file, None, columns)
+        return
+
+    try:
+        workbook = WorkbookSession(input_file, engine=engine)
+    except Exception as e:
+        report.add_sheet(input_file, None, error=str(e))
+        return
+
+    with workbook:
+        if sheets is None:
+            targets = [name for name in workbook.sheet_names if name != 'TTL']
+        else:
+            targets = sheets
+        try:
+            workbook.load_sheets(targets)  # pandas: 대상 시트를 한 번에 읽기
+        except ValueError:
+            pass  # 없는 시트는 시트별로 보고
+
+        for sheet in targets:
+            try:
+                columns = CourseDataParser(input_file, sheet, workbook=workbook, engine=engine).read_columns()
+            except Exception as e:
+                report.add_sheet(input_file, sheet, error=str(e))
+                continue
+            report.add_sheet(input_file, sheet, columns)
@@ -0,0 +1,104 @@
+"""
+입력 파일 감시 모듈 (--watch)
+
+입력 워크북을 주기적으로 확인해 저장이 끝나면(디바운스) 시트별 내용 지문을 다시 계산한다.
+지문이 바뀐 시트만 다시 파싱/생성하도록 CLI가 이 모듈을 사용한다.
+
+- 파일 변경 감지: (수정 시각, 크기) 폴링 - 추가 의존성 없음
+- 디바운스: 변경 후 일정 시간 동안 더 바뀌지 않아야 저장 완료로 판단
+- 시트 지문: .xlsx는 시트별 셀 값의 SHA-256 (공유 문자열 순서가 바뀌어도 같은 값이면 같은 지문),
+  그 외 형식(CSV 등)은 파일 전체 SHA-256 하나
+"""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .xlsx_reader import XlsxReader
+
+
+# 파일 상태 확인 간격 (초)
+POLL_INTERVAL = 0.5
+
+# 기본 디바운스 시간 (초)
+DEFAULT_DEBOUNCE = 2.0
+
+
+def file_signature(file_path: str) -> Optional[Tuple[int, int]]:
+    """파일 (수정 시각, 크기) - 파일이 없으면 None (저장 중 임시로 사라진 경우 포함)"""
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def sheet_fingerprints(file_path: str) -> Dict[Optional[str], str]:
+    """
+    시트별 내용 지문
+
+    Args:
+        file_path: 입력 파일 경로
+
+    Returns:
+        {시트 이름: SHA-256} (.xlsx가 아니면 {None: 파일 전체 SHA-256})
+
+    Raises:
+        ValueError: xlsx 파일을 읽을 수 없는 경우 (저장 중인 파일 등)
+    """
+    path = Path(file_path)
+    if path.suffix != '.xlsx':
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return {None: digest.hexdigest()}
+
+    fingerprints = {}
+    with XlsxReader(path) as reader:
+        for name in reader.sheet_names:
+            digest = hashlib.sha256()
+            for row in reader.iter_rows(name):
+                digest.update(repr(row).encode('utf-8'))
+                digest.update(b'\n')
+            fingerprints[name] = digest.hexdigest()
+    return fingerprints
+
+
+class FileWatcher:
+    """입력 파일 변경 감시기"""
+
+    def __init__(self, file_path: str, debounce: float = DEFAULT_DEBOUNCE, interval: float = POLL_INTERVAL):
+        """
+        Args:
+            file_path: 감시할 파일 경로
+            debounce: 마지막 변경 후 이 시간(초) 동안 더 바뀌지 않으면 저장 완료로 판단
+            interval: 파일 상태 확인 간격 (초)
+        """
+        self.file_path = file_path
+        self.debounce = debounce
+        self.interval = interval
+        self._signature = file_signature(file_path)
+
+    def wait_for_change(self):
+        """파일이 바뀌고 디바운스 시간 동안 더 바뀌지 않을 때까지 대기"""
+        while True:
+            time.sleep(self.interval)
+            signature = file_signature(self.file_path)
+            if signature is None or signature == self._signature:
+                continue
+
+            # 연속 저장이 끝날 때까지 대기
+            stable_since = time.monotonic()
+            while time.monotonic() - stable_since < self.debounce:
+                time.sleep(self.interval)
+                current = file_signature(self.file_path)
+                if current != signature:
+                    signature = current
+                    stable_since = time.monotonic()
+
+            if signature is None or signature == self._signature:
+                continue
+            self._signature = signature
+            return
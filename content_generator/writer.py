@@ -0,0 +1,96 @@
+"""
+과정 폴더 쓰기 모듈
+
+폴더 생성과 파일 쓰기 작업을 모아 스레드 풀로 실행한다.
+(NFS 같은 네트워크 파일 시스템에서 왕복 지연을 겹쳐서 처리)
+"""
+
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from . import profiler
+
+
+class TreeWriter:
+    """폴더/파일 쓰기 작업 실행기"""
+
+    def __init__(self, max_workers: int = 1):
+        """
+        Args:
+            max_workers: 동시에 실행할 스레드 수 (1이면 순차 실행)
+        """
+        self.max_workers = max(1, max_workers)
+        self.errors: List[Tuple[Path, Exception]] = []
+        self.operations = 0
+        self.bytes_written = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def make_directories(self, directories: Iterable[Path]):
+        """
+        폴더 생성 (상위 폴더가 먼저 만들어지도록 깊이 순서로, 같은 깊이는 병렬)
+
+        Args:
+            directories: 만들 폴더 목록
+        """
+        levels = defaultdict(list)
+        for directory in dict.fromkeys(directories):
+            levels[len(directory.parts)].append(directory)
+
+        for depth in sorted(levels):
+            self._run([
+                (directory, partial(directory.mkdir, exist_ok=True))
+                for directory in levels[depth]
+            ])
+            profiler.count('mkdir', len(levels[depth]))
+
+    def write_files(self, tasks: Iterable[Tuple[Path, Callable[[], Optional[int]]]]):
+        """
+        파일 쓰기 작업 실행 (상위 폴더는 이미 있어야 함)
+
+        Args:
+            tasks: (파일 경로, 쓰기 함수) 목록. 쓰기 함수는 실제로 쓴 바이트 수를 반환 (정수가 아니면 0으로 취급)
+        """
+        self._run(list(tasks))
+
+    def throughput(self) -> str:
+        """처리량 요약 문자열"""
+        elapsed = self.elapsed or 1e-9
+        return (
+            f"스레드 {self.max_workers}개, 작업 {self.operations}개, {self.elapsed:.2f}초 "
+            f"({self.operations / elapsed:.0f} 작업/s, "
+            f"{self.bytes_written / elapsed / 1024 / 1024:.1f} MB/s)"
+        )
+
+    def _run(self, tasks: List[Tuple[Path, Callable]]):
+        """작업 실행 (실패는 파일별로 모아 둠)"""
+        start = time.perf_counter()
+
+        if self.max_workers == 1 or len(tasks) <= 1:
+            for path, task in tasks:
+                self._execute(path, task)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for path, task in tasks:
+                    executor.submit(self._execute, path, task)
+
+        self.elapsed += time.perf_counter() - start
+
+    def _execute(self, path: Path, task: Callable):
+        """작업 하나 실행"""
+        try:
+            written = task()
+        except Exception as e:
+            with self._lock:
+                self.errors.append((path, e))
+            return
+
+        with self._lock:
+            self.operations += 1
+            if isinstance(written, int):
+                self.bytes_written += written
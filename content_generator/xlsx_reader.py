@@ -0,0 +1,232 @@
+"""
+xlsx 직접 읽기 모듈 (native 엔진)
+
+pandas/openpyxl 없이 zipfile + 점진적 XML 파싱(iterparse)으로 시트 값을 행 단위로 읽는다.
+과정 시트처럼 단순한 표만 대상으로 하며, 값 변환은 pandas read_excel과 같은 규칙을 따른다.
+
+- 공유 문자열/인라인 문자열/수식 문자열 → str
+- 숫자 → 정수로 떨어지면 int, 아니면 float
+- 불리언 → bool, 오류 셀(#N/A 등) → None
+- 날짜 서식 숫자는 변환하지 않음 (과정 시트에는 날짜 컬럼이 없음)
+"""
+
+import posixpath
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+
+RELATIONSHIP_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+SHARED_STRINGS_TYPE = '/sharedStrings'
+
+
+def _local_name(tag: str) -> str:
+    """네임스페이스를 뺀 태그 이름 (transitional/strict 형식 모두 처리)"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _column_index(reference: str) -> int:
+    """셀 참조의 컬럼 위치 (예: 'C12' → 2)"""
+    index = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - 64)
+    return index - 1
+
+
+def _number(text: str):
+    """숫자 셀 값 (정수로 떨어지면 int)"""
+    try:
+        return int(text)
+    except ValueError:
+        value = float(text)
+        if value.is_integer():
+            return int(value)
+        return value
+
+
+class XlsxReader:
+    """xlsx 워크북 리더"""
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path: .xlsx 파일 경로
+
+        Raises:
+            ValueError: xlsx 형식이 아닌 경우
+        """
+        self.file_path = Path(file_path)
+        try:
+            self._zip = zipfile.ZipFile(self.file_path)
+        except zipfile.BadZipFile:
+            raise ValueError(f"엑셀 파일을 읽을 수 없습니다: {self.file_path}")
+
+        self._sheet_paths: Dict[str, str] = {}
+        self.sheet_names: List[str] = []
+        self._shared_strings: Optional[List[str]] = None
+        self._shared_strings_path: Optional[str] = None
+        self._read_workbook()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """파일 닫기"""
+        self._zip.close()
+
+    def iter_rows(self, sheet_name: str) -> Iterator[Tuple]:
+        """
+        시트의 행을 값 튜플로 하나씩 반환 (중간에 빠진 행은 빈 튜플)
+
+        Args:
+            sheet_name: 시트 이름
+        """
+        shared_strings = self._get_shared_strings()
+        expected_row = 1
+        sheet_data = None
+
+        with self._zip.open(self._sheet_paths[sheet_name]) as f:
+            for event, element in ElementTree.iterparse(f, events=('start', 'end')):
+                name = _local_name(element.tag)
+                if event == 'start':
+                    if name == 'sheetData':
+                        sheet_data = element
+                    continue
+                if name != 'row':
+                    continue
+
+                reference = element.get('r')
+                row_number = int(reference) if reference else expected_row
+                for _ in range(row_number - expected_row):
+                    yield ()
+                expected_row = row_number + 1
+
+                values = self._read_row(element, shared_strings)
+                # 읽은 행은 트리에서 떼어 내 메모리를 일정하게 유지
+                if sheet_data is not None:
+                    sheet_data.clear()
+                yield values
+
+    def _read_row(self, row_element, shared_strings: List[str]) -> Tuple:
+        """row 요소의 셀 값 튜플"""
+        values = []
+        for cell in row_element:
+            if _local_name(cell.tag) != 'c':
+                continue
+
+            reference = cell.get('r')
+            position = _column_index(reference) if reference else len(values)
+            if position < len(values):
+                continue
+            values.extend([None] * (position - len(values)))
+            values.append(self._cell_value(cell, shared_strings))
+
+        # 끝쪽 빈 셀 제거
+        while values and values[-1] is None:
+            values.pop()
+        return tuple(values)
+
+    @staticmethod
+    def _cell_value(cell, shared_strings: List[str]):
+        """셀 값 변환 (pandas read_excel 규칙)"""
+        cell_type = cell.get('t', 'n')
+
+        if cell_type == 'inlineStr':
+            for child in cell:
+                if _local_name(child.tag) == 'is':
+                    return _string_item_text(child)
+            return None
+
+        value_text = None
+        for child in cell:
+            if _local_name(child.tag) == 'v':
+                value_text = child.text
+                break
+        if value_text is None:
+            return None
+
+        if cell_type == 's':
+            return shared_strings[int(value_text)]
+        if cell_type in ('str', 'd'):
+            return value_text
+        if cell_type == 'b':
+            return value_text.strip() == '1'
+        if cell_type == 'e':
+            return None
+        return _number(value_text)
+
+    def _read_workbook(self):
+        """시트 이름과 시트 XML 경로 읽기"""
+        relationships = self._read_relationships('xl/_rels/workbook.xml.rels', 'xl')
+
+        with self._zip.open('xl/workbook.xml') as f:
+            for _, element in ElementTree.iterparse(f, events=('end',)):
+                if _local_name(element.tag) != 'sheet':
+                    continue
+                relationship_id = element.get(f'{{{RELATIONSHIP_NS}}}id')
+                name = element.get('name')
+                target = relationships.get(relationship_id)
+                if name is not None and target is not None:
+                    self.sheet_names.append(name)
+                    self._sheet_paths[name] = target[0]
+
+        for path, relationship_type in relationships.values():
+            if relationship_type.endswith(SHARED_STRINGS_TYPE):
+                self._shared_strings_path = path
+
+    def _read_relationships(self, rels_path: str, base_dir: str) -> Dict[str, Tuple[str, str]]:
+        """관계 파일 읽기 → {Id: (zip 내부 경로, 관계 유형)}"""
+        relationships = {}
+        try:
+            f = self._zip.open(rels_path)
+        except KeyError:
+            return relationships
+
+        with f:
+            for _, element in ElementTree.iterparse(f, events=('end',)):
+                if _local_name(element.tag) != 'Relationship':
+                    continue
+                target = element.get('Target', '')
+                if target.startswith('/'):
+                    path = target.lstrip('/')
+                else:
+                    path = posixpath.normpath(posixpath.join(base_dir, target))
+                relationships[element.get('Id')] = (path, element.get('Type', ''))
+        return relationships
+
+    def _get_shared_strings(self) -> List[str]:
+        """공유 문자열 목록 (처음 사용할 때 한 번만 읽음)"""
+        if self._shared_strings is not None:
+            return self._shared_strings
+
+        self._shared_strings = []
+        path = self._shared_strings_path
+        if path is None or path not in self._zip.namelist():
+            return self._shared_strings
+
+        with self._zip.open(path) as f:
+            for _, element in ElementTree.iterparse(f, events=('end',)):
+                if _local_name(element.tag) == 'si':
+                    self._shared_strings.append(_string_item_text(element))
+                    element.clear()
+        return self._shared_strings
+
+
+def _string_item_text(element) -> str:
+    """문자열 항목(si/is)의 텍스트 (서식 run은 이어 붙이고, 윗주(rPh)는 제외)"""
+    parts = []
+    for child in element:
+        name = _local_name(child.tag)
+        if name == 't':
+            parts.append(child.text or '')
+        elif name == 'r':
+            for run_child in child:
+                if _local_name(run_child.tag) == 't':
+                    parts.append(run_child.text or '')
+    return ''.join(parts)
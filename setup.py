@@ -5,7 +5,10 @@ setup(
     version='1.0.0',
     description='교육 콘텐츠 폴더 구조 자동 생성 도구',
     author='메가존 IT 교육팀',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks']),
+    package_data={
+        'content_generator': ['templates/*/*'],
+    },
     install_requires=[
         'pandas>=2.0.0',
         'openpyxl>=3.1.0',
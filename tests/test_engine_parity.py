@@ -0,0 +1,126 @@
+"""
+엑셀 파서 엔진(pandas, openpyxl, native) 출력 동일성 테스트
+
+같은 워크북을 엔진마다 파싱해 과정 데이터(Course.to_dict())와 생성한 폴더 트리가 바이트 단위로 같은지 확인한다.
+워크북: examples/test_25ctvibec.xlsx, 가상 워크북 (다운로드 링크 배치별, 다운로드 컬럼 없음, 빈 차시번호 셀)
+
+실행:
+    python -m pytest tests/test_engine_parity.py
+    python -m unittest tests.test_engine_parity
+"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import openpyxl
+
+from benchmarks.synthetic import COLUMNS, course_rows
+from content_generator.generator import ContentGenerator, MANIFEST_FILENAME
+from content_generator.parser import ENGINES, WorkbookSession, parse_course_file
+
+
+EXAMPLE_FILE = Path(__file__).parent.parent / 'examples' / 'test_25ctvibec.xlsx'
+
+LESSON_NUMBER_COLUMN = COLUMNS.index('차시번호')
+
+# 가상 워크북 시트: (시트 이름, 차시 수, 챕터 수, 다운로드 링크 배치, 차시번호를 비울 행 위치)
+SYNTHETIC_SHEETS = (
+    ('25ctfirst', 24, 3, 'first', ()),
+    ('25ctall', 12, 2, 'all', ()),
+    ('25ctnodown', 10, 2, 'none', ()),
+    ('25ctblank', 15, 3, 'first', (0, 4, 5, 14)),
+)
+
+
+def write_fixture(path: Path):
+    """가상 워크북 저장 (TTL 시트 포함)"""
+    workbook = openpyxl.Workbook()
+    workbook.active.title = 'TTL'
+    workbook.active.append(['과정 목록'])
+    for sheet_name, lessons, chapters, download, blank_positions in SYNTHETIC_SHEETS:
+        sheet = workbook.create_sheet(sheet_name)
+        rows = course_rows(sheet_name, lessons, chapters, download)
+        sheet.append(COLUMNS if download != 'none' else COLUMNS[:-1])
+        for position, row in enumerate(rows):
+            if position in blank_positions:
+                row[LESSON_NUMBER_COLUMN] = None
+            sheet.append(row)
+    workbook.save(path)
+
+
+def output_tree(root: Path) -> dict:
+    """출력 폴더 {상대 경로: 내용} (증분 생성용 매니페스트는 파일 수정 시각이 들어 있어 제외)"""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob('*')) if path.is_file() and path.name != MANIFEST_FILENAME
+    }
+
+
+class EngineParityTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = tempfile.TemporaryDirectory()
+        cls.fixture = Path(cls.work_dir.name) / 'parity.xlsx'
+        write_fixture(cls.fixture)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.work_dir.cleanup()
+
+    def parse_and_generate(self, input_file: Path, engine: str) -> tuple:
+        """
+        엔진 하나로 TTL 제외 모든 시트 파싱 + 생성
+
+        Returns:
+            ({시트: Course.to_dict()}, 출력 트리)
+        """
+        output_dir = Path(tempfile.mkdtemp(dir=self.work_dir.name, prefix=f'{engine}-'))
+        courses = {}
+        with contextlib.redirect_stdout(io.StringIO()), WorkbookSession(str(input_file), engine=engine) as workbook:
+            for sheet in workbook.sheet_names:
+                if sheet == 'TTL':
+                    continue
+                course_data = parse_course_file(str(input_file), sheet, workbook=workbook, engine=engine)
+                courses[sheet] = course_data.to_dict()
+                ContentGenerator(course_data, str(output_dir), input_file=str(input_file),
+                                 history_log=False).generate()
+        return courses, output_tree(output_dir)
+
+    def assert_engines_match(self, input_file: Path):
+        expected_courses, expected_tree = self.parse_and_generate(input_file, ENGINES[0])
+        self.assertTrue(expected_tree)
+        for engine in ENGINES[1:]:
+            with self.subTest(input=input_file.name, engine=engine):
+                courses, tree = self.parse_and_generate(input_file, engine)
+                self.assertEqual(courses, expected_courses)
+                self.assertEqual(sorted(tree), sorted(expected_tree))
+                for path, content in expected_tree.items():
+                    self.assertEqual(tree[path], content, f"{engine}: {path}")
+
+    def test_example_workbook(self):
+        self.assert_engines_match(EXAMPLE_FILE)
+
+    def test_synthetic_workbook(self):
+        self.assert_engines_match(self.fixture)
+
+    def test_fixture_covers_edge_cases(self):
+        courses, _ = self.parse_and_generate(self.fixture, 'native')
+        self.assertEqual(sorted(courses), sorted(sheet[0] for sheet in SYNTHETIC_SHEETS))
+
+        # 빈 차시번호 셀은 행 순서로 대체
+        blank = courses['25ctblank']
+        self.assertEqual([lesson['number'] for lesson in blank['lessons']],
+                         [f"{number:02d}" for number in range(1, 16)])
+
+        # 다운로드 컬럼이 없으면 다운로드 링크와 guide가 모두 비어 있음
+        no_download = courses['25ctnodown']
+        self.assertTrue(all(lesson['download_url'] is None for lesson in no_download['lessons']))
+        self.assertTrue(all(chapter['guide'] == "" for chapter in no_download['chapters']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+data.json/subjects.json 골든 테스트
+
+tests/golden/<템플릿>/ 에는 fast 인코더를 넣기 전 코드로 examples/test_25ctvibec.xlsx 를 생성한
+JSON 파일이 출력 경로 그대로 들어 있다. 두 인코더(fast, stdlib) 모두 이 파일과 바이트 단위로 같아야 한다.
+
+실행:
+    python -m pytest tests/test_json_golden.py
+    python -m unittest tests.test_json_golden
+"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from content_generator.generator import ContentGenerator
+from content_generator.json_encoder import JSON_ENCODERS
+from content_generator.parser import parse_course_file
+
+
+TESTS_DIR = Path(__file__).parent
+GOLDEN_DIR = TESTS_DIR / 'golden'
+EXAMPLE_FILE = TESTS_DIR.parent / 'examples' / 'test_25ctvibec.xlsx'
+TEMPLATES = ('ct2022', 'it2023')
+
+
+def golden_files(template: str) -> dict:
+    """골든 파일 {출력 경로: 내용}"""
+    template_dir = GOLDEN_DIR / template
+    return {
+        path.relative_to(template_dir).as_posix(): path.read_bytes()
+        for path in sorted(template_dir.rglob('*.json'))
+    }
+
+
+class JsonGoldenTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.course_data = parse_course_file(str(EXAMPLE_FILE))
+
+    def planned_json_files(self, template: str, encoder: str) -> dict:
+        """생성 계획의 JSON 파일 {출력 경로: 내용} (디스크에 쓰지 않음)"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            generator = ContentGenerator(self.course_data, output_dir, template=template,
+                                         json_encoder=encoder, history_log=False)
+            plan = generator.plan()
+        return {planned.path: planned.content for planned in plan.files if planned.path.endswith('.json')}
+
+    def test_golden_files_exist(self):
+        for template in TEMPLATES:
+            files = golden_files(template)
+            self.assertIn('25ctvibec/subjects.json', files)
+            self.assertEqual(sum(1 for path in files if path.endswith('/data.json')), 5)
+
+    def test_encoders_match_golden_bytes(self):
+        for template in TEMPLATES:
+            expected = golden_files(template)
+            for encoder in JSON_ENCODERS:
+                with self.subTest(template=template, encoder=encoder):
+                    actual = self.planned_json_files(template, encoder)
+                    self.assertEqual(sorted(actual), sorted(expected))
+                    for path, content in expected.items():
+                        self.assertEqual(actual[path], content, f"{template} {encoder}: {path}")
+
+
+if __name__ == '__main__':
+    unittest.main()
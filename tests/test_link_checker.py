@@ -0,0 +1,197 @@
+"""
+링크 검사(--check-links) 테스트
+
+127.0.0.1의 빈 포트에 스텁 HTTP 서버(http.server)를 띄우고 LinkChecker로 검사한다.
+
+실행:
+    python -m pytest tests/test_link_checker.py
+    python -m unittest tests.test_link_checker
+"""
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from content_generator.link_checker import LinkCache, LinkChecker, MAX_REDIRECTS
+
+
+SLOW_SECONDS = 2.0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    스텁 서버 경로:
+        /ok              200
+        /redirect/N      N번 리다이렉트 후 /ok
+        /head-not-allowed  HEAD는 405, GET은 206
+        /missing         404
+        /slow            SLOW_SECONDS 뒤 200
+    """
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def _respond(self, send_body: bool):
+        self.server.methods.append((self.command, self.path))
+        path = self.path
+        if path.startswith('/redirect/'):
+            remaining = int(path.rsplit('/', 1)[1])
+            self._send(302, location='/ok' if remaining <= 1 else f'/redirect/{remaining - 1}')
+        elif path == '/head-not-allowed':
+            self._send(405 if self.command == 'HEAD' else 206, body=b'x', send_body=send_body)
+        elif path == '/missing':
+            self._send(404, send_body=send_body)
+        elif path == '/slow':
+            time.sleep(SLOW_SECONDS)
+            self._send(200, send_body=send_body)
+        else:
+            self._send(200, send_body=send_body)
+
+    def _send(self, status: int, location: str = None, body: bytes = b'', send_body: bool = False):
+        self.send_response(status)
+        if location:
+            self.send_header('Location', location)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LinkCheckerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        cls.server.daemon_threads = True
+        cls.server.methods = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+
+    def setUp(self):
+        self.server.methods.clear()
+
+    def check(self, path: str, **options) -> dict:
+        return LinkChecker(**options).check([self.base + path])[self.base + path]
+
+    def test_ok(self):
+        result = self.check('/ok')
+        self.assertEqual(result, {"ok": True, "status": 200, "error": None, "cached": False})
+
+    def test_redirect_chain(self):
+        result = self.check(f'/redirect/{MAX_REDIRECTS}')
+        self.assertTrue(result['ok'], result)
+        self.assertEqual(result['status'], 200)
+
+    def test_redirect_limit(self):
+        result = self.check(f'/redirect/{MAX_REDIRECTS + 1}')
+        self.assertFalse(result['ok'])
+        self.assertIsNone(result['status'])
+        self.assertIn('리다이렉트', result['error'])
+
+    def test_head_not_allowed_falls_back_to_get(self):
+        result = self.check('/head-not-allowed')
+        self.assertTrue(result['ok'], result)
+        self.assertEqual(result['status'], 206)
+        self.assertEqual(self.server.methods, [('HEAD', '/head-not-allowed'), ('GET', '/head-not-allowed')])
+
+    def test_not_found_is_broken(self):
+        result = self.check('/missing')
+        self.assertEqual(result, {"ok": False, "status": 404, "error": "HTTP 404", "cached": False})
+
+    def test_timeout(self):
+        started = time.perf_counter()
+        result = self.check('/slow', timeout=0.3)
+        self.assertFalse(result['ok'])
+        self.assertIn('시간 초과', result['error'])
+        self.assertLess(time.perf_counter() - started, SLOW_SECONDS)
+
+    def test_keep_alive_reuses_connections(self):
+        checker = LinkChecker(concurrency=2)
+        urls = [f"{self.base}/ok?lesson={number}" for number in range(10)]
+        results = checker.check(urls)
+
+        self.assertTrue(all(result['ok'] for result in results.values()))
+        self.assertEqual(checker.requests, 10)
+        self.assertLessEqual(checker.connections, 2)
+        self.assertLess(checker.connections, checker.requests)
+
+    def test_cached_urls_are_not_requested(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_file = Path(cache_dir) / 'link_cache.json'
+            LinkChecker(cache=LinkCache(cache_file=cache_file)).check([self.base + '/ok', self.base + '/missing'])
+
+            checker = LinkChecker(cache=LinkCache(cache_file=cache_file))
+            results = checker.check([self.base + '/ok', self.base + '/missing'])
+
+        self.assertTrue(results[self.base + '/ok']['cached'])
+        self.assertFalse(results[self.base + '/missing']['cached'])  # 깨진 링크는 저장하지 않음
+        self.assertEqual(checker.requests, 1)
+
+
+class LinkCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_file = Path(self.cache_dir.name) / 'link_cache.json'
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_ttl_expiry(self):
+        now = time.time()
+        self.cache_file.write_text(json.dumps({
+            "https://cdn.example/fresh.mp4": {"status": 200, "checked_at": now - 1800},
+            "https://cdn.example/expired.mp4": {"status": 200, "checked_at": now - 7200},
+        }))
+        cache = LinkCache(ttl_hours=1, cache_file=self.cache_file)
+
+        self.assertEqual(cache.get("https://cdn.example/fresh.mp4")['status'], 200)
+        self.assertIsNone(cache.get("https://cdn.example/expired.mp4"))
+
+        cache.entries["https://cdn.example/fresh.mp4"]['checked_at'] = now - 3601
+        self.assertIsNone(cache.get("https://cdn.example/fresh.mp4"))
+
+    def test_save_merges_entries_from_other_runs(self):
+        first = LinkCache(cache_file=self.cache_file)
+        second = LinkCache(cache_file=self.cache_file)
+        first.put("https://cdn.example/a.mp4", 200)
+        second.put("https://cdn.example/b.mp4", 200)
+        first.save()
+        second.save()
+
+        entries = json.loads(self.cache_file.read_text())
+        self.assertEqual(sorted(entries), ["https://cdn.example/a.mp4", "https://cdn.example/b.mp4"])
+        self.assertEqual(sorted(LinkCache(cache_file=self.cache_file).entries), sorted(entries))
+
+    def test_save_keeps_newer_entry(self):
+        first = LinkCache(cache_file=self.cache_file)
+        second = LinkCache(cache_file=self.cache_file)
+        second.put("https://cdn.example/a.mp4", 301)
+        first.put("https://cdn.example/a.mp4", 200)
+        first.save()
+        second.save()  # 먼저 확인한 결과로 덮어쓰지 않음
+
+        entries = json.loads(self.cache_file.read_text())
+        self.assertEqual(entries["https://cdn.example/a.mp4"]['status'], 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
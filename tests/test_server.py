@@ -0,0 +1,159 @@
+"""
+생성 서버(--serve) 테스트
+
+127.0.0.1의 빈 포트에 GenerationServer를 띄우고 HTTP로 요청한다.
+생성 이력은 임시 폴더의 데이터베이스에 기록한다 (CONTENT_GENERATOR_HISTORY_DB).
+
+실행:
+    python -m pytest tests/test_server.py
+    python -m unittest tests.test_server
+"""
+
+import contextlib
+import http.client
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from urllib.parse import urlparse
+
+from content_generator.history import HISTORY_DB_ENV, HistoryStore
+from content_generator.server import GenerationServer, MAX_REQUEST_BYTES
+
+
+EXAMPLE_FILE = Path(__file__).parent.parent / 'examples' / 'test_25ctvibec.xlsx'
+
+
+class GenerationServerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = tempfile.TemporaryDirectory()
+        cls.history_db = Path(cls.work_dir.name) / 'history.db'
+        cls.previous_history_db = os.environ.get(HISTORY_DB_ENV)
+        os.environ[HISTORY_DB_ENV] = str(cls.history_db)
+
+        cls.server = GenerationServer(workers=1, defaults={"no_cache": True}, max_pending=0)
+        cls.log = io.StringIO()
+        cls.thread = threading.Thread(target=cls._serve, daemon=True)
+        cls.thread.start()
+        while cls.server.url is None:
+            time.sleep(0.01)
+        url = urlparse(cls.server.url)
+        cls.host, cls.port = url.hostname, url.port
+
+    @classmethod
+    def _serve(cls):
+        with contextlib.redirect_stdout(cls.log):
+            cls.server.serve('127.0.0.1:0')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.thread.join()
+        if cls.previous_history_db is None:
+            os.environ.pop(HISTORY_DB_ENV, None)
+        else:
+            os.environ[HISTORY_DB_ENV] = cls.previous_history_db
+        cls.work_dir.cleanup()
+
+    def request(self, method: str, path: str, body: bytes = b'', headers: dict = None):
+        """요청 → (상태 코드, 응답 JSON)"""
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        try:
+            connection.request(method, path, body=body or None,
+                               headers={'Content-Type': 'application/json', **(headers or {})})
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    def post_job(self, payload: dict, headers: dict = None):
+        return self.request('POST', '/jobs', json.dumps(payload).encode('utf-8'), headers)
+
+    def test_health(self):
+        status, data = self.request('GET', '/health')
+        self.assertEqual(status, 200)
+        self.assertEqual(data, {"status": "ok", "workers": 1, "running": 0})
+
+    def test_job(self):
+        output_dir = Path(self.work_dir.name) / 'output'
+        status, data = self.post_job({"input": str(EXAMPLE_FILE), "output": str(output_dir)})
+
+        self.assertEqual(status, 200, data)
+        self.assertEqual((data['success_count'], data['fail_count']), (1, 0))
+        self.assertEqual(data['courses'][0]['course_code'], '25ctvibec')
+        self.assertTrue((output_dir / '25ctvibec' / 'subjects.json').is_file())
+
+        # 작업 하나 = 이력 실행 하나
+        with HistoryStore(self.history_db) as store:
+            courses = store.courses(course_code='25ctvibec')
+        self.assertEqual(len(courses), 1)
+
+    def test_dry_run_job_is_planned(self):
+        output_dir = Path(self.work_dir.name) / 'dry-run'
+        status, data = self.post_job({"input": str(EXAMPLE_FILE), "output": str(output_dir), "dry_run": True})
+
+        self.assertEqual(status, 200, data)
+        self.assertEqual(data['courses'][0]['status'], 'planned')
+        self.assertEqual((data['success_count'], data['fail_count']), (0, 0))
+        self.assertFalse(output_dir.exists())
+
+    def test_bad_request(self):
+        for payload, message in (
+            ({}, "input"),
+            ({"input": str(EXAMPLE_FILE), "template": "ct2O22"}, "템플릿"),
+            ({"workbook": "", "filename": "course.xls"}, "파일 형식"),
+        ):
+            with self.subTest(payload=payload):
+                status, data = self.post_job(payload)
+                self.assertEqual(status, 400)
+                self.assertIn(message, data['error'])
+
+        status, _ = self.request('POST', '/jobs', b'[1, 2]')
+        self.assertEqual(status, 400)
+        status, _ = self.request('POST', '/jobs', b'{not json')
+        self.assertEqual(status, 400)
+
+    def test_requires_json_content_type(self):
+        status, _ = self.post_job({"input": str(EXAMPLE_FILE)}, headers={'Content-Type': 'text/plain'})
+        self.assertEqual(status, 415)
+
+    def test_rejects_foreign_host(self):
+        for host in ('evil.example', f'evil.example:{self.port}', f'127.0.0.1:{self.port + 1}'):
+            with self.subTest(host=host):
+                status, _ = self.post_job({"input": str(EXAMPLE_FILE)}, headers={'Host': host})
+                self.assertEqual(status, 403)
+
+        status, _ = self.request('GET', '/health', headers={'Host': f'localhost:{self.port}'})
+        self.assertEqual(status, 200)
+
+    def test_full_queue(self):
+        # 워커 1개 + 대기 0개: 작업 하나가 자리를 차지하고 있으면 다음 요청은 503
+        self.server._slots.acquire()
+        try:
+            status, data = self.post_job({"input": str(EXAMPLE_FILE)})
+        finally:
+            self.server._slots.release()
+        self.assertEqual(status, 503)
+        self.assertIn('대기', data['error'])
+
+    def test_oversized_body(self):
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        try:
+            connection.putrequest('POST', '/jobs')
+            connection.putheader('Content-Type', 'application/json')
+            connection.putheader('Content-Length', str(MAX_REQUEST_BYTES + 1))
+            connection.endheaders()
+            response = connection.getresponse()
+            self.assertEqual(response.status, 413)
+        finally:
+            connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()